@@ -0,0 +1,285 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from CorpusChunking import STRATEGIES, chunk_batch, doc_ids, init_worker, is_path
+
+# ------------------------------
+# 🔹 Asyncio ingestion pipeline
+# ------------------------------
+#   sources -> [read] -> read queue -> [chunk] -> chunk queue -> [sink]
+#
+# Files are read on a small thread pool, chunking runs on a process (or
+# thread) pool, and the sink is awaited in the event loop (blocking sink
+# I/O runs in a thread, so it never stalls the other stages). The queues
+# between the stages are bounded: a slow sink stalls chunking, slow
+# chunking stalls reading, so memory stays flat. Several chunk calls are
+# kept in flight so every core has work while reads and writes wait.
+#
+#   sink = CollectSink()
+#   report = {}
+#   asyncio.run(run_pipeline(paths, sink, "sentence", report=report))
+
+
+class AsyncSink:
+    """Base sink: override write() (and close() if there is something to flush)."""
+
+    async def write(self, doc_id, chunks):
+        raise NotImplementedError
+
+    async def close(self):
+        pass
+
+
+class CollectSink(AsyncSink):
+    """Keeps every (doc_id, chunks) in memory, in completion order."""
+
+    def __init__(self):
+        self.results = []
+
+    async def write(self, doc_id, chunks):
+        self.results.append((doc_id, chunks))
+
+
+class CallbackSink(AsyncSink):
+    """
+    Calls fn(doc_id, chunks); fn may be a plain function (run in a thread,
+    one call at a time) or a coroutine function.
+    """
+
+    def __init__(self, fn):
+        self.fn = fn
+
+    async def write(self, doc_id, chunks):
+        if asyncio.iscoroutinefunction(self.fn):
+            await self.fn(doc_id, chunks)
+            return
+        result = await asyncio.to_thread(self.fn, doc_id, chunks)
+        if asyncio.iscoroutine(result):
+            await result
+
+
+class WriterSink(AsyncSink):
+    """
+    Streams to a ChunkExport writer (JsonlWriter / ArrowWriter); closes it
+    at the end. The writer's blocking writes run in a thread, in order.
+    """
+
+    def __init__(self, writer):
+        self.writer = writer
+
+    async def write(self, doc_id, chunks):
+        await asyncio.to_thread(self.writer.write, doc_id, chunks)
+
+    async def close(self):
+        await asyncio.to_thread(self.writer.close)
+
+
+class StageStats:
+    """Items, busy time, per-item latency and queue depth of one stage."""
+
+    def __init__(self, name):
+        self.name = name
+        self.items = 0
+        self.busy_seconds = 0.0
+        self.max_seconds = 0.0
+        self.wait_seconds = 0.0         # time items spent in the stage's input queue
+        self.depth_sum = 0
+        self.depth_max = 0
+        self.depth_samples = 0
+
+    def queued(self, depth):
+        self.depth_sum += depth
+        self.depth_max = max(self.depth_max, depth)
+        self.depth_samples += 1
+
+    def done(self, items, seconds, waited):
+        self.items += items
+        self.busy_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.wait_seconds += waited
+
+    def summary(self):
+        return {
+            "items": self.items,
+            "busy_seconds": self.busy_seconds,
+            "avg_latency_ms": 1000 * self.busy_seconds / max(self.items, 1),
+            "max_latency_ms": 1000 * self.max_seconds,
+            "avg_queue_wait_ms": 1000 * self.wait_seconds / max(self.items, 1),
+            "avg_queue_depth": self.depth_sum / max(self.depth_samples, 1),
+            "max_queue_depth": self.depth_max,
+        }
+
+
+_DONE = object()
+
+
+def _read_file(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+async def _iter_sources(sources):
+    if hasattr(sources, "__aiter__"):
+        i = 0
+        async for doc in sources:
+            if isinstance(doc, tuple):
+                yield doc
+            else:
+                yield (os.fspath(doc) if is_path(doc) else i), doc
+            i += 1
+    else:
+        for item in doc_ids(sources):
+            yield item
+
+
+async def run_pipeline(sources, sink, strategy="paragraph", params=None, executor="process",
+                       workers=None, readers=8, queue_size=64, batch_chars=1 << 20,
+                       max_batch_docs=64, compact=False, report=None, progress=None,
+                       progress_interval=1.0):
+    """
+    Read, chunk and sink documents concurrently.
+
+    sources: file paths (pathlib.Path), texts (str) or (doc_id,
+             path_or_text) tuples; a plain or an async iterable.
+    sink: an AsyncSink (anything with async write(doc_id, chunks) and close()).
+    executor: "process", "thread", or an Executor to run chunking on.
+    readers: files read at the same time; queue_size: bound of each queue.
+    Documents are handed to the executor in batches of up to batch_chars
+    characters / max_batch_docs documents. If `report` is a dict it gets
+    per-stage stats at the end; progress(snapshot) is called every
+    progress_interval seconds while running.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"⚠️ Unknown strategy: {strategy} (use one of {STRATEGIES})")
+    params = dict(params or {})
+    workers = workers or os.cpu_count() or 1
+    loop = asyncio.get_running_loop()
+    own_pool = isinstance(executor, str)
+    if executor == "process":
+        pool = ProcessPoolExecutor(workers, initializer=init_worker, initargs=(strategy, params))
+    elif executor == "thread":
+        pool = ThreadPoolExecutor(workers)
+        init_worker(strategy, params)
+    else:
+        pool = executor
+    io_pool = ThreadPoolExecutor(readers)
+
+    source_q = asyncio.Queue(queue_size)
+    read_q = asyncio.Queue(queue_size)
+    chunk_q = asyncio.Queue(queue_size)
+    stats = {name: StageStats(name) for name in ("read", "chunk", "sink")}
+    start = time.perf_counter()
+
+    async def put(queue, stage, item):
+        await queue.put((time.perf_counter(), item))
+        stats[stage].queued(queue.qsize())
+
+    async def feed():
+        async for item in _iter_sources(sources):
+            await put(source_q, "read", item)
+        for _ in range(readers):
+            await source_q.put((0.0, _DONE))
+
+    async def read():
+        while True:
+            queued_at, item = await source_q.get()
+            if item is _DONE:
+                return
+            t = time.perf_counter()
+            doc_id, doc = item
+            text = await loop.run_in_executor(io_pool, _read_file, doc) if is_path(doc) else doc
+            stats["read"].done(1, time.perf_counter() - t, t - queued_at)
+            await put(read_q, "chunk", (doc_id, text))
+
+    async def chunk():
+        while True:
+            queued_at, item = await read_q.get()
+            if item is _DONE:
+                return
+            # take whatever else is already waiting, up to one batch
+            batch, size, waited = [item], len(item[1]), time.perf_counter() - queued_at
+            while size < batch_chars and len(batch) < max_batch_docs and not read_q.empty():
+                queued_at, item = read_q.get_nowait()
+                if item is _DONE:
+                    read_q.put_nowait((0.0, _DONE))     # leave it for the next chunk task
+                    break
+                batch.append(item)
+                size += len(item[1])
+                waited += time.perf_counter() - queued_at
+            t = time.perf_counter()
+            _, results, _, _, _ = await loop.run_in_executor(
+                pool, chunk_batch, batch, strategy, params, compact)
+            stats["chunk"].done(len(batch), time.perf_counter() - t, waited)
+            for result in results:
+                await put(chunk_q, "sink", result)
+
+    async def write():
+        while True:
+            queued_at, item = await chunk_q.get()
+            if item is _DONE:
+                return
+            t = time.perf_counter()
+            await sink.write(*item)
+            stats["sink"].done(1, time.perf_counter() - t, t - queued_at)
+
+    async def monitor():
+        while True:
+            await asyncio.sleep(progress_interval)
+            progress(_snapshot(stats, (source_q, read_q, chunk_q), start))
+
+    async def read_stage():
+        await asyncio.gather(*(read() for _ in range(readers)))
+        for _ in range(n_chunkers):
+            await read_q.put((0.0, _DONE))
+
+    async def chunk_stage():
+        await asyncio.gather(*(chunk() for _ in range(n_chunkers)))
+        await chunk_q.put((0.0, _DONE))
+
+    # two calls per worker in flight: one running, one ready to start
+    n_chunkers = 2 * workers
+    tasks = [asyncio.ensure_future(c) for c in (feed(), read_stage(), chunk_stage(), write())]
+    watcher = asyncio.ensure_future(monitor()) if progress else None
+    try:
+        await asyncio.gather(*tasks)
+        await sink.close()
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    finally:
+        if watcher:
+            watcher.cancel()
+        io_pool.shutdown(wait=False)
+        if own_pool:
+            pool.shutdown(wait=True)
+
+    if report is not None:
+        report.update(_snapshot(stats, (source_q, read_q, chunk_q), start))
+
+
+def _snapshot(stats, queues, start):
+    return {
+        "elapsed_seconds": time.perf_counter() - start,
+        "queue_depth": {stage: queue.qsize() for stage, queue in zip(("read", "chunk", "sink"), queues)},
+        "stages": {name: stage.summary() for name, stage in stats.items()},
+    }
+
+
+# ------------------------------
+# 🔹 Example usage:
+# ------------------------------
+if __name__ == "__main__":
+    import sys
+    from pathlib import Path
+    paths = [Path(p) for p in sys.argv[1:]] or [
+        Path(__file__).resolve().parent.parent / "TempFiles" / "InputFile" / "SampleInput_1.txt"]
+    sink, report = CollectSink(), {}
+    asyncio.run(run_pipeline(paths, sink, "paragraph", report=report))
+    for doc_id, chunks in sink.results:
+        print(doc_id, len(chunks), "chunks")
+    for name, stage in report["stages"].items():
+        print(f"{name:6s} {stage['items']} items, {stage['avg_latency_ms']:.2f} ms avg, "
+              f"queue depth avg {stage['avg_queue_depth']:.1f} / max {stage['max_queue_depth']}")
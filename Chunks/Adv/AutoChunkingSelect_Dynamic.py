@@ -1,139 +1,71 @@
+import io
 import os
-import nltk
-import spacy
-import tiktoken
+import StreamingChunking as streaming
+from SpanChunking import SpanChunker
 
-# Download NLTK punkt tokenizer
-nltk.download('punkt', quiet=True)
-
-class TextChunker:
-    def __init__(self, text=None, file_path=None):
+class TextChunker(SpanChunker):
+    def __init__(self, text=None, file_path=None, stream=False, compact=False):
         """
         Initialize TextChunker with either direct text or a file path.
         If file_path is given, it will load the text from the file.
+        With stream=True the file is not loaded; use the iter_* methods,
+        which read it block by block and yield chunks as they are ready.
         """
+        self.file_path = file_path
         if file_path:
             if not os.path.exists(file_path):
                 raise FileNotFoundError(f"❌ File not found: {file_path}")
-            with open(file_path, "r", encoding="utf-8") as f:
-                self.text = f.read()
-        elif text:
-            self.text = text
-        else:
+            text = None
+            if not stream:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    text = f.read()
+        elif not text:
             raise ValueError("⚠️ Provide either 'text' or 'file_path'")
+        super().__init__(text, compact)
 
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            print("Please run: python -m spacy download en_core_web_sm")
-            self.nlp = None
+    # 🔹 Streaming (generator) versions, bounded memory for file inputs
+    def _source(self):
+        return self.file_path if self.text is None else io.StringIO(self.text)
 
-    def _make_metadata(self, chunk, start_idx, end_idx, token_count=None):
-        return {
-            "chunk_text": chunk,
-            "start_index": start_idx,
-            "end_index": end_idx,
-            "token_count": token_count
-        }
+    def iter_word_chunking(self, chunk_size=5):
+        return streaming.iter_word_chunking(self._source(), chunk_size)
 
-    # Word-level
-    def word_chunking(self, chunk_size=5):
-        words = self.text.split()
-        chunks, idx = [], 0
-        for i in range(0, len(words), chunk_size):
-            chunk = ' '.join(words[i:i+chunk_size])
-            start_idx = self.text.find(chunk, idx)
-            end_idx = start_idx + len(chunk)
-            idx = end_idx
-            chunks.append(self._make_metadata(chunk, start_idx, end_idx))
-        return chunks
+    def iter_sentence_chunking(self):
+        return streaming.iter_sentence_chunking(self._source())
 
-    # Sentence-level
-    def sentence_chunking(self):
-        sentences = nltk.sent_tokenize(self.text)
-        chunks, idx = [], 0
-        for sent in sentences:
-            start_idx = self.text.find(sent, idx)
-            end_idx = start_idx + len(sent)
-            idx = end_idx
-            chunks.append(self._make_metadata(sent, start_idx, end_idx))
-        return chunks
+    def iter_paragraph_chunking(self):
+        return streaming.iter_paragraph_chunking(self._source())
 
-    # Paragraph-level
-    def paragraph_chunking(self):
-        paragraphs = [p.strip() for p in self.text.split("\n") if p.strip()]
-        chunks, idx = [], 0
-        for para in paragraphs:
-            start_idx = self.text.find(para, idx)
-            end_idx = start_idx + len(para)
-            idx = end_idx
-            chunks.append(self._make_metadata(para, start_idx, end_idx))
-        return chunks
+    def iter_fixed_size_chunking(self, chunk_size=50):
+        return streaming.iter_fixed_size_chunking(self._source(), chunk_size)
 
-    # Fixed-size (characters)
-    def fixed_size_chunking(self, chunk_size=50):
-        return [
-            self._make_metadata(self.text[i:i+chunk_size], i, min(i+chunk_size, len(self.text)))
-            for i in range(0, len(self.text), chunk_size)
-        ]
+    def iter_sliding_window_chunking(self, window_size=50, overlap=10):
+        return streaming.iter_sliding_window_chunking(self._source(), window_size, overlap)
 
-    # Sliding window
-    def sliding_window_chunking(self, window_size=50, overlap=10):
-        chunks = []
-        start = 0
-        while start < len(self.text):
-            end = min(start + window_size, len(self.text))
-            chunk = self.text[start:end]
-            chunks.append(self._make_metadata(chunk, start, end))
-            start += window_size - overlap
-        return chunks
+    def iter_recursive_chunking(self, max_chars=60):
+        return streaming.iter_recursive_chunking(self._source(), max_chars)
 
-    # Semantic chunking
-    def semantic_chunking(self):
-        if not self.nlp:
-            raise ValueError("spaCy model not loaded. Run: python -m spacy download en_core_web_sm")
-        doc = self.nlp(self.text)
-        chunks, idx = [], 0
-        for sent in doc.sents:
-            chunk = sent.text.strip()
-            start_idx = self.text.find(chunk, idx)
-            end_idx = start_idx + len(chunk)
-            idx = end_idx
-            chunks.append(self._make_metadata(chunk, start_idx, end_idx))
-        return chunks
+    def iter_token_chunking(self, chunk_size=50, model="gpt-3.5-turbo"):
+        return streaming.iter_token_chunking(self._source(), chunk_size, model)
 
-    # Recursive chunking
-    def recursive_chunking(self, max_chars=60):
-        paragraphs = self.paragraph_chunking()
-        chunks = []
-        for p in paragraphs:
-            para = p["chunk_text"]
-            if len(para) <= max_chars:
-                chunks.append(p)
-            else:
-                for i in range(0, len(para), max_chars):
-                    chunk = para[i:i+max_chars]
-                    start_idx = self.text.find(chunk)
-                    end_idx = start_idx + len(chunk)
-                    chunks.append(self._make_metadata(chunk, start_idx, end_idx))
-        return chunks
-
-    # Token-based
-    def token_chunking(self, chunk_size=50, model="gpt-3.5-turbo"):
-        enc = tiktoken.encoding_for_model(model)
-        tokens = enc.encode(self.text)
-        chunks, idx = [], 0
-        for i in range(0, len(tokens), chunk_size):
-            chunk_tokens = tokens[i:i+chunk_size]
-            chunk_text = enc.decode(chunk_tokens)
-            start_idx = self.text.find(chunk_text, idx)
-            end_idx = start_idx + len(chunk_text)
-            idx = end_idx
-            chunks.append(self._make_metadata(chunk_text, start_idx, end_idx, len(chunk_tokens)))
-        return chunks
+    # 🔹 Multi-GB files: memory-mapped byte ranges chunked on all cores
+    def iter_mmap_chunking(self, strategy="fixed_size", workers=None, **params):
+        """fixed_size, sliding_window, word or paragraph chunks of file_path (see MmapChunking)."""
+        if not self.file_path:
+            raise ValueError("⚠️ mmap chunking needs a file_path")
+        from MmapChunking import iter_mmap_chunking
+        return iter_mmap_chunking(self.file_path, strategy, params, workers)
 
     # Smart Auto Chunking
-    def auto_chunking(self):
+    def auto_chunking(self, planned=False, **planner_args):
+        """
+        Length thresholds, printing the choice. planned=True instead lets
+        ChunkPlanner pick from a sample of the text (planner_args go to
+        profiled_chunking: target_chars, latency_budget, ...) and prints
+        nothing; call profiled_chunking to also get the plan and its reason.
+        """
+        if planned:
+            return self.profiled_chunking(**planner_args)[0]
         length = len(self.text)
         if length < 500:
             print("Using Sentence-level chunking")
@@ -145,23 +77,23 @@ class TextChunker:
             print("Using Fixed-size chunking")
             return self.fixed_size_chunking(200)
         else:
-            print("Using Token-based chunking")
-            return self.token_chunking(200)
+            print("Using Sentence-packed token chunking")
+            return self.packed_chunking(200)
 
 
 # ------------------------------
 # 🔹 Example usage with dynamic path
 # ------------------------------
-
-# Option 1: Direct text
-sample_text = "Artificial Intelligence is shaping the future."
-chunker1 = TextChunker(text=sample_text)
-
-# Option 2: Load text from file (dynamic path)
-file_path = r"F:\My_Afterwork_Projects\Technology\MyProjects\Python\GenAi\Chunks\TempFiles\InputFile\SampleInput_1.txt"
-chunker2 = TextChunker(file_path=file_path)
-
-# Run auto chunking
-auto_chunks = chunker2.auto_chunking()
-for c in auto_chunks:
-    print(c)
+if __name__ == "__main__":
+    # Option 1: Direct text
+    sample_text = "Artificial Intelligence is shaping the future."
+    chunker1 = TextChunker(text=sample_text)
+
+    # Option 2: Load text from file (dynamic path)
+    file_path = r"F:\My_Afterwork_Projects\Technology\MyProjects\Python\GenAi\Chunks\TempFiles\InputFile\SampleInput_1.txt"
+    chunker2 = TextChunker(file_path=file_path)
+
+    # Run auto chunking
+    auto_chunks = chunker2.auto_chunking()
+    for c in auto_chunks:
+        print(c)
@@ -0,0 +1,223 @@
+import hashlib
+import json
+import os
+import sqlite3
+import struct
+import threading
+import time
+from array import array
+
+from ChunkSet import ChunkSet
+from SpanChunking import SpanChunker
+
+# ------------------------------
+# 🔹 Persistent chunk cache
+# ------------------------------
+# Chunking results are stored on disk in SQLite, keyed on a hash of
+# (document text, strategy, parameters, versions of the libraries and
+# models the strategy uses). Only the offsets and token counts are kept,
+# as packed int arrays; the text is the caller's. A hit costs one blake2b
+# of the text plus one primary-key read.
+#
+# The database runs in WAL mode, so any number of processes (e.g. the
+# chunk_corpus workers) can read and write the same file. Each process
+# and thread gets its own connection. When the stored data grows over
+# max_bytes, the least recently used entries are evicted.
+
+CACHE_VERSION = 3           # bump when a strategy's output changes
+DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".cache", "chunks", "chunk_cache.sqlite")
+
+# Libraries/models whose version is part of the key, per strategy
+_DEPENDENCIES = {
+    "sentence": ("nltk",),
+    "semantic": ("spacy", "en_core_web_sm"),
+    "token": ("tiktoken",),
+    "embedding": ("nltk", "numpy"),
+    "packed": ("nltk", "tiktoken"),
+    "hierarchical": ("tiktoken",),
+}
+_versions = {}
+
+_HEADER = struct.Struct("<QB")          # chunk count, flags
+_WIDE, _COUNTS, _JOIN_WORDS = 1, 2, 4
+_TOUCH_SECONDS = 60                     # last_used is refreshed at most this often
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chunks (
+    key BLOB PRIMARY KEY,
+    strategy TEXT NOT NULL,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS chunks_last_used ON chunks (last_used);
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+INSERT OR IGNORE INTO meta VALUES ('total_bytes', 0);
+"""
+
+
+def _version(package):
+    version = _versions.get(package)
+    if version is None:
+        from importlib import metadata
+        try:
+            version = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            version = "missing"
+        _versions[package] = version
+    return version
+
+
+# Parameters that change how fast a strategy runs, not what it returns
+_SPEED_PARAMS = ("workers",)
+
+
+def cache_key(text, strategy, params=None):
+    """Hash of everything a strategy's output depends on."""
+    h = hashlib.blake2b(digest_size=20)
+    config = {
+        "cache": CACHE_VERSION,
+        "strategy": strategy,
+        "params": {k: v for k, v in (params or {}).items() if k not in _SPEED_PARAMS},
+        "versions": {p: _version(p) for p in _DEPENDENCIES.get(strategy, ())},
+    }
+    h.update(json.dumps(config, sort_keys=True, default=str).encode("utf-8"))
+    h.update(b"\0")
+    h.update(text.encode("utf-8", "surrogatepass"))
+    return h.digest()
+
+
+def pack(chunks):
+    """ChunkSet -> bytes (int32 offsets unless the text is over 2 GB)."""
+    wide = len(chunks.text) >= 1 << 31
+    flags = (_WIDE if wide else 0) | (_COUNTS if chunks.token_counts is not None else 0) \
+        | (_JOIN_WORDS if chunks.join_words else 0)
+    code = "q" if wide else "i"
+    parts = [_HEADER.pack(len(chunks), flags), array(code, chunks.starts).tobytes(),
+             array(code, chunks.ends).tobytes()]
+    if chunks.token_counts is not None:
+        parts.append(array(code, chunks.token_counts).tobytes())
+    return b"".join(parts)
+
+
+def unpack(data, text):
+    """bytes from pack() + the original text -> ChunkSet."""
+    n, flags = _HEADER.unpack_from(data)
+    code = "q" if flags & _WIDE else "i"
+    width = array(code).itemsize * n
+    offset = _HEADER.size
+
+    def column():
+        nonlocal offset
+        values = array(code)
+        values.frombytes(data[offset:offset + width])
+        offset += width
+        return values if code == "q" else array("q", values)
+
+    starts, ends = column(), column()
+    counts = column() if flags & _COUNTS else None
+    return ChunkSet(text, starts, ends, counts, join_words=bool(flags & _JOIN_WORDS))
+
+
+class ChunkCache:
+    """
+    Disk cache of chunking results.
+        cache = ChunkCache()
+        chunks = cache.chunk(text, "sentence")        # computed once, then read
+    """
+
+    def __init__(self, path=DEFAULT_PATH, max_bytes=1 << 30):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._local = threading.local()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._connect() as db:
+            db.executescript(_SCHEMA)
+
+    def _connect(self):
+        db = getattr(self._local, "db", None)
+        if db is None or self._local.pid != os.getpid():
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db, self._local.pid = db, os.getpid()
+        return db
+
+    def get(self, key, text):
+        """Cached ChunkSet for `key`, or None."""
+        db = self._connect()
+        row = db.execute("SELECT data, last_used FROM chunks WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        now = time.time()
+        if now - row[1] > _TOUCH_SECONDS:
+            db.execute("UPDATE chunks SET last_used = ? WHERE key = ?", (now, key))
+        return unpack(row[0], text)
+
+    def put(self, key, strategy, chunks):
+        data = pack(chunks)
+        db = self._connect()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            old = db.execute("SELECT size FROM chunks WHERE key = ?", (key,)).fetchone()
+            db.execute("INSERT OR REPLACE INTO chunks VALUES (?, ?, ?, ?, ?)",
+                       (key, strategy, data, len(data), time.time()))
+            db.execute("UPDATE meta SET value = value + ? WHERE name = 'total_bytes'",
+                       (len(data) - (old[0] if old else 0),))
+            self._evict(db)
+            db.execute("COMMIT")
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+
+    def _evict(self, db):
+        total = db.execute("SELECT value FROM meta WHERE name = 'total_bytes'").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Drop the oldest entries until 90% of max_bytes is left
+        target = total - int(self.max_bytes * 0.9)
+        freed = 0
+        for key, size in db.execute("SELECT key, size FROM chunks ORDER BY last_used").fetchall():
+            if freed >= target:
+                break
+            db.execute("DELETE FROM chunks WHERE key = ?", (key,))
+            freed += size
+        db.execute("UPDATE meta SET value = value - ? WHERE name = 'total_bytes'", (freed,))
+
+    def chunk(self, text, strategy="paragraph", params=None, compact=False):
+        """
+        Chunks of `text` with a SpanChunker strategy, from the cache when
+        possible. Returns a ChunkSet if compact=True, else the metadata dicts.
+        """
+        params = dict(params or {})
+        key = cache_key(text, strategy, params)
+        chunks = self.get(key, text)
+        if chunks is None:
+            chunks = getattr(SpanChunker(text, compact=True), f"{strategy}_chunking")(**params)
+            self.put(key, strategy, chunks)
+        return chunks if compact else chunks.to_dicts()
+
+    def stats(self):
+        db = self._connect()
+        entries, = db.execute("SELECT COUNT(*) FROM chunks").fetchone()
+        total, = db.execute("SELECT value FROM meta WHERE name = 'total_bytes'").fetchone()
+        return {"entries": entries, "bytes": total, "max_bytes": self.max_bytes,
+                "hits": self.hits, "misses": self.misses}
+
+    def clear(self):
+        db = self._connect()
+        db.execute("BEGIN IMMEDIATE")
+        db.execute("DELETE FROM chunks")
+        db.execute("UPDATE meta SET value = 0 WHERE name = 'total_bytes'")
+        db.execute("COMMIT")
+
+    def close(self):
+        db = getattr(self._local, "db", None)
+        if db is not None:
+            db.close()
+            self._local.db = None
@@ -0,0 +1,239 @@
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+# ------------------------------
+# 🔹 Near-duplicate chunk detection (MinHash + LSH)
+# ------------------------------
+# Every chunk gets a MinHash signature of its (lower-cased, whitespace
+# collapsed) byte k-grams, computed for whole batches at once with numpy
+# (one permutation hashing with densification, see _signatures).
+# Signatures and LSH band hashes are appended to files in a work
+# directory, so memory stays bounded by the batch size however many
+# chunks are added. finish() sorts each band's hashes, checks the
+# estimated Jaccard similarity of the colliding chunks against
+# `threshold` and links them; every chunk is mapped to the first chunk
+# of its group (its canonical chunk).
+#
+#   dedup = MinHashDeduper()
+#   for chunks in ...:                  # any strategy's output
+#       dedup.add(chunks)
+#   canonical = dedup.finish()          # canonical[i] == i -> keep chunk i
+
+_MAX32 = np.uint64(0xFFFFFFFF)
+_EMPTY = 0xFFFFFFFF             # bin without any k-gram
+_GRAM_BASE = np.uint64(0x100000001B3)
+_ROTATION = np.uint32(0x9E3779B1)
+_BATCH_TEXTS = 1 << 16          # texts hashed at once
+_VERIFY_PAIRS = 1 << 16         # candidate pairs compared at once
+
+
+def chunk_texts(chunks):
+    """Texts of a ChunkSet, a list of metadata dicts or a list of strings."""
+    if hasattr(chunks, "texts"):
+        return chunks.texts()
+    return [c if isinstance(c, str) else c["chunk_text"] for c in chunks]
+
+
+def _normalize(text, shingle):
+    data = " ".join(text.lower().split()).encode("utf-8")
+    # Short chunks are padded so they still get one k-gram
+    return data.ljust(shingle, b"\0")
+
+
+class MinHashDeduper:
+    """
+    num_perm: signature length; bands * rows must equal num_perm.
+    threshold: minimum estimated Jaccard similarity of two duplicates.
+    With bands=16 (8 rows) pairs above ~0.7 similarity become candidates.
+    """
+
+    def __init__(self, num_perm=128, bands=16, shingle=5, threshold=0.8, workdir=None, seed=1):
+        if num_perm % bands:
+            raise ValueError("⚠️ num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle = shingle
+        self.threshold = threshold
+        self.count = 0
+        rng = np.random.default_rng(seed)
+        self._mix = rng.integers(1, 1 << 63, dtype=np.uint64) | np.uint64(1)
+        self._band_mix = rng.integers(1, 1 << 63, self.rows, dtype=np.uint64) | np.uint64(1)
+        self._own_dir = workdir is None
+        self.workdir = workdir or tempfile.mkdtemp(prefix="minhash-")
+        os.makedirs(self.workdir, exist_ok=True)
+        self._sig_path = os.path.join(self.workdir, "signatures.u32")
+        self._band_paths = [os.path.join(self.workdir, f"band{j}.u64") for j in range(bands)]
+        for path in [self._sig_path] + self._band_paths:
+            open(path, "wb").close()
+
+    # 🔹 Signatures
+    def _gram_hashes(self, texts):
+        """32-bit hash of every k-gram, plus the index of the chunk it belongs to."""
+        data = [_normalize(t, self.shingle) for t in texts]
+        lengths = np.fromiter((len(d) for d in data), dtype=np.int64, count=len(data))
+        buf = np.frombuffer(b"".join(data), dtype=np.uint8).astype(np.uint64)
+        k = self.shingle
+        n_grams = len(buf) - k + 1
+        h = np.zeros(n_grams, dtype=np.uint64)
+        for j in range(k):
+            h = h * _GRAM_BASE + buf[j:j + n_grams]
+        owner = np.repeat(np.arange(len(data)), lengths)
+        valid = owner[:n_grams] == owner[k - 1:]          # k-gram inside one chunk
+        grams = ((h[valid] * self._mix) >> np.uint64(32)) & _MAX32
+        return grams, owner[:n_grams][valid]
+
+    def signatures(self, texts):
+        """MinHash signatures (len(texts) x num_perm, uint32) of a batch of texts."""
+        sig = np.empty((len(texts), self.num_perm), dtype=np.uint32)
+        for lo in range(0, len(texts), _BATCH_TEXTS):
+            sig[lo:lo + _BATCH_TEXTS] = self._signatures(texts[lo:lo + _BATCH_TEXTS])
+        return sig
+
+    def _signatures(self, texts):
+        # One permutation hashing: every k-gram hash falls into one of
+        # num_perm bins and each bin keeps its minimum, so a k-gram costs
+        # O(1) instead of O(num_perm). The minima come from one sort of
+        # (chunk, bin, hash) packed into a uint64.
+        n, p = len(texts), self.num_perm
+        sig = np.full((n, p), _EMPTY, dtype=np.uint32)
+        if not n:
+            return sig
+        grams, owner = self._gram_hashes(texts)
+        bins = (grams * np.uint64(p)) >> np.uint64(32)
+        cells = owner.astype(np.uint64) * np.uint64(p) + bins
+        packed = np.sort((cells << np.uint64(32)) | grams)
+        cells = packed >> np.uint64(32)
+        first = np.r_[True, cells[1:] != cells[:-1]]
+        sig.reshape(-1)[cells[first].astype(np.int64)] = (packed[first] & _MAX32).astype(np.uint32)
+        return _densify(sig)
+
+    def _band_hashes(self, sig):
+        bands = sig.reshape(len(sig), self.bands, self.rows).astype(np.uint64)
+        return (bands * self._band_mix).sum(axis=2, dtype=np.uint64)
+
+    def add(self, chunks):
+        """Add a batch of chunks (ChunkSet, dicts or strings); returns their indices."""
+        texts = chunk_texts(chunks)
+        sig = self.signatures(texts)
+        with open(self._sig_path, "ab") as f:
+            f.write(sig.tobytes())
+        band_hashes = self._band_hashes(sig)
+        for j, path in enumerate(self._band_paths):
+            with open(path, "ab") as f:
+                f.write(np.ascontiguousarray(band_hashes[:, j]).tobytes())
+        first = self.count
+        self.count += len(texts)
+        return range(first, self.count)
+
+    # 🔹 Grouping
+    def finish(self):
+        """canonical[i]: index of the first chunk of chunk i's duplicate group."""
+        n = self.count
+        parent = np.arange(n)
+        if n < 2:
+            return parent
+        sig = np.memmap(self._sig_path, dtype=np.uint32, mode="r", shape=(n, self.num_perm))
+        for path in self._band_paths:
+            keys = np.fromfile(path, dtype=np.uint64)
+            order = np.argsort(keys, kind="stable")
+            sorted_keys = keys[order]
+            run_start = np.r_[True, sorted_keys[1:] != sorted_keys[:-1]]
+            # Pair every chunk of a bucket with the bucket's first chunk only,
+            # so a bucket of m exact copies costs m comparisons, not m*m.
+            head_pos = np.maximum.accumulate(np.where(run_start, np.arange(n), 0))
+            members = np.flatnonzero(~run_start)
+            if not len(members):
+                continue
+            heads, others = order[head_pos[members]], order[members]
+            roots = _roots(parent)
+            keep = roots[heads] != roots[others]
+            heads, others = heads[keep], others[keep]
+            for lo in range(0, len(heads), _VERIFY_PAIRS):
+                h, o = heads[lo:lo + _VERIFY_PAIRS], others[lo:lo + _VERIFY_PAIRS]
+                similar = (sig[h] == sig[o]).mean(axis=1) >= self.threshold
+                for a, b in zip(h[similar].tolist(), o[similar].tolist()):
+                    _union(parent, a, b)
+        return _roots(parent)
+
+    def close(self):
+        if self._own_dir:
+            shutil.rmtree(self.workdir, ignore_errors=True)
+
+
+def _densify(sig):
+    """
+    Fill empty bins from the next non-empty bin to the right (wrapping
+    around), plus a constant per step, so short chunks still get a full
+    signature that estimates Jaccard similarity.
+    """
+    empty = sig == _EMPTY
+    if not empty.any():
+        return sig
+    p = sig.shape[1]
+    cols = np.arange(p)
+    pos = np.where(empty, 2 * p, cols)
+    both = np.concatenate([pos, np.where(empty, 2 * p, cols + p)], axis=1)
+    nearest = np.minimum.accumulate(both[:, ::-1], axis=1)[:, ::-1][:, :p]
+    src = np.minimum(nearest, 2 * p - 1) % p
+    borrowed = sig[np.arange(len(sig))[:, None], src] + (nearest - cols).astype(np.uint32) * _ROTATION
+    return np.where(empty, borrowed, sig)
+
+
+def _find(parent, i):
+    root = i
+    while parent[root] != root:
+        root = parent[root]
+    while parent[i] != root:
+        parent[i], i = root, parent[i]
+    return root
+
+
+def _union(parent, a, b):
+    ra, rb = _find(parent, a), _find(parent, b)
+    if ra != rb:
+        # the smaller index stays the root, so it is the canonical chunk
+        parent[max(ra, rb)] = min(ra, rb)
+
+
+def _roots(parent):
+    roots = parent.copy()
+    while True:
+        up = roots[roots]
+        if np.array_equal(up, roots):
+            return roots
+        roots = up
+
+
+def dedup_chunks(chunks, threshold=0.8, **options):
+    """
+    Near-duplicate removal for one chunk list. Returns (unique chunks,
+    canonical) where canonical[i] is the index of the kept chunk that
+    chunk i duplicates (i itself if it was kept).
+    """
+    dedup = MinHashDeduper(threshold=threshold, **options)
+    try:
+        dedup.add(chunks)
+        canonical = dedup.finish()
+    finally:
+        dedup.close()
+    items = list(chunks)
+    unique = [items[i] for i in np.flatnonzero(canonical == np.arange(len(items)))]
+    return unique, canonical.tolist()
+
+
+# ------------------------------
+# 🔹 Example usage:
+# ------------------------------
+if __name__ == "__main__":
+    chunks = [
+        "This email and any attachments are confidential and intended solely for the addressee.",
+        "Quarterly revenue grew by 12 percent, driven by the new subscription plans.",
+        "This e-mail and any attachments are confidential and intended solely for the addressee.",
+        "this email and any attachments are CONFIDENTIAL and intended solely for the addressee.",
+    ]
+    unique, canonical = dedup_chunks(chunks)
+    print(f"{len(unique)} unique of {len(chunks)} chunks, canonical: {canonical}")
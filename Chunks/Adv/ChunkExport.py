@@ -0,0 +1,203 @@
+import json
+import os
+from json.encoder import encode_basestring_ascii
+
+# ------------------------------
+# 🔹 Streaming chunk export
+# ------------------------------
+# Writers take (doc_id, chunks) one document at a time, where chunks is a
+# ChunkSet or a list of metadata dicts, and write one record per chunk:
+#     doc_id, start_index, end_index, token_count[, chunk_text]
+# Output is buffered up to a fixed size (JSONL) or row count (Arrow /
+# Parquet record batches) and then written, so memory stays bounded.
+# include_text=False writes the offsets only (the text can always be
+# sliced back out of the source document).
+#
+#   with open_writer("chunks.parquet") as out:
+#       for doc_id, chunks in chunk_corpus(paths, "sentence", compact=True):
+#           out.write(doc_id, chunks)
+
+FORMATS = ("jsonl", "arrow", "parquet")
+
+
+def _columns(chunks):
+    """(starts, ends, token counts) of a ChunkSet or a dict list; missing counts are None."""
+    if hasattr(chunks, "starts"):
+        counts = chunks.token_counts
+        if counts is None:
+            counts = [None] * len(chunks)
+        else:
+            counts = [None if c < 0 else c for c in counts]
+        return chunks.starts, chunks.ends, counts
+    return ([c["start_index"] for c in chunks], [c["end_index"] for c in chunks],
+            [c["token_count"] for c in chunks])
+
+
+def _texts(chunks):
+    if hasattr(chunks, "texts"):
+        return chunks.texts()
+    return [c["chunk_text"] for c in chunks]
+
+
+class JsonlWriter:
+    """One JSON object per line; buffered up to buffer_bytes before each write."""
+
+    def __init__(self, target, include_text=True, buffer_bytes=1 << 20):
+        self._own = isinstance(target, (str, os.PathLike))
+        self.stream = open(target, "w", encoding="utf-8") if self._own else target
+        self.include_text = include_text
+        self.buffer_bytes = buffer_bytes
+        self.rows = 0
+        self._buffer = []
+        self._buffered = 0
+
+    def write(self, doc_id, chunks):
+        starts, ends, counts = _columns(chunks)
+        head = '{"doc_id":' + json.dumps(str(doc_id)) + ',"start_index":'
+        if self.include_text:
+            lines = [f'{head}{s},"end_index":{e},"token_count":{"null" if c is None else c},'
+                     f'"chunk_text":{encode_basestring_ascii(t)}}}\n'
+                     for s, e, c, t in zip(starts, ends, counts, _texts(chunks))]
+        else:
+            lines = [f'{head}{s},"end_index":{e},"token_count":{"null" if c is None else c}}}\n'
+                     for s, e, c in zip(starts, ends, counts)]
+        self._buffer.extend(lines)
+        self._buffered += sum(map(len, lines))
+        self.rows += len(lines)
+        if self._buffered >= self.buffer_bytes:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self.stream.write("".join(self._buffer))
+            self._buffer, self._buffered = [], 0
+        self.stream.flush()
+
+    def close(self):
+        self.flush()
+        if self._own:
+            self.stream.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class ArrowWriter:
+    """
+    Arrow IPC file (format="arrow") or Parquet (format="parquet") writer.
+    Rows are collected into record batches of batch_rows rows.
+    Needs pyarrow (pip install pyarrow).
+    """
+
+    def __init__(self, path, format="parquet", include_text=True, batch_rows=1 << 16,
+                 compression="zstd"):
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("❌ pyarrow is required for Arrow/Parquet export. Run: pip install pyarrow")
+        if format not in ("arrow", "parquet"):
+            raise ValueError(f"⚠️ Unknown format: {format} (use 'arrow' or 'parquet')")
+        self._pa = pa
+        self.include_text = include_text
+        self.batch_rows = batch_rows
+        self.rows = 0
+        fields = [
+            pa.field("doc_id", pa.string()),
+            pa.field("start_index", pa.int64()),
+            pa.field("end_index", pa.int64()),
+            pa.field("token_count", pa.int64()),
+        ]
+        if include_text:
+            fields.append(pa.field("chunk_text", pa.large_string()))
+        self.schema = pa.schema(fields)
+        if format == "parquet":
+            import pyarrow.parquet as pq
+            self._writer = pq.ParquetWriter(path, self.schema, compression=compression)
+        else:
+            self._writer = pa.ipc.new_file(path, self.schema)
+        self._pending = []      # pyarrow tables not yet written
+        self._pending_rows = 0
+
+    def write(self, doc_id, chunks):
+        pa = self._pa
+        n = len(chunks)
+        if not n:
+            return
+        if hasattr(chunks, "as_numpy"):
+            # ChunkSet: the offset arrays are handed over without a Python loop
+            starts, ends, counts = chunks.as_numpy()
+            counts = (pa.nulls(n, pa.int64()) if counts is None
+                      else pa.array(counts, pa.int64(), mask=counts < 0))
+        else:
+            starts, ends, counts = _columns(chunks)
+            counts = pa.array(counts, pa.int64())
+        columns = [
+            pa.array([str(doc_id)] * n, pa.string()),
+            pa.array(starts, pa.int64()),
+            pa.array(ends, pa.int64()),
+            counts,
+        ]
+        if self.include_text:
+            columns.append(pa.array(_texts(chunks), pa.large_string()))
+        self._pending.append(pa.Table.from_arrays(columns, schema=self.schema))
+        self._pending_rows += n
+        self.rows += n
+        if self._pending_rows >= self.batch_rows:
+            self.flush()
+
+    def flush(self):
+        if not self._pending:
+            return
+        table = self._pa.concat_tables(self._pending).combine_chunks()
+        for batch in table.to_batches(max_chunksize=self.batch_rows):
+            self._writer.write_batch(batch)
+        self._pending, self._pending_rows = [], 0
+
+    def close(self):
+        self.flush()
+        self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+def open_writer(path, format=None, include_text=True, **options):
+    """Writer for `path`; the format defaults to the file extension (.jsonl, .arrow, .parquet)."""
+    if format is None:
+        ext = os.path.splitext(os.fspath(path))[1].lower().lstrip(".")
+        format = {"json": "jsonl", "ndjson": "jsonl", "feather": "arrow", "ipc": "arrow",
+                  "pq": "parquet"}.get(ext, ext)
+    if format == "jsonl":
+        return JsonlWriter(path, include_text, **options)
+    if format in ("arrow", "parquet"):
+        return ArrowWriter(path, format, include_text, **options)
+    raise ValueError(f"⚠️ Unknown export format: {format} (use one of {FORMATS})")
+
+
+def export(items, path, format=None, include_text=True, **options):
+    """Write every (doc_id, chunks) of `items` to `path`; returns the number of rows written."""
+    with open_writer(path, format, include_text, **options) as writer:
+        for doc_id, chunks in items:
+            writer.write(doc_id, chunks)
+    return writer.rows
+
+
+# ------------------------------
+# 🔹 Example usage:
+# ------------------------------
+if __name__ == "__main__":
+    import sys
+    from pathlib import Path
+    from CorpusChunking import chunk_corpus
+    paths = [Path(p) for p in sys.argv[1:]] or [
+        Path(__file__).resolve().parent.parent / "TempFiles" / "InputFile" / "SampleInput_1.txt"]
+    rows = export(chunk_corpus(paths, "paragraph", compact=True), "chunks.jsonl")
+    print(f"{rows} chunks written to chunks.jsonl")
@@ -0,0 +1,305 @@
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+
+# ------------------------------
+# 🔹 Opt-in chunking metrics
+# ------------------------------
+# Off by default. While off, an instrumented strategy costs one flag check
+# and every phase() block is a shared no-op context manager, so the hooks
+# can stay in the code (and metrics can stay on in production).
+#
+#   import ChunkMetrics
+#   sink = ChunkMetrics.enable(ChunkMetrics.PrometheusSink())
+#   ... chunk ...
+#   print(sink.render())
+#
+# Events sent to the sinks (plain dicts):
+#   {"event": "strategy", "strategy", "seconds", "bytes_in", "chunks",
+#    "chunk_chars": [bucket counts], "chunk_chars_sum",
+#    "token_counts": [bucket counts] or None, "token_counts_sum"}
+#   {"event": "phase", "strategy", "phase", "seconds"}
+#   {"event": "model_load", "model", "seconds"}
+
+CHAR_BUCKETS = (16, 32, 64, 128, 256, 512, 1024, 2048, 4096, 8192, float("inf"))
+TOKEN_BUCKETS = (8, 16, 32, 64, 128, 256, 512, 1024, 2048, float("inf"))
+
+enabled = False
+_sinks = []
+_local = threading.local()
+
+
+def enable(*sinks):
+    """Start sending events to `sinks` (default: a new MemorySink). Returns the first sink."""
+    global enabled
+    _sinks[:] = sinks or (MemorySink(),)
+    enabled = True
+    return _sinks[0]
+
+
+def disable():
+    global enabled
+    enabled = False
+    _sinks.clear()
+
+
+def emit(event):
+    for sink in _sinks:
+        sink.emit(event)
+
+
+def current_strategy():
+    """Strategy running in this thread (phases and model loads are labelled with it)."""
+    return getattr(_local, "strategy", None)
+
+
+# ------------------------------
+# 🔹 Hooks used by the chunkers
+# ------------------------------
+class _NoOp:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NOOP = _NoOp()
+
+
+class _PhaseTimer:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        emit({"event": "phase", "strategy": current_strategy(), "phase": self.name,
+              "seconds": time.perf_counter() - self.start})
+        return False
+
+
+def phase(name):
+    """Time the enclosed block as phase `name` of the running strategy."""
+    return _PhaseTimer(name) if enabled else _NOOP
+
+
+def model_loaded(model, seconds):
+    """Called by ModelRegistry after every (real) model load."""
+    if enabled:
+        emit({"event": "model_load", "model": model, "seconds": seconds,
+              "strategy": current_strategy()})
+
+
+def instrumented(strategy):
+    """Decorator for a chunker method: records time, bytes in and chunk sizes per call."""
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not enabled:
+                return method(self, *args, **kwargs)
+            outer = current_strategy()
+            _local.strategy = strategy
+            start = time.perf_counter()
+            try:
+                chunks = method(self, *args, **kwargs)
+            finally:
+                _local.strategy = outer
+            seconds = time.perf_counter() - start
+            emit(_strategy_event(strategy, seconds, self.text, chunks))
+            return chunks
+        return wrapper
+    return decorate
+
+
+def _histogram(values, buckets):
+    counts = [0] * len(buckets)
+    for value in values:
+        counts[bisect_left(buckets, value)] += 1
+    return counts
+
+
+def _sizes(chunks):
+    """(chunk lengths, token counts or None) of a ChunkSet, dict list or string list."""
+    if hasattr(chunks, "starts"):
+        lengths = [e - s for s, e in zip(chunks.starts, chunks.ends)]
+        counts = None if chunks.token_counts is None else [c for c in chunks.token_counts if c >= 0]
+        return lengths, counts
+    if chunks and isinstance(chunks[0], str):
+        return [len(c) for c in chunks], None
+    lengths = [len(c["chunk_text"]) for c in chunks]
+    counts = [c["token_count"] for c in chunks if c["token_count"] is not None]
+    return lengths, counts or None
+
+
+def _strategy_event(strategy, seconds, text, chunks):
+    lengths, counts = _sizes(chunks)
+    return {
+        "event": "strategy",
+        "strategy": strategy,
+        "seconds": seconds,
+        "bytes_in": len(text.encode("utf-8")) if not text.isascii() else len(text),
+        "chunks": len(lengths),
+        "chunk_chars": _histogram(lengths, CHAR_BUCKETS),
+        "chunk_chars_sum": sum(lengths),
+        "token_counts": None if counts is None else _histogram(counts, TOKEN_BUCKETS),
+        "token_counts_sum": None if counts is None else sum(counts),
+    }
+
+
+# ------------------------------
+# 🔹 Sinks
+# ------------------------------
+# A sink is any object with emit(event). Sinks must be thread-safe, since
+# strategies may run in several threads at once.
+
+class MemorySink:
+    """Aggregates events in memory; snapshot() returns the totals as a dict."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.strategies = {}    # strategy -> totals and histograms
+            self.phases = {}        # (strategy, phase) -> {"calls", "seconds"}
+            self.model_loads = {}   # model -> {"loads", "seconds"}
+
+    def emit(self, event):
+        with self._lock:
+            kind = event["event"]
+            if kind == "strategy":
+                self._add_strategy(event)
+            elif kind == "phase":
+                stat = self.phases.setdefault((event["strategy"], event["phase"]), {"calls": 0, "seconds": 0.0})
+                stat["calls"] += 1
+                stat["seconds"] += event["seconds"]
+            elif kind == "model_load":
+                stat = self.model_loads.setdefault(event["model"], {"loads": 0, "seconds": 0.0})
+                stat["loads"] += 1
+                stat["seconds"] += event["seconds"]
+
+    def _add_strategy(self, event):
+        stat = self.strategies.get(event["strategy"])
+        if stat is None:
+            stat = self.strategies[event["strategy"]] = {
+                "calls": 0, "seconds": 0.0, "bytes_in": 0, "chunks": 0,
+                "chunk_chars": [0] * len(CHAR_BUCKETS), "chunk_chars_sum": 0,
+                "token_counts": [0] * len(TOKEN_BUCKETS), "token_counts_sum": 0, "token_chunks": 0,
+            }
+        stat["calls"] += 1
+        for key in ("seconds", "bytes_in", "chunks", "chunk_chars_sum"):
+            stat[key] += event[key]
+        stat["chunk_chars"] = [a + b for a, b in zip(stat["chunk_chars"], event["chunk_chars"])]
+        if event["token_counts"] is not None:
+            stat["token_counts"] = [a + b for a, b in zip(stat["token_counts"], event["token_counts"])]
+            stat["token_counts_sum"] += event["token_counts_sum"]
+            stat["token_chunks"] += sum(event["token_counts"])
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "strategies": {name: dict(stat) for name, stat in self.strategies.items()},
+                "phases": [{"strategy": s, "phase": p, **stat} for (s, p), stat in self.phases.items()],
+                "model_loads": {name: dict(stat) for name, stat in self.model_loads.items()},
+            }
+
+
+class PrometheusSink(MemorySink):
+    """MemorySink that renders its totals in the Prometheus text format."""
+
+    def __init__(self, prefix="chunker"):
+        self.prefix = prefix
+        super().__init__()
+
+    def render(self):
+        p = self.prefix
+        snap = self.snapshot()
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            # samples: (name suffix, labels, value), the suffix is "" except for histograms
+            lines.append(f"# HELP {p}_{name} {help_text}")
+            lines.append(f"# TYPE {p}_{name} {kind}")
+            for suffix, labels, value in samples:
+                lines.append(f"{p}_{name}{suffix}{_labels(labels)} {value}")
+
+        strategies = snap["strategies"]
+        metric("strategy_calls_total", "counter", "Chunking calls per strategy.",
+               [("", {"strategy": s}, st["calls"]) for s, st in strategies.items()])
+        metric("strategy_seconds_total", "counter", "Wall time spent per strategy.",
+               [("", {"strategy": s}, st["seconds"]) for s, st in strategies.items()])
+        metric("bytes_in_total", "counter", "Bytes of text chunked per strategy.",
+               [("", {"strategy": s}, st["bytes_in"]) for s, st in strategies.items()])
+        metric("chunks_total", "counter", "Chunks produced per strategy.",
+               [("", {"strategy": s}, st["chunks"]) for s, st in strategies.items()])
+        metric("chunk_chars", "histogram", "Chunk length in characters.",
+               [sample for s, st in strategies.items()
+                for sample in _histogram_samples(s, CHAR_BUCKETS, st["chunk_chars"], st["chunk_chars_sum"])])
+        metric("chunk_tokens", "histogram", "Token count of token-counted chunks.",
+               [sample for s, st in strategies.items() if st["token_chunks"]
+                for sample in _histogram_samples(s, TOKEN_BUCKETS, st["token_counts"], st["token_counts_sum"])])
+        metric("phase_seconds_total", "counter", "Wall time per internal phase of a strategy.",
+               [("", {"strategy": ph["strategy"], "phase": ph["phase"]}, ph["seconds"]) for ph in snap["phases"]])
+        metric("model_loads_total", "counter", "Model loads (spaCy, tiktoken, punkt, ...).",
+               [("", {"model": m}, st["loads"]) for m, st in snap["model_loads"].items()])
+        metric("model_load_seconds_total", "counter", "Time spent loading models.",
+               [("", {"model": m}, st["seconds"]) for m, st in snap["model_loads"].items()])
+        return "\n".join(lines) + "\n"
+
+    def write(self, path):
+        """Write render() atomically, e.g. for the node_exporter textfile collector."""
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            f.write(self.render())
+        os.replace(path + ".tmp", path)
+
+
+def _labels(labels):
+    parts = []
+    for key, value in labels.items():
+        if value is None:
+            continue
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{key}="{value}"')
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _histogram_samples(strategy, buckets, counts, total):
+    """Cumulative _bucket samples plus _sum and _count, as Prometheus expects."""
+    samples, running = [], 0
+    for bound, count in zip(buckets, counts):
+        running += count
+        le = "+Inf" if bound == float("inf") else str(bound)
+        samples.append(("_bucket", {"strategy": strategy, "le": le}, running))
+    samples.append(("_sum", {"strategy": strategy}, total))
+    samples.append(("_count", {"strategy": strategy}, running))
+    return samples
+
+
+class JsonLogSink:
+    """Writes every event as one JSON line to a stream (default stderr) or a logging.Logger."""
+
+    def __init__(self, stream=None, logger=None):
+        self.stream = stream
+        self.logger = logger
+        self._lock = threading.Lock()
+
+    def emit(self, event):
+        line = json.dumps(event, separators=(",", ":"))
+        if self.logger is not None:
+            self.logger.info(line)
+            return
+        with self._lock:
+            stream = self.stream or sys.stderr
+            stream.write(line + "\n")
@@ -0,0 +1,282 @@
+import json
+import re
+import time
+
+from ModelRegistry import get_encoder, is_loaded
+from SpanChunking import SpanChunker, paragraph_spans, sentence_nlp_loaded, sentence_spans
+
+# ------------------------------
+# 🔹 Profile-driven strategy choice
+# ------------------------------
+# plan_chunking() looks at a small sample of the document (a few KB
+# from the start, middle and end), runs the candidate strategies on it
+# and predicts, for the whole document, the average chunk size and the
+# run time of each one (size / throughput measured on the sample by a
+# fresh chunker with an empty embedding cache, after a warm-up run on a
+# short piece that loads the models). Planning counts against the
+# latency budget: a model that is not loaded yet is only loaded (for the
+# profile or for a candidate) if its calibrated start-up time still fits,
+# and a strategy only fits the budget if planning plus its predicted run
+# time do. The calibration table
+# (defaults below, or a ChunkingBenchmark JSON via load_calibration)
+# keeps strategies that are far too slow from even being tried.
+# The best-quality strategy whose chunks land in the target size range
+# within the latency budget wins. The returned plan explains the choice.
+
+# Boundary quality of each strategy (higher keeps more meaning together)
+QUALITY = {
+    "packed": 9, "embedding": 9, "hierarchical": 8, "paragraph": 7, "sentence": 6, "semantic": 6,
+    "recursive": 5, "token": 3, "sliding_window": 3, "fixed_size": 2, "word": 1,
+}
+
+# Rough MB/s and model start-up seconds per strategy, used until measured
+DEFAULT_CALIBRATION = {
+    "word": {"mb_per_s": 10.0, "startup_seconds": 0.0},
+    "sentence": {"mb_per_s": 2.0, "startup_seconds": 0.3},
+    "paragraph": {"mb_per_s": 200.0, "startup_seconds": 0.0},
+    "fixed_size": {"mb_per_s": 30.0, "startup_seconds": 0.0},
+    "sliding_window": {"mb_per_s": 25.0, "startup_seconds": 0.0},
+    "semantic": {"mb_per_s": 0.3, "startup_seconds": 1.5},
+    "recursive": {"mb_per_s": 35.0, "startup_seconds": 0.0},
+    "token": {"mb_per_s": 5.0, "startup_seconds": 0.5},
+    "embedding": {"mb_per_s": 1.0, "startup_seconds": 0.5},
+    "packed": {"mb_per_s": 1.5, "startup_seconds": 0.8},
+    "hierarchical": {"mb_per_s": 40.0, "startup_seconds": 0.0},
+}
+
+_NEEDS = {
+    "sentence": ("punkt",), "embedding": ("punkt",), "semantic": ("spacy",),
+    "token": ("encoder",), "packed": ("punkt", "encoder"),
+}
+_SAFETY = 1.25          # a sample runs faster than the whole document (caches, no GC)
+_WARMUP_CHARS = 1000    # text chunked once to load the models before the timed run
+
+
+def load_calibration(path):
+    """
+    Calibration table from a ChunkingBenchmark JSON: median MB/s and
+    start-up time of every TextChunker target over the largest corpus
+    size it was run on.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        results = json.load(f)["results"]
+    calibration = {}
+    for strategy in QUALITY:
+        runs = [r for r in results if r["target"] == f"TextChunker.{strategy}" and "mb_per_s" in r]
+        if not runs:
+            continue
+        largest = max(r["bytes"] for r in runs)
+        runs = sorted(runs, key=lambda r: r["mb_per_s"])
+        top = [r for r in runs if r["bytes"] == largest]
+        calibration[strategy] = {
+            "mb_per_s": top[len(top) // 2]["mb_per_s"],
+            "startup_seconds": max(r["startup_seconds"] for r in runs),
+        }
+    return calibration
+
+
+def sample_text(text, sample_chars=12000):
+    """Up to `sample_chars` characters: three windows (start, middle, end) cut at line starts."""
+    if len(text) <= sample_chars:
+        return text
+    size = sample_chars // 3
+    windows = []
+    for start in (0, (len(text) - size) // 2, len(text) - size):
+        if start:
+            newline = text.find("\n", start, start + size // 2)
+            start = newline + 1 if newline >= 0 else start
+        windows.append(text[start:start + size])
+    return "\n\n".join(windows)
+
+
+def profile_text(sample, model="gpt-3.5-turbo", load_models=True):
+    """
+    Cheap shape statistics of a sample; missing models just leave their
+    fields out. load_models=False only uses punkt / the encoder if they
+    are loaded already.
+    """
+    n = max(len(sample), 1)
+    paragraphs = paragraph_spans(sample)
+    words = re.findall(r"\S+", sample)
+    profile = {
+        "sample_chars": len(sample),
+        "newlines_per_kchar": 1000 * sample.count("\n") / n,
+        "blank_lines_per_kchar": 1000 * len(re.findall(r"\n[ \t]*\n", sample)) / n,
+        "avg_paragraph_chars": sum(e - s for s, e in paragraphs) / max(len(paragraphs), 1),
+        "avg_word_chars": sum(map(len, words)) / max(len(words), 1),
+    }
+    try:
+        if load_models or is_loaded(("punkt", "english")):
+            sentences = sentence_spans(sample)
+            profile["avg_sentence_chars"] = sum(e - s for s, e in sentences) / max(len(sentences), 1)
+    except LookupError:
+        pass
+    try:
+        if load_models or is_loaded(("tiktoken", model)):
+            profile["tokens_per_char"] = len(get_encoder(model).encode(sample, disallowed_special=())) / n
+    except Exception:       # tiktoken missing or its data cannot be fetched
+        pass
+    return profile
+
+
+def candidate_params(strategy, target_chars, profile, model):
+    """Parameters aiming `strategy` at the middle (or the top, for packing) of the target range."""
+    lo, hi = target_chars
+    mid = (lo + hi) // 2
+    ratio = profile.get("tokens_per_char", 0.25)
+    if strategy == "word":
+        return {"chunk_size": max(1, round(mid / (profile["avg_word_chars"] + 1)))}
+    if strategy == "fixed_size":
+        return {"chunk_size": mid}
+    if strategy == "sliding_window":
+        return {"window_size": mid, "overlap": mid // 10}
+    if strategy == "recursive":
+        return {"max_chars": hi}
+    if strategy == "hierarchical":
+        return {"max_size": hi}
+    if strategy == "token":
+        return {"chunk_size": max(1, round(mid * ratio)), "model": model}
+    if strategy == "packed":
+        return {"max_tokens": max(1, round(hi * ratio)), "model": model}
+    return {}
+
+
+def _cold(strategy, params):
+    """`params` with a private, empty embedding cache, so no sentence vector is reused."""
+    if strategy != "embedding":
+        return params
+    from EmbeddingChunking import EmbeddingCache
+    return dict(params, embedding_cache=EmbeddingCache(params.get("embedder")))
+
+
+def _available(strategy, profile, load_models=True):
+    needs = _NEEDS.get(strategy, ())
+    if "punkt" in needs and "avg_sentence_chars" not in profile:
+        return "punkt data missing" if load_models else "punkt not loaded, loading it is over the budget"
+    if "encoder" in needs and "tokens_per_char" not in profile:
+        return "tiktoken encoder unavailable" if load_models else "encoder not loaded, loading it is over the budget"
+    return None
+
+
+def _missing_models(strategy, params, model):
+    """Models the first run of `strategy` would load (none if they are all loaded)."""
+    missing = []
+    for need in _NEEDS.get(strategy, ()):
+        if need == "punkt" and not is_loaded(("punkt", "english")):
+            missing.append("punkt")
+        elif need == "encoder" and not (is_loaded(("tiktoken", model))
+                                        and is_loaded(("token_bytes", get_encoder(model).name))):
+            missing.append(f"the {model} encoder")
+        elif need == "spacy" and not sentence_nlp_loaded(params.get("pipeline", "parser")):
+            missing.append("the spaCy pipeline")
+    return missing
+
+
+def plan_chunking(text, target_chars=(200, 1000), latency_budget=1.0, model="gpt-3.5-turbo",
+                  calibration=None, strategies=None, sample_chars=12000):
+    """
+    Choose a strategy and parameters for `text`. Returns a plan dict:
+    strategy, params, reason, profile and one entry per candidate with
+    its predicted chunk size and run time.
+    """
+    started = time.perf_counter()
+    calibration = dict(DEFAULT_CALIBRATION, **(calibration or {}))
+    sample = sample_text(text, sample_chars)
+    # the profile only loads punkt and the encoder if that fits the budget
+    load_models = latency_budget >= max(calibration["sentence"]["startup_seconds"],
+                                        calibration["token"]["startup_seconds"])
+    profile = profile_text(sample, model, load_models)
+    lo, hi = target_chars
+    size_mb = len(text.encode("utf-8")) / 1e6
+    sample_mb = len(sample.encode("utf-8")) / 1e6
+    candidates = []
+
+    for strategy in strategies or QUALITY:
+        params = candidate_params(strategy, target_chars, profile, model)
+        cal = calibration[strategy]
+        entry = {"strategy": strategy, "params": params, "quality": QUALITY[strategy]}
+        candidates.append(entry)
+        unavailable = _available(strategy, profile, load_models)
+        if unavailable:
+            entry["skipped"] = unavailable
+            continue
+        missing = _missing_models(strategy, params, model)
+        startup = cal["startup_seconds"] if missing else 0.0
+        prior = startup + size_mb / cal["mb_per_s"]
+        if prior > latency_budget * 3:
+            entry["skipped"] = f"calibrated estimate {prior:.2f}s is far over the budget"
+            continue
+        # a warm-up and a timed run on the sample, plus the model loads
+        sampling = startup + 2 * sample_mb / cal["mb_per_s"]
+        if missing and time.perf_counter() - started + sampling > latency_budget:
+            entry["skipped"] = (f"not loaded yet ({', '.join(missing)}), loading would take "
+                                f"planning over the {latency_budget}s budget")
+            continue
+        try:
+            # load the models on a short piece, then time a fresh chunker (no memoized
+            # sentences or tokens) with an empty embedding cache on the sample
+            warmup = sample[:_WARMUP_CHARS] if missing else ""
+            load_start = time.perf_counter()
+            if warmup:
+                getattr(SpanChunker(warmup), f"{strategy}_chunking")(**_cold(strategy, params))
+            load_seconds = time.perf_counter() - load_start
+            method = getattr(SpanChunker(sample), f"{strategy}_chunking")
+            timed_params = _cold(strategy, params)
+            run_start = time.perf_counter()
+            chunks = method(**timed_params)
+            seconds = time.perf_counter() - run_start
+        except (OSError, LookupError, ValueError) as e:
+            entry["skipped"] = f"failed on the sample: {e}"
+            continue
+        sizes = [c["end_index"] - c["start_index"] for c in chunks]
+        mb_per_s = len(sample.encode("utf-8")) / 1e6 / max(seconds, 1e-6)
+        entry.update({
+            "sample_chunks": len(sizes),
+            "predicted_chunk_chars": sum(sizes) / max(len(sizes), 1),
+            "share_in_range": sum(lo <= s <= hi for s in sizes) / max(len(sizes), 1),
+            "measured_mb_per_s": mb_per_s,
+            # the warm-up run paid for loading the models (plus chunking its short piece)
+            "profile_load_seconds": max(load_seconds - seconds * len(warmup) / len(sample), 0.0),
+            "predicted_seconds": _SAFETY * size_mb / mb_per_s,
+        })
+        entry["fits_size"] = lo <= entry["predicted_chunk_chars"] <= hi
+
+    measured = [c for c in candidates if "predicted_seconds" in c]
+    if not measured:
+        raise ValueError("⚠️ No chunking strategy could run on this text")
+    planning = time.perf_counter() - started
+    for entry in measured:
+        entry["fits_budget"] = planning + entry["predicted_seconds"] <= latency_budget
+    best = max(measured, key=lambda c: (c["fits_budget"], c["fits_size"], c["quality"],
+                                        c["share_in_range"], -c["predicted_seconds"]))
+    if best["fits_budget"] and best["fits_size"]:
+        reason = (f"{best['strategy']} has the best boundary quality among strategies averaging "
+                  f"{lo}-{hi} chars per chunk within {latency_budget}s")
+    elif best["fits_budget"]:
+        reason = (f"no strategy averages {lo}-{hi} chars per chunk; {best['strategy']} comes "
+                  f"closest ({best['predicted_chunk_chars']:.0f} chars) within {latency_budget}s")
+    else:
+        best = min(measured, key=lambda c: c["predicted_seconds"])
+        reason = f"no strategy fits {latency_budget}s; {best['strategy']} is the fastest"
+    return {
+        "strategy": best["strategy"],
+        "params": best["params"],
+        "reason": reason,
+        "predicted_seconds": best["predicted_seconds"],
+        "predicted_chunk_chars": best["predicted_chunk_chars"],
+        "profile": profile,
+        "candidates": candidates,
+        "planning_seconds": planning,
+    }
+
+
+def explain(plan):
+    """Plan as readable lines (for logs; plan_chunking itself never prints)."""
+    lines = [f"{plan['strategy']} {plan['params']}: {plan['reason']}"]
+    for c in plan["candidates"]:
+        if "skipped" in c:
+            lines.append(f"  {c['strategy']:15s} skipped: {c['skipped']}")
+        else:
+            lines.append(f"  {c['strategy']:15s} ~{c['predicted_chunk_chars']:.0f} chars/chunk, "
+                         f"~{c['predicted_seconds']:.3f}s, quality {c['quality']}")
+    return "\n".join(lines)
@@ -0,0 +1,142 @@
+from array import array
+
+# ------------------------------
+# 🔹 Compact chunk collections
+# ------------------------------
+# A ChunkSet keeps one reference to the source text plus three int64
+# arrays (start, end, token count) instead of one dict and one copied
+# substring per chunk. Chunk text is only sliced out when it is read.
+
+FIELDS = ("chunk_text", "start_index", "end_index", "token_count")
+
+
+class Chunk:
+    """Lightweight view of one chunk of a ChunkSet (reads like the metadata dict)."""
+    __slots__ = ("_chunks", "_i")
+
+    def __init__(self, chunks, i):
+        self._chunks = chunks
+        self._i = i
+
+    @property
+    def chunk_text(self):
+        return self._chunks.text_at(self._i)
+
+    @property
+    def start_index(self):
+        return self._chunks.starts[self._i]
+
+    @property
+    def end_index(self):
+        return self._chunks.ends[self._i]
+
+    @property
+    def token_count(self):
+        counts = self._chunks.token_counts
+        if counts is None or counts[self._i] < 0:
+            return None
+        return counts[self._i]
+
+    def __getitem__(self, key):
+        if key not in FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in FIELDS else default
+
+    def keys(self):
+        return FIELDS
+
+    def to_dict(self):
+        return {key: getattr(self, key) for key in FIELDS}
+
+    def __eq__(self, other):
+        if isinstance(other, (Chunk, dict)):
+            return all(self[key] == other[key] for key in FIELDS)
+        return NotImplemented
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+
+class ChunkSet:
+    """
+    Chunks of one text stored as parallel int arrays.
+    - chunks[i] / iteration give Chunk views
+    - to_dicts() gives the usual list of metadata dicts
+    - as_numpy() gives (starts, ends, token_counts) without copying
+    join_words=True re-joins the words of each chunk with single spaces,
+    which is what word_chunking returns as chunk_text.
+    """
+
+    def __init__(self, text, starts, ends, token_counts=None, join_words=False):
+        self.text = text
+        self.starts = starts
+        self.ends = ends
+        self.token_counts = token_counts
+        self.join_words = join_words
+
+    @classmethod
+    def from_spans(cls, text, spans, token_counts=None, join_words=False):
+        starts = array("q", (s for s, _ in spans))
+        ends = array("q", (e for _, e in spans))
+        if token_counts is not None:
+            token_counts = array("q", (-1 if c is None else c for c in token_counts))
+        return cls(text, starts, ends, token_counts, join_words)
+
+    @classmethod
+    def from_ranges(cls, text, step, size):
+        """Windows of `size` chars every `step` chars (fixed-size / sliding)."""
+        n = len(text)
+        starts = array("q", range(0, n, step))
+        ends = array("q", range(size, size + len(starts) * step, step))
+        # the last windows are cut at the end of the text
+        i = len(ends) - 1
+        while i >= 0 and ends[i] > n:
+            ends[i] = n
+            i -= 1
+        return cls(text, starts, ends)
+
+    def text_at(self, i):
+        chunk = self.text[self.starts[i]:self.ends[i]]
+        return ' '.join(chunk.split()) if self.join_words else chunk
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [Chunk(self, j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("chunk index out of range")
+        return Chunk(self, i)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield Chunk(self, i)
+
+    def texts(self):
+        return [self.text_at(i) for i in range(len(self))]
+
+    def to_dicts(self):
+        """The classic list of {chunk_text, start_index, end_index, token_count} dicts."""
+        return [chunk.to_dict() for chunk in self]
+
+    def as_numpy(self):
+        """(starts, ends, token_counts) as int64 numpy arrays sharing this set's memory."""
+        import numpy as np
+        counts = None if self.token_counts is None else np.frombuffer(self.token_counts, dtype=np.int64)
+        return np.frombuffer(self.starts, dtype=np.int64), np.frombuffer(self.ends, dtype=np.int64), counts
+
+    def nbytes(self):
+        """Memory used by the offsets (the source text is shared, not counted)."""
+        total = self.starts.buffer_info()[1] * self.starts.itemsize * 2
+        if self.token_counts is not None:
+            total += self.token_counts.buffer_info()[1] * self.token_counts.itemsize
+        return total
+
+    def __repr__(self):
+        return f"ChunkSet({len(self)} chunks)"
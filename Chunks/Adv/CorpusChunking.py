@@ -0,0 +1,210 @@
+import os
+import time
+
+from SpanChunking import SpanChunker
+
+# ------------------------------
+# 🔹 Multi-core corpus chunking
+# ------------------------------
+# Documents are grouped into batches of roughly `batch_chars` characters
+# (so thousands of small files do not cost one round trip each) and spread
+# over a pool of worker processes. Each worker loads the models its
+# strategy needs once, in the pool initializer.
+
+STRATEGIES = ("word", "sentence", "paragraph", "fixed_size", "sliding_window",
+              "semantic", "recursive", "token", "embedding", "packed", "hierarchical")
+
+# Models to load in every worker before the first batch
+_WARMUP = {
+    "sentence": lambda params: _registry().get_punkt(),
+    "embedding": lambda params: _registry().get_punkt(),
+    "semantic": lambda params: _spans().sentence_nlp(params.get("pipeline", "parser")),
+    "token": lambda params: _spans().token_byte_lengths(_registry().get_encoder(params.get("model", "gpt-3.5-turbo"))),
+    "packed": lambda params: (_registry().get_punkt(),
+                              _spans().token_byte_lengths(_registry().get_encoder(params.get("model", "gpt-3.5-turbo")))),
+    "hierarchical": lambda params: (_spans().token_byte_lengths(_registry().get_encoder(params.get("model", "gpt-3.5-turbo")))
+                                    if params.get("unit") == "tokens" else None),
+}
+
+
+def _registry():
+    import ModelRegistry
+    return ModelRegistry
+
+
+def _spans():
+    import SpanChunking
+    return SpanChunking
+
+
+def is_path(doc):
+    """Files are given as pathlib.Path (any os.PathLike), a str is always text."""
+    return isinstance(doc, os.PathLike)
+
+
+def _read(doc):
+    if is_path(doc):
+        with open(doc, "r", encoding="utf-8") as f:
+            return f.read()
+    return doc
+
+
+def _doc_size(doc):
+    return os.path.getsize(doc) if is_path(doc) else len(doc)
+
+
+def init_worker(strategy, params):
+    """Pool initializer: load the models `strategy` needs in this process."""
+    warm = _WARMUP.get(strategy)
+    if warm:
+        warm(params)
+
+
+_caches = {}                # cache path -> ChunkCache of this process
+
+
+def _cache(path):
+    cache = _caches.get(path)
+    if cache is None:
+        from ChunkCache import ChunkCache
+        cache = _caches[path] = ChunkCache(path)
+    return cache
+
+
+def chunk_batch(batch, strategy, params, compact=False, cache=None):
+    """Runs in a worker: chunk every (doc_id, doc) of the batch."""
+    start = time.perf_counter()
+    results, chars, n_chunks = [], 0, 0
+    for doc_id, doc in batch:
+        text = _read(doc)
+        if cache:
+            chunks = _cache(cache).chunk(text, strategy, params, compact)
+        else:
+            chunks = getattr(SpanChunker(text, compact), f"{strategy}_chunking")(**params)
+        results.append((doc_id, chunks))
+        chars += len(text)
+        n_chunks += len(chunks)
+    return os.getpid(), results, chars, n_chunks, time.perf_counter() - start
+
+
+def _batches(docs, batch_chars, max_docs):
+    batch, size = [], 0
+    for doc_id, doc in docs:
+        batch.append((doc_id, doc))
+        size += _doc_size(doc)
+        if size >= batch_chars or len(batch) >= max_docs:
+            yield batch
+            batch, size = [], 0
+    if batch:
+        yield batch
+
+
+def doc_ids(docs):
+    """(doc_id, doc): paths keep their path as id, texts get their position."""
+    for i, doc in enumerate(docs):
+        if isinstance(doc, tuple):
+            yield doc
+        else:
+            yield (os.fspath(doc) if is_path(doc) else i), doc
+
+
+def chunk_corpus(docs, strategy="paragraph", params=None, workers=None,
+                 batch_chars=1 << 20, max_batch_docs=256, compact=False, report=None, cache=None):
+    """
+    Chunk many documents on `workers` processes (default: all cores).
+
+    docs: file paths (pathlib.Path or another os.PathLike), texts (str),
+    or (doc_id, path_or_text) tuples. A str is never taken for a path.
+    strategy: one of STRATEGIES, params: keyword arguments for it.
+    Yields (doc_id, chunks) in input order. If `report` is a dict, it is
+    filled with overall and per-worker throughput when the run finishes.
+    compact=True returns ChunkSets, which are also much cheaper to send
+    back from the workers than lists of dicts.
+    workers=1 runs in the calling process (no pool, handy for debugging).
+    cache: path of a ChunkCache database shared by all workers; documents
+    chunked before with the same strategy and params are read from it.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"⚠️ Unknown strategy: {strategy} (use one of {STRATEGIES})")
+    params = dict(params or {})
+    workers = workers or os.cpu_count() or 1
+    per_worker = {}
+    start = time.perf_counter()
+
+    def record(pid, chars, n_docs, n_chunks, seconds):
+        stat = per_worker.setdefault(pid, {"docs": 0, "chars": 0, "chunks": 0, "busy_seconds": 0.0})
+        stat["docs"] += n_docs
+        stat["chars"] += chars
+        stat["chunks"] += n_chunks
+        stat["busy_seconds"] += seconds
+
+    batches = _batches(doc_ids(docs), batch_chars, max_batch_docs)
+    if workers == 1:
+        init_worker(strategy, params)
+        for batch in batches:
+            pid, results, chars, n_chunks, seconds = chunk_batch(batch, strategy, params, compact, cache)
+            record(pid, chars, len(results), n_chunks, seconds)
+            yield from results
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(strategy, params)) as pool:
+            pending = []
+            # Keep a few batches per worker in flight: enough to stay busy,
+            # few enough that results do not pile up in memory.
+            for batch in batches:
+                pending.append(pool.submit(chunk_batch, batch, strategy, params, compact, cache))
+                if len(pending) >= 2 * workers:
+                    pid, results, chars, n_chunks, seconds = pending.pop(0).result()
+                    record(pid, chars, len(results), n_chunks, seconds)
+                    yield from results
+            for future in pending:
+                pid, results, chars, n_chunks, seconds = future.result()
+                record(pid, chars, len(results), n_chunks, seconds)
+                yield from results
+
+    if report is not None:
+        wall = time.perf_counter() - start
+        report.update(_summary(per_worker, wall, workers, strategy))
+
+
+def _summary(per_worker, wall, workers, strategy):
+    total_chars = sum(s["chars"] for s in per_worker.values())
+    total_docs = sum(s["docs"] for s in per_worker.values())
+    total_chunks = sum(s["chunks"] for s in per_worker.values())
+    for stat in per_worker.values():
+        busy = stat["busy_seconds"] or 1e-9
+        stat["mb_per_s"] = stat["chars"] / busy / 1e6
+        stat["docs_per_s"] = stat["docs"] / busy
+    return {
+        "strategy": strategy,
+        "workers": workers,
+        "docs": total_docs,
+        "chunks": total_chunks,
+        "chars": total_chars,
+        "wall_seconds": wall,
+        "mb_per_s": total_chars / (wall or 1e-9) / 1e6,
+        "per_worker": per_worker,
+    }
+
+
+def print_report(report, file=None):
+    print(f"{report['strategy']}: {report['docs']} docs, {report['chunks']} chunks, "
+          f"{report['mb_per_s']:.1f} MB/s on {report['workers']} workers ({report['wall_seconds']:.2f}s)",
+          file=file)
+    for pid, stat in sorted(report["per_worker"].items()):
+        print(f"  worker {pid}: {stat['docs']} docs, {stat['mb_per_s']:.1f} MB/s, "
+              f"busy {stat['busy_seconds']:.2f}s", file=file)
+
+
+# ------------------------------
+# 🔹 Example usage:
+# ------------------------------
+if __name__ == "__main__":
+    import sys
+    from pathlib import Path
+    paths = [Path(p) for p in sys.argv[1:]] or [
+        Path(__file__).resolve().parent.parent / "TempFiles" / "InputFile" / "SampleInput_1.txt"]
+    report = {}
+    for doc_id, chunks in chunk_corpus(paths, "paragraph", report=report):
+        print(doc_id, len(chunks), "chunks")
+    print_report(report)
@@ -0,0 +1,197 @@
+import hashlib
+import re
+import threading
+import zlib
+from collections import OrderedDict
+
+import numpy as np
+
+# ------------------------------
+# 🔹 Embedders
+# ------------------------------
+# Any object with embed(list_of_texts) -> 2D numpy array (one row per text)
+# can be used. A plain function texts -> array works too (see as_embedder).
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+class HashingEmbedder:
+    """
+    Offline default: word (and word n-gram) counts hashed into a fixed
+    number of buckets, sublinear tf, L2-normalised. No model, no network.
+    crc32 is used instead of hash() so vectors are the same in every process.
+    """
+
+    def __init__(self, n_features=1024, ngram_range=(1, 2)):
+        self.n_features = n_features
+        self.ngram_range = ngram_range
+        self.name = f"hashing-{n_features}-{ngram_range[0]}-{ngram_range[1]}"
+
+    def _buckets(self, text):
+        words = _TOKEN_RE.findall(text.lower())
+        lo, hi = self.ngram_range
+        grams = []
+        for n in range(lo, hi + 1):
+            grams.extend(" ".join(words[i:i+n]) for i in range(len(words) - n + 1))
+        return [zlib.crc32(g.encode("utf-8")) % self.n_features for g in grams]
+
+    def embed(self, texts):
+        vectors = np.zeros((len(texts), self.n_features), dtype=np.float32)
+        for row, text in enumerate(texts):
+            buckets = self._buckets(text)
+            if buckets:
+                vectors[row] = np.bincount(buckets, minlength=self.n_features)
+        np.log1p(vectors, out=vectors)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+
+class _FunctionEmbedder:
+    def __init__(self, fn):
+        self.fn = fn
+        self.name = None            # a function says nothing about its model
+
+    def embed(self, texts):
+        return np.asarray(self.fn(texts), dtype=np.float32)
+
+
+def as_embedder(embedder):
+    """Accept an embedder object or a plain texts -> array function."""
+    if embedder is None:
+        return HashingEmbedder()
+    if hasattr(embedder, "embed"):
+        return embedder
+    return _FunctionEmbedder(embedder)
+
+
+class EmbeddingCache:
+    """
+    Sentence-hash -> vector cache in front of an embedder. Only sentences
+    that were never seen are embedded (in batches of batch_size), so
+    re-chunking with another threshold or window costs no embedding work.
+    Holds at most max_items vectors, dropping the least recently used.
+    """
+
+    def __init__(self, embedder=None, batch_size=256, max_items=1_000_000):
+        self.embedder = as_embedder(embedder)
+        self.batch_size = batch_size
+        self.max_items = max_items
+        self.vectors = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(text):
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def embed(self, texts):
+        keys = [self._key(t) for t in texts]
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key in self.vectors:
+                self.vectors.move_to_end(key)
+            elif key not in missing:
+                missing[key] = text
+        self.misses += len(missing)
+        self.hits += len(keys) - len(missing)
+        if missing:
+            new_keys, new_texts = list(missing), list(missing.values())
+            for i in range(0, len(new_texts), self.batch_size):
+                batch = self.embedder.embed(new_texts[i:i+self.batch_size])
+                for key, vector in zip(new_keys[i:i+self.batch_size], batch):
+                    self.vectors[key] = vector
+        if not keys:
+            return np.zeros((0, 0), dtype=np.float32)
+        embeddings = np.stack([self.vectors[key] for key in keys])
+        while len(self.vectors) > self.max_items:
+            self.vectors.popitem(last=False)
+        return embeddings
+
+
+MAX_SHARED_CACHES = 8
+_shared = OrderedDict()         # embedder name -> EmbeddingCache, least recently used first
+_shared_lock = threading.Lock()
+
+
+def shared_cache(embedder):
+    """
+    Process-wide EmbeddingCache of a named embedder (its `name`, e.g. the
+    model name: embedders with the same name must give the same vectors),
+    reused by every chunker. Only the MAX_SHARED_CACHES most recently used
+    are kept. None for an embedder without a name.
+    """
+    embedder = as_embedder(embedder)
+    name = getattr(embedder, "name", None)
+    if not name:
+        return None
+    with _shared_lock:
+        cache = _shared.get(name)
+        if cache is None:
+            cache = _shared[name] = EmbeddingCache(embedder)
+            while len(_shared) > MAX_SHARED_CACHES:
+                _shared.popitem(last=False)
+        else:
+            _shared.move_to_end(name)
+    return cache
+
+
+# ------------------------------
+# 🔹 Breakpoint detection
+# ------------------------------
+THRESHOLD_TYPES = ("percentile", "std")
+
+
+def neighbor_distances(embeddings, window=1):
+    """
+    Cosine distance between the `window` sentences before and after every
+    gap (gap i lies between sentence i and i+1), for all gaps in one pass
+    using prefix sums of the embeddings.
+    """
+    n = len(embeddings)
+    if n < 2:
+        return np.zeros(0, dtype=np.float32)
+    if window == 1:
+        left, right = embeddings[:-1], embeddings[1:]
+    else:
+        prefix = np.zeros((n + 1, embeddings.shape[1]), dtype=np.float32)
+        np.cumsum(embeddings, axis=0, out=prefix[1:])
+        gaps = np.arange(1, n)                      # first sentence after each gap
+        left = prefix[gaps] - prefix[np.maximum(gaps - window, 0)]
+        right = prefix[np.minimum(gaps + window, n)] - prefix[gaps]
+    dots = np.einsum("ij,ij->i", left, right)
+    norms = np.linalg.norm(left, axis=1) * np.linalg.norm(right, axis=1)
+    sims = np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+    return 1.0 - sims
+
+
+def breakpoints(distances, threshold_type="percentile", threshold=95):
+    """
+    Gap indices where a new chunk starts:
+    - "percentile": distance above the `threshold` percentile of all gaps
+    - "std": distance above mean + `threshold` standard deviations
+    """
+    if len(distances) == 0:
+        return np.zeros(0, dtype=np.int64)
+    if threshold_type == "percentile":
+        cutoff = np.percentile(distances, threshold)
+    elif threshold_type == "std":
+        cutoff = distances.mean() + threshold * distances.std()
+    else:
+        raise ValueError(f"⚠️ Unknown threshold_type: {threshold_type} (use one of {THRESHOLD_TYPES})")
+    return np.flatnonzero(distances > cutoff)
+
+
+def embedding_spans(text, sentence_spans, cache, threshold_type="percentile", threshold=95, window=1):
+    """
+    Group consecutive sentence spans into chunks, starting a new chunk
+    where the similarity to the previous sentences drops. Returns the
+    (start, end) span of every chunk.
+    """
+    if not sentence_spans:
+        return []
+    embeddings = cache.embed([text[s:e] for s, e in sentence_spans])
+    cuts = breakpoints(neighbor_distances(embeddings, window), threshold_type, threshold) + 1
+    firsts = [0] + cuts.tolist()
+    lasts = [c - 1 for c in cuts.tolist()] + [len(sentence_spans) - 1]
+    return [(sentence_spans[f][0], sentence_spans[l][1]) for f, l in zip(firsts, lasts)]
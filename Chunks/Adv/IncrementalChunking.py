@@ -0,0 +1,172 @@
+import hashlib
+
+from SpanChunking import SpanChunker, paragraph_spans, sentence_spans
+
+# ------------------------------
+# 🔹 Incremental re-chunking
+# ------------------------------
+# A document is cut into regions, its paragraphs (lines, as in
+# paragraph_chunking), and every region is chunked on its own. A
+# paragraph over max_region_chars is cut further into its punkt
+# sentences, so an edit inside a long paragraph only costs the sentences
+# it touches. After an edit only the regions whose text changed are
+# chunked again; all other regions reuse their chunks with shifted
+# offsets. Every chunk carries a content-hash "chunk_id", so downstream
+# embedding/indexing only has to handle `added` and `removed`.
+#
+#   doc = IncrementalChunker("sentence").chunk(text)
+#   doc = doc.update(edited_text)
+#   embed(doc.added); delete(doc.removed)
+#
+# Chunks never cross a region boundary, so fixed-size, sliding-window,
+# word and token windows restart at every paragraph (and sentence of a
+# long paragraph). Regions only depend on the text, so chunk(text) and
+# any chain of update() calls ending in `text` give the same chunks.
+
+DEFAULT_MAX_REGION_CHARS = 2000
+
+
+def chunk_id(chunk_text):
+    """Stable content hash of a chunk (same text -> same id, in every process)."""
+    return hashlib.blake2b(chunk_text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def region_spans(text, max_region_chars=DEFAULT_MAX_REGION_CHARS, language="english"):
+    """
+    (start, end) of the regions of `text`: its paragraphs, with every
+    paragraph over max_region_chars (None: no limit) cut into sentences.
+    """
+    spans = []
+    for start, end in paragraph_spans(text):
+        if max_region_chars is None or end - start <= max_region_chars:
+            spans.append((start, end))
+        else:
+            spans.extend((start + s, start + e) for s, e in sentence_spans(text[start:end], language))
+    return spans
+
+
+class _Region:
+    """Chunks of one region, with offsets relative to the region start."""
+    __slots__ = ("text", "key", "chunks")
+
+    def __init__(self, text, chunks, key=None):
+        self.text = text
+        self.chunks = chunks        # [(chunk_text, start, end, token_count, chunk_id)]
+        self.key = key
+
+    def digest(self):
+        if self.key is None:
+            self.key = hashlib.blake2b(self.text.encode("utf-8"), digest_size=16).digest()
+        return self.key
+
+
+class IncrementalChunker:
+    """
+    Chunks documents region by region with one SpanChunker strategy
+    (any strategy of SpanChunker, with its keyword arguments in `params`).
+    max_region_chars: paragraphs longer than this are cut into sentence
+    regions (None keeps whole paragraphs, needs no punkt).
+    """
+
+    def __init__(self, strategy="sentence", params=None, max_region_chars=DEFAULT_MAX_REGION_CHARS,
+                 language="english"):
+        if not hasattr(SpanChunker, f"{strategy}_chunking"):
+            raise ValueError(f"⚠️ Unknown strategy: {strategy}")
+        self.strategy = strategy
+        self.params = dict(params or {})
+        self.max_region_chars = max_region_chars
+        self.language = language
+
+    def regions(self, text):
+        """Region spans of `text` for this chunker (see region_spans)."""
+        return region_spans(text, self.max_region_chars, self.language)
+
+    def _chunk_region(self, text):
+        chunks = getattr(SpanChunker(text), f"{self.strategy}_chunking")(**self.params)
+        return _Region(text, [(c["chunk_text"], c["start_index"], c["end_index"], c["token_count"],
+                               chunk_id(c["chunk_text"])) for c in chunks])
+
+    def chunk(self, text):
+        """Chunk a whole document; returns a ChunkedDocument to update() later."""
+        spans = self.regions(text)
+        regions = [self._chunk_region(text[s:e]) for s, e in spans]
+        return ChunkedDocument(self, text, spans, regions, previous_ids=set(), rechunked=len(spans))
+
+
+class ChunkedDocument:
+    """
+    Chunks of one version of a document.
+    - chunks: the usual metadata dicts plus "chunk_id"
+    - added: chunks whose id was not in the previous version
+    - removed: ids of the previous version that are gone
+    - rechunked / reused: number of regions chunked again / taken over
+    """
+
+    def __init__(self, chunker, text, spans, regions, previous_ids, rechunked, reused=0):
+        self.chunker = chunker
+        self.text = text
+        self._spans = spans
+        self._regions = regions
+        self.rechunked = rechunked
+        self.reused = reused
+        self.chunks = []
+        for (offset, _), region in zip(spans, regions):
+            for chunk_text, start, end, count, cid in region.chunks:
+                self.chunks.append({
+                    "chunk_text": chunk_text,
+                    "start_index": offset + start,
+                    "end_index": offset + end,
+                    "token_count": count,
+                    "chunk_id": cid,
+                })
+        self.ids = {c["chunk_id"] for c in self.chunks}
+        self.added = [c for c in self.chunks if c["chunk_id"] not in previous_ids]
+        self.removed = previous_ids - self.ids
+
+    def update(self, new_text):
+        """Chunks of `new_text`, re-chunking only the regions that changed."""
+        if new_text == self.text:
+            return ChunkedDocument(self.chunker, new_text, self._spans, self._regions,
+                                   self.ids, rechunked=0, reused=len(self._regions))
+        spans = self.chunker.regions(new_text)
+        old = self._regions
+        texts = [new_text[s:e] for s, e in spans]
+
+        # Unchanged regions at the front and the back are matched by
+        # position (a plain string compare), the rest by content hash, so
+        # moved or copied regions are reused as well.
+        front = 0
+        while front < min(len(old), len(texts)) and old[front].text == texts[front]:
+            front += 1
+        back = 0
+        while (back < min(len(old), len(texts)) - front
+               and old[-1 - back].text == texts[-1 - back]):
+            back += 1
+
+        by_key = {region.digest(): region for region in old[front:len(old) - back]}
+        regions, rechunked = list(old[:front]), 0
+        for text in texts[front:len(texts) - back]:
+            key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+            region = by_key.get(key)
+            if region is None:
+                region = self.chunker._chunk_region(text)
+                region.key = key
+                by_key[key] = region
+                rechunked += 1
+            regions.append(region)
+        regions.extend(old[len(old) - back:])
+        return ChunkedDocument(self.chunker, new_text, spans, regions, self.ids,
+                               rechunked, len(regions) - rechunked)
+
+
+# ------------------------------
+# 🔹 Example usage:
+# ------------------------------
+if __name__ == "__main__":
+    text = "First paragraph. It has two sentences.\nSecond paragraph here.\nThird one."
+    doc = IncrementalChunker("sentence").chunk(text)
+    edited = doc.update(text.replace("Second paragraph here.", "Second paragraph, edited."))
+    print(f"{len(edited.chunks)} chunks, {edited.rechunked} region(s) re-chunked, "
+          f"{len(edited.added)} added, {len(edited.removed)} removed")
+    for c in edited.added:
+        print(c)
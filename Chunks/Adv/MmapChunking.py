@@ -0,0 +1,384 @@
+import mmap
+import os
+import re
+import time
+from collections import deque
+from contextlib import contextmanager
+from itertools import chain
+
+import numpy as np
+
+from SpanChunking import paragraph_spans, word_spans
+
+# ------------------------------
+# 🔹 Memory-mapped, byte-range-parallel chunking
+# ------------------------------
+# For single files far too big to read into one string. The file is
+# memory-mapped (afresh by every task, unmapped when it is done) and cut into
+# byte ranges of about `range_bytes`, aligned so no range starts inside
+# a UTF-8 character (fixed_size, sliding_window), a word (word) or a
+# line (paragraph). Each range goes through two passes on a worker:
+#   1. count its characters (and words, for word chunking),
+#   2. chunk it, knowing how many characters / words come before it.
+# Pass 2 of a range is started as soon as the counts of all the ranges
+# before it are in, so it usually reads the pages pass 1 just loaded.
+# Workers return byte and character offsets as numpy arrays, the main
+# process yields them in file order; concatenated they are exactly the
+# spans of SpanChunker on the whole text. Memory per worker is a small
+# multiple of range_bytes whatever the size of the file.
+#
+# The text is taken as stored: UTF-8, line endings untouched, i.e.
+# open(path, encoding="utf-8", newline="").read().
+#
+#   for chunk in iter_mmap_chunking("huge.log", "paragraph", workers=8):
+#       ...
+
+STRATEGIES = ("fixed_size", "sliding_window", "word", "paragraph")
+DEFAULT_RANGE_BYTES = 1 << 23
+
+# ASCII bytes that are whitespace for str.split() / re's \s
+_WS = np.zeros(256, dtype=bool)
+_WS[[9, 10, 11, 12, 13, 28, 29, 30, 31, 32]] = True
+_SPACE_BYTE_RE = re.compile(rb"[\t\n\x0b\x0c\r\x1c-\x1f ]")
+# First bytes of the UTF-8 encodings of the non-ASCII whitespace characters
+# (U+0085, U+00A0, U+1680, U+2000-U+200A, U+2028, U+2029, U+202F, U+205F, U+3000)
+_SPACE_LEAD = np.zeros(256, dtype=bool)
+_SPACE_LEAD[[0xC2, 0xE1, 0xE2, 0xE3]] = True
+_EMPTY = np.zeros(0, dtype=np.int64)
+
+
+@contextmanager
+def _mapped(path):
+    """
+    Read-only map of the file as it is now (b"" if it is empty), unmapped
+    on exit, so no file descriptor is kept and a rewritten file is never
+    read through an old map.
+    """
+    with open(path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            yield b""
+            return
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        yield mm
+    finally:
+        mm.close()
+
+
+def _view(mm, lo, hi):
+    return np.frombuffer(mm, dtype=np.uint8, count=hi - lo, offset=lo)
+
+
+# ------------------------------
+# 🔹 Range boundaries
+# ------------------------------
+def _char_start(mm, pos):
+    """First UTF-8 character start at or after pos."""
+    while pos < len(mm) and mm[pos] & 0xC0 == 0x80:
+        pos += 1
+    return pos
+
+
+def _after_space(mm, pos):
+    match = _SPACE_BYTE_RE.search(mm, pos)
+    return match.end() if match else len(mm)
+
+
+def _after_newline(mm, pos):
+    newline = mm.find(b"\n", pos)
+    return newline + 1 if newline >= 0 else len(mm)
+
+
+_ALIGN = {"fixed_size": _char_start, "sliding_window": _char_start,
+          "word": _after_space, "paragraph": _after_newline}
+
+
+def byte_ranges(mm, range_bytes, align):
+    """(lo, hi) ranges of about range_bytes covering mm, each ending where align() says."""
+    ranges, lo, size = [], 0, len(mm)
+    while lo < size:
+        hi = align(mm, min(lo + range_bytes, size)) if lo + range_bytes < size else size
+        ranges.append((lo, hi))
+        lo = hi
+    return ranges
+
+
+# ------------------------------
+# 🔹 Offsets inside one range
+# ------------------------------
+def _to_chars(mm, lo, hi, char_lo, byte_positions):
+    """Character offsets of byte offsets in [lo, hi]; char_lo is the character offset of lo."""
+    # every continuation byte before a position is one character less
+    cont = np.flatnonzero((_view(mm, lo, hi) & 0xC0) == 0x80)
+    local = byte_positions - lo
+    if not len(cont):
+        return char_lo + local
+    return char_lo + local - np.searchsorted(cont, local)
+
+
+def _char_to_byte(mm, byte_lo, char_lo, positions, block=1 << 20):
+    """
+    Byte offsets of the sorted character offsets `positions` (all >=
+    char_lo, which starts at byte_lo), found by counting characters block
+    by block. Positions past the end of the file are clipped to it.
+    Returns (byte offsets, clipped character offsets).
+    """
+    out = np.empty(len(positions), dtype=np.int64)
+    chars = positions.copy()
+    size, i, n = len(mm), 0, len(positions)
+    while i < n:
+        if byte_lo >= size:
+            out[i:], chars[i:] = size, char_lo
+            break
+        hi = min(byte_lo + block, size)
+        lead = (_view(mm, byte_lo, hi) & 0xC0) != 0x80
+        count = int(np.count_nonzero(lead))
+        j = int(np.searchsorted(positions, char_lo + count, side="left"))
+        if j > i:
+            if count == hi - byte_lo:
+                out[i:j] = byte_lo + (positions[i:j] - char_lo)
+            else:
+                out[i:j] = byte_lo + np.flatnonzero(lead)[positions[i:j] - char_lo]
+        i, char_lo, byte_lo = j, char_lo + count, hi
+    return out, chars
+
+
+def _decoded_spans(mm, lo, hi, spans):
+    """Byte spans of spans(decoded range), e.g. word_spans (for text with non-ASCII whitespace)."""
+    text = mm[lo:hi].decode("utf-8")
+    flat = np.fromiter(chain.from_iterable(spans(text)), dtype=np.int64)
+    starts, ends = flat[0::2], flat[1::2]
+    if len(text) == hi - lo:
+        return lo + starts, lo + ends
+    lead = np.append(np.flatnonzero((_view(mm, lo, hi) & 0xC0) != 0x80), hi - lo)
+    return lo + lead[starts], lo + lead[ends]
+
+
+def _has_unicode_space(mm, lo, hi):
+    data = _view(mm, lo, hi)
+    at = np.flatnonzero(_SPACE_LEAD[data])
+    if not len(at):
+        return False
+    last = len(data) - 1
+    lead, b1, b2 = data[at], data[np.minimum(at + 1, last)], data[np.minimum(at + 2, last)]
+    found = (lead == 0xC2) & ((b1 == 0x85) | (b1 == 0xA0))
+    found |= (lead == 0xE1) & (b1 == 0x9A) & (b2 == 0x80)
+    found |= (lead == 0xE2) & (b1 == 0x80) & ((b2 <= 0x8A) | (b2 == 0xA8) | (b2 == 0xA9) | (b2 == 0xAF))
+    found |= (lead == 0xE2) & (b1 == 0x81) & (b2 == 0x9F)
+    found |= (lead == 0xE3) & (b1 == 0x80) & (b2 == 0x80)
+    return bool(found.any())
+
+
+def _word_edges(data):
+    """Local (starts, ends) of the runs of non-whitespace bytes in data."""
+    word = (~_WS[data]).view(np.int8)
+    edges = np.diff(word, prepend=np.int8(0), append=np.int8(0))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+def _word_byte_spans(mm, lo, hi):
+    """Byte spans of the words (runs of non-whitespace) in [lo, hi)."""
+    if lo >= hi:
+        return _EMPTY, _EMPTY
+    if _has_unicode_space(mm, lo, hi):
+        return _decoded_spans(mm, lo, hi, word_spans)
+    starts, ends = _word_edges(_view(mm, lo, hi))
+    return lo + starts, lo + ends
+
+
+def _paragraph_byte_spans(mm, lo, hi):
+    """Byte spans of the stripped non-blank lines in [lo, hi)."""
+    if _has_unicode_space(mm, lo, hi):
+        return _decoded_spans(mm, lo, hi, paragraph_spans)
+    data = _view(mm, lo, hi)
+    starts, ends = _word_edges(data)
+    # words never contain "\n": a line runs from its first word start to its last word end
+    newlines = np.flatnonzero(data == 10)
+    line_starts = np.concatenate(([0], newlines + 1))
+    line_ends = np.append(newlines, len(data))
+    first = np.searchsorted(starts, line_starts)
+    stop = np.searchsorted(ends, line_ends, side="right")
+    keep = stop > first
+    return lo + starts[first[keep]], lo + ends[stop[keep] - 1]
+
+
+# ------------------------------
+# 🔹 Worker tasks
+# ------------------------------
+def _count_task(path, lo, hi, words):
+    """Pass 1: characters (and words) in [lo, hi)."""
+    with _mapped(path) as mm:
+        n_chars = int(np.count_nonzero((_view(mm, lo, hi) & 0xC0) != 0x80))
+        n_words = len(_word_byte_spans(mm, lo, hi)[0]) if words else None
+    return n_chars, n_words
+
+
+def _windows_task(path, lo, char_lo, char_hi, size, step):
+    """Pass 2 of fixed_size / sliding_window: windows starting in [char_lo, char_hi)."""
+    starts = np.arange(-(-char_lo // step) * step, char_hi, step, dtype=np.int64)
+    if not len(starts):
+        return _EMPTY, _EMPTY, _EMPTY, _EMPTY
+    with _mapped(path) as mm:
+        byte_starts, _ = _char_to_byte(mm, lo, char_lo, starts)
+        byte_ends, ends = _char_to_byte(mm, lo, char_lo, starts + size)
+    return starts, ends, byte_starts, byte_ends
+
+
+def _paragraph_task(path, lo, hi, char_lo):
+    with _mapped(path) as mm:
+        byte_starts, byte_ends = _paragraph_byte_spans(mm, lo, hi)
+        char_starts = _to_chars(mm, lo, hi, char_lo, byte_starts)
+        char_ends = _to_chars(mm, lo, hi, char_lo, byte_ends)
+    return char_starts, char_ends, byte_starts, byte_ends
+
+
+def _lookahead_end(mm, pos, need):
+    """End byte of the need-th word after pos (or of the last word of the file)."""
+    step, size = 1 << 16, len(mm)
+    while True:
+        hi = _after_space(mm, pos + step) if pos + step < size else size
+        _, ends = _word_byte_spans(mm, pos, hi)
+        if len(ends) >= need:
+            return int(ends[need - 1])
+        if hi == size:
+            return int(ends[-1]) if len(ends) else None
+        step *= 4
+
+
+def _word_task(path, lo, hi, char_lo, n_chars, skip, size):
+    """Pass 2 of word chunking: groups of `size` words whose first word is in [lo, hi)."""
+    with _mapped(path) as mm:
+        starts, ends = _word_byte_spans(mm, lo, hi)
+        firsts = np.arange(skip, len(starts), size)
+        if not len(firsts):
+            return _EMPTY, _EMPTY, _EMPTY, _EMPTY
+        lasts = firsts + size - 1
+        byte_starts = starts[firsts]
+        byte_ends = ends[np.minimum(lasts, len(ends) - 1)]
+        char_starts = _to_chars(mm, lo, hi, char_lo, byte_starts)
+        char_ends = _to_chars(mm, lo, hi, char_lo, byte_ends)
+        # Only the last group can run on into the following ranges
+        if lasts[-1] >= len(ends):
+            end = _lookahead_end(mm, hi, int(lasts[-1]) - len(ends) + 1)
+            if end is not None:
+                byte_ends[-1] = end
+                char_ends[-1] = _to_chars(mm, hi, end, char_lo + n_chars, np.array([end]))[0]
+    return char_starts, char_ends, byte_starts, byte_ends
+
+
+class _Done:
+    """Result holder with the Future interface, for workers=1."""
+
+    def __init__(self, value):
+        self._value = value
+
+    def result(self):
+        return self._value
+
+
+def _window_params(strategy, params):
+    if strategy == "fixed_size":
+        size = params.get("chunk_size", 50)
+        return size, size
+    size, overlap = params.get("window_size", 50), params.get("overlap", 10)
+    if size - overlap <= 0:
+        raise ValueError("⚠️ overlap must be smaller than window_size")
+    return size, size - overlap
+
+
+def iter_mmap_spans(path, strategy="fixed_size", params=None, workers=None,
+                    range_bytes=DEFAULT_RANGE_BYTES, report=None):
+    """
+    Chunk the file at `path` with one of STRATEGIES on `workers` processes.
+    Yields (char_starts, char_ends, byte_starts, byte_ends) int64 arrays
+    per byte range, in file order. params: the strategy's keyword
+    arguments (chunk_size / window_size, overlap). If `report` is a dict
+    it gets sizes, chunk count and throughput at the end.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"⚠️ Unknown strategy: {strategy} (use one of {STRATEGIES})")
+    params = dict(params or {})
+    if strategy in ("fixed_size", "sliding_window"):
+        size, step = _window_params(strategy, params)
+    elif strategy == "word":
+        size = params.get("chunk_size", 5)
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    with _mapped(path) as mm:
+        ranges = byte_ranges(mm, range_bytes, _ALIGN[strategy]) if len(mm) else []
+    n_chunks = 0
+
+    pool = None
+    if workers > 1 and len(ranges) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(workers)
+
+    def submit(fn, *args):
+        return pool.submit(fn, path, *args) if pool else _Done(fn(path, *args))
+
+    try:
+        in_flight = 2 * workers
+        counts = deque(submit(_count_task, lo, hi, strategy == "word") for lo, hi in ranges[:in_flight])
+        pending = deque()
+        char_lo = words_before = 0
+        for i, (lo, hi) in enumerate(ranges):
+            n_chars, n_words = counts.popleft().result()
+            if i + in_flight < len(ranges):
+                counts.append(submit(_count_task, *ranges[i + in_flight], strategy == "word"))
+            if strategy == "paragraph":
+                pending.append(submit(_paragraph_task, lo, hi, char_lo))
+            elif strategy == "word":
+                pending.append(submit(_word_task, lo, hi, char_lo, n_chars, -words_before % size, size))
+                words_before += n_words
+            else:
+                pending.append(submit(_windows_task, lo, char_lo, char_lo + n_chars, size, step))
+            char_lo += n_chars
+            while len(pending) > in_flight or pending and i == len(ranges) - 1:
+                spans = pending.popleft().result()
+                n_chunks += len(spans[0])
+                yield spans
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
+
+    if report is not None:
+        wall = time.perf_counter() - start
+        n_bytes = ranges[-1][1] if ranges else 0
+        report.update({"strategy": strategy, "workers": workers if pool else 1, "ranges": len(ranges),
+                       "bytes": n_bytes, "chunks": n_chunks, "wall_seconds": wall,
+                       "mb_per_s": n_bytes / (wall or 1e-9) / 1e6})
+
+
+def iter_mmap_chunking(path, strategy="fixed_size", params=None, workers=None,
+                       range_bytes=DEFAULT_RANGE_BYTES, report=None):
+    """
+    Same chunks as SpanChunker(text).<strategy>_chunking(**params) on the
+    whole file, as metadata dicts, without ever loading the whole file.
+    """
+    join_words = strategy == "word"
+    with _mapped(path) as mm:
+        for char_starts, char_ends, byte_starts, byte_ends in iter_mmap_spans(
+                path, strategy, params, workers, range_bytes, report):
+            for s, e, b0, b1 in zip(char_starts.tolist(), char_ends.tolist(),
+                                    byte_starts.tolist(), byte_ends.tolist()):
+                chunk = mm[b0:b1].decode("utf-8")
+                yield {
+                    "chunk_text": " ".join(chunk.split()) if join_words else chunk,
+                    "start_index": s,
+                    "end_index": e,
+                    "token_count": None
+                }
+
+
+# ------------------------------
+# 🔹 Example usage:
+# ------------------------------
+if __name__ == "__main__":
+    import sys
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "TempFiles", "InputFile", "SampleInput_1.txt")
+    strategy = sys.argv[2] if len(sys.argv) > 2 else "paragraph"
+    report = {}
+    n = sum(len(spans[0]) for spans in iter_mmap_spans(path, strategy, report=report))
+    print(f"{strategy}: {n} chunks from {report['bytes'] / 1e6:.1f} MB in {report['ranges']} ranges, "
+          f"{report['mb_per_s']:.1f} MB/s on {report['workers']} workers")
@@ -0,0 +1,140 @@
+import threading
+import time
+
+import ChunkMetrics
+
+# ------------------------------
+# 🔹 Process-wide model registry
+# ------------------------------
+# spaCy pipelines, tiktoken encoders and punkt tokenizers are loaded once
+# per process, the first time a strategy asks for them, and then shared by
+# every TextChunker (and every thread).
+
+_models = {}            # key -> loaded object
+_stats = {}             # key -> {"loads", "load_seconds", "hits"}
+_key_locks = {}         # key -> lock held while that key is loading
+_lock = threading.Lock()
+_warmup_hooks = []
+
+
+def _get(key, loader):
+    model = _models.get(key)
+    if model is not None:
+        _stats[key]["hits"] += 1
+        return model
+    with _lock:
+        key_lock = _key_locks.setdefault(key, threading.Lock())
+    # Only callers of the same key wait for the load, other models stay available
+    with key_lock:
+        model = _models.get(key)
+        if model is not None:
+            _stats[key]["hits"] += 1
+            return model
+        start = time.perf_counter()
+        model = loader()
+        elapsed = time.perf_counter() - start
+        stat = _stats.setdefault(key, {"loads": 0, "load_seconds": 0.0, "hits": 0})
+        stat["loads"] += 1
+        stat["load_seconds"] += elapsed
+        _models[key] = model
+        ChunkMetrics.model_loaded(_key_name(key), elapsed)
+        return model
+
+
+def get_nlp(name="en_core_web_sm", disable=(), exclude=(), enable=()):
+    """
+    Shared spaCy pipeline. Pipelines loaded with different disable/exclude/
+    enable lists are cached separately. Raises OSError if the model is missing.
+    """
+    key = _nlp_key(name, disable, exclude, enable)
+
+    def load():
+        import spacy
+        return spacy.load(name, disable=list(key[2]), exclude=list(key[3]), enable=list(key[4]))
+    return _get(key, load)
+
+
+def _nlp_key(name, disable=(), exclude=(), enable=()):
+    return ("spacy", name, tuple(sorted(disable)), tuple(sorted(exclude)), tuple(sorted(enable)))
+
+
+def get_encoder(model="gpt-3.5-turbo"):
+    """Shared tiktoken encoder for a model name."""
+    def load():
+        import tiktoken
+        return tiktoken.encoding_for_model(model)
+    return _get(("tiktoken", model), load)
+
+
+def get_punkt(language="english"):
+    """Shared punkt sentence tokenizer (same one nltk.sent_tokenize uses)."""
+    def load():
+        from nltk.tokenize.punkt import PunktTokenizer
+        return PunktTokenizer(language)
+    return _get(("punkt", language), load)
+
+
+def get_cached(key, loader):
+    """Shared slot for any other expensive object, loaded once by `loader()`."""
+    return _get(key, loader)
+
+
+def is_loaded(key):
+    """
+    True if the model under `key` is already loaded, e.g. ("punkt",
+    "english"), ("tiktoken", model) or a get_cached key.
+    """
+    return key in _models
+
+
+def nlp_loaded(name="en_core_web_sm", disable=(), exclude=(), enable=()):
+    """True if get_nlp with these arguments returns without loading."""
+    return is_loaded(_nlp_key(name, disable, exclude, enable))
+
+
+# ------------------------------
+# 🔹 Warmup and stats
+# ------------------------------
+def add_warmup_hook(hook):
+    """Register a callable to run (once) by warmup(), e.g. a custom model load."""
+    _warmup_hooks.append(hook)
+
+
+def warmup(sentence_pipelines=("parser",), encoders=("gpt-3.5-turbo",), punkt=("english",), nlp=()):
+    """
+    Load the given models now (at service start) instead of on the first
+    request, then run the registered warmup hooks. Returns stats().
+    sentence_pipelines: SpanChunking.SENTENCE_PIPELINES, loaded the way
+    semantic chunking loads them (sentence_nlp), so it finds them warm.
+    encoders: tiktoken models, with the token byte lengths token chunking uses.
+    nlp: full spaCy pipelines by name, for code that calls get_nlp itself.
+    """
+    from SpanChunking import sentence_nlp, token_byte_lengths
+    for pipeline in sentence_pipelines:
+        sentence_nlp(pipeline)
+    for name in nlp:
+        get_nlp(name)
+    for model in encoders:
+        token_byte_lengths(get_encoder(model))
+    for language in punkt:
+        get_punkt(language)
+    while _warmup_hooks:
+        _warmup_hooks.pop(0)()
+    return stats()
+
+
+def stats():
+    """Load count, total load time and cache hits per loaded model."""
+    return {_key_name(key): dict(stat) for key, stat in _stats.items()}
+
+
+def _key_name(key):
+    return ":".join(str(part) for part in key if part != ())
+
+
+def clear():
+    """Forget every loaded model (mainly for tests and benchmarks)."""
+    with _lock:
+        _models.clear()
+        _stats.clear()
+        _key_locks.clear()
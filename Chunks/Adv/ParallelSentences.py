@@ -0,0 +1,123 @@
+import os
+import re
+
+from ModelRegistry import get_punkt
+
+# ------------------------------
+# 🔹 Parallel punkt sentence segmentation
+# ------------------------------
+# punkt decides every potential sentence end from a short context: the
+# word with the punctuation, the punctuation itself and the next token
+# (plus the realignment of closing quotes / brackets with the sentence
+# after). So the text can be cut where the serial tokenizer itself ends
+# one sentence and starts the next, and every piece segmented on its own.
+#
+# Seams are picked at line breaks near evenly spaced targets. A seam is
+# only used if punkt, run on a small window around it, ends a sentence at
+# the last non-space character before it and starts the next one right
+# at it; otherwise the next line break is tried. The pieces go to a
+# process pool (punkt loaded once per worker), and the spans, shifted by
+# the offset of their piece, are exactly sentence_spans(text).
+#
+#   spans = parallel_sentence_spans(book, workers=8)
+
+DEFAULT_PIECE_CHARS = 1 << 18
+_CONTEXT_CHARS = 512            # text on each side of a seam used to check it
+# A line break with the whitespace around it, after some text
+_SEAM_RE = re.compile(r"(?<=\S)\s*\n\s*")
+_SPACE_RE = re.compile(r"\s")
+
+
+def _init_worker(language):
+    get_punkt(language)
+
+
+def _piece_spans(piece, offset, language):
+    """Runs in a worker: punkt spans of one piece, shifted to text offsets."""
+    return [(offset + s, offset + e) for s, e in get_punkt(language).span_tokenize(piece)]
+
+
+def _is_seam(tokenizer, text, end, pos):
+    """True if serial punkt ends a sentence at `end` and starts the next one at `pos`."""
+    lo = max(0, end - _CONTEXT_CHARS)
+    if lo:
+        # start the window on a word boundary, well before the word that ends the sentence
+        m = _SPACE_RE.search(text, lo, end)
+        if m is None:
+            return False
+        lo = m.end()
+    hi = min(len(text), pos + _CONTEXT_CHARS)
+    if hi < len(text):
+        m = _SPACE_RE.search(text, hi)
+        hi = m.start() if m else len(text)
+    starts, ends = set(), set()
+    for s, e in tokenizer.span_tokenize(text[lo:hi]):
+        starts.add(lo + s)
+        ends.add(lo + e)
+    return end in ends and pos in starts
+
+
+def sentence_seams(text, n_pieces, language="english", min_piece_chars=DEFAULT_PIECE_CHARS):
+    """Offsets (ascending, without 0) where the text can be cut for sentence segmentation."""
+    tokenizer = get_punkt(language)
+    n_pieces = min(n_pieces, len(text) // max(min_piece_chars, 1))
+    seams = []
+    for k in range(1, n_pieces):
+        target = max(k * len(text) // n_pieces, seams[-1] + min_piece_chars if seams else 0)
+        limit = target + len(text) // n_pieces // 2
+        for m in _SEAM_RE.finditer(text, target):
+            if m.start() > limit or m.end() >= len(text):
+                break
+            if _is_seam(tokenizer, text, m.start(), m.end()):
+                seams.append(m.end())
+                break
+    return seams
+
+
+def parallel_sentence_spans(text, language="english", workers=None,
+                            min_piece_chars=DEFAULT_PIECE_CHARS, executor=None):
+    """
+    Same spans as sentence_spans(text, language), computed on `workers`
+    processes. Texts shorter than two pieces are segmented serially.
+    executor: an existing pool to use instead of starting one.
+    """
+    workers = workers or os.cpu_count() or 1
+    seams = sentence_seams(text, 4 * workers, language, min_piece_chars) if workers > 1 else []
+    if not seams:
+        return _piece_spans(text, 0, language)
+    bounds = list(zip([0] + seams, seams + [len(text)]))
+
+    pool = executor
+    if pool is None:
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(language,))
+    try:
+        futures = [pool.submit(_piece_spans, text[lo:hi], lo, language) for lo, hi in bounds]
+        spans = []
+        for future in futures:
+            spans.extend(future.result())
+    finally:
+        if executor is None:
+            pool.shutdown(cancel_futures=True)
+    return spans
+
+
+# ------------------------------
+# 🔹 Example usage:
+# ------------------------------
+if __name__ == "__main__":
+    import sys
+    import time
+    from SpanChunking import sentence_spans
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "TempFiles", "InputFile", "SampleInput_1.txt")
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    t = time.perf_counter()
+    serial = sentence_spans(text)
+    t_serial = time.perf_counter() - t
+    t = time.perf_counter()
+    parallel = parallel_sentence_spans(text, min_piece_chars=1 << 14)
+    t_parallel = time.perf_counter() - t
+    print(f"{len(serial)} sentences, serial {t_serial:.2f}s, parallel {t_parallel:.2f}s, "
+          f"identical: {serial == parallel}")
@@ -0,0 +1,104 @@
+import re
+
+# ------------------------------
+# 🔹 Rule-based sentence splitter
+# ------------------------------
+# Compiled regexes find the sentence ends in one pass each: runs of
+# . ! ? … (with closing quotes / brackets after them) followed by
+# whitespace, and blank lines. The rules below are lookarounds of those
+# regexes, so rejected candidates cost no Python code. No model is
+# loaded and nothing but `re` is imported:
+# - the next sentence must not start with a lowercase letter
+#   ("Really?" she asked.  /  approx. three)
+# - a single "." after an abbreviation (Dr. Smith, e.g. this, Fig. 3),
+#   an initial (J. Smith) or a dotted acronym (U.S. Army) is not an end
+# - decimals and dotted names (3.14, example.com) never match, as no
+#   whitespace follows their "."
+# - a blank line always ends a sentence, so headings and list items
+#   without final punctuation stand alone
+# Spans are stripped like punkt's: text[start:end] has no surrounding
+# whitespace and keeps its closing quotes. Unlike punkt, a sentence is
+# never ended before a lowercase word, and blank lines always end one.
+
+# Words that are (almost) never the last word of a sentence when followed by "."
+ABBREVIATIONS = frozenset("""
+    mr mrs ms dr prof sr jr st mt ft rev hon fr sen rep gov gen col lt sgt capt cmdr adm
+    e.g i.e cf vs viz al approx ca no nos fig figs eq eqs p pp vol vols ch sec art ed eds
+    jan feb mar apr jun jul aug sep sept oct nov dec dept univ est inc ltd co corp
+""".split())
+
+_TERMINATORS = ".!?…"
+_CLOSERS = "\")]}'’”»"
+_OPENERS = "\"'([{‘“«"
+_BLANK_LINE_RE = re.compile(r"\n[^\S\n]*\n\s*")
+_SPACE_RUN_RE = re.compile(r"\s*")
+_end_res = {}
+
+
+def _end_res_for(abbreviations):
+    """
+    One regex per terminator character. Each starts with its literal
+    character, so the regex engine jumps between candidates instead of
+    trying every position, and carries the rules as lookarounds. Group 1
+    spans the whitespace between the sentence end and the next sentence.
+    """
+    key = frozenset(abbreviations)
+    regexes = _end_res.get(key)
+    if regexes is None:
+        run, closers, openers = (re.escape(chars) for chars in (_TERMINATORS, _CLOSERS, _OPENERS))
+        # after a single ".": no abbreviation, initial (J.) or dotted acronym (U.S.)
+        # (one lookbehind per word length: a lookbehind must have a fixed width)
+        lengths = sorted({len(word) for word in key})
+        not_abbreviation = "(?i:%s)" % "".join(
+            [r"(?<!\b(?:%s)\.)" % "|".join(re.escape(w) for w in sorted(key) if len(w) == n) for n in lengths]
+            + [r"(?<!\b[^\W\d_]\.)", r"(?<!\.[^\W\d_]\.)"])
+        tail = rf"[{closers}]*(?=\s|\Z)(?!\s+[{openers}]*[a-z])(\s*)"
+        regexes = [re.compile(rf"\.(?:[{run}]+|{not_abbreviation}){tail}")]
+        regexes += [re.compile(rf"{re.escape(c)}[{run}]*{tail}") for c in _TERMINATORS[1:]]
+        _end_res[key] = regexes
+    return regexes
+
+
+def rule_sentence_spans(text, abbreviations=ABBREVIATIONS):
+    """(start, end) of every sentence of `text`, found with the rules above."""
+    # (end of a sentence, start of the next, ended by a blank line)
+    cuts = set()
+    for regex in _end_res_for(abbreviations):
+        cuts.update((*m.span(1), False) for m in regex.finditer(text))
+    cuts.update((m.start(), m.end(), True) for m in _BLANK_LINE_RE.finditer(text))
+
+    n = len(text)
+    start = _SPACE_RUN_RE.match(text).end()
+    spans = []
+    for end, after, blank in sorted(cuts):
+        if end <= start:
+            start = max(start, after)
+            continue
+        if not blank and after < n and text[after] >= "\x80" and text[after].islower():
+            continue            # the lookahead only knows ASCII lowercase
+        while text[end - 1].isspace():
+            end -= 1
+        spans.append((start, end))
+        start = after
+    end = n
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    if end > start:
+        spans.append((start, end))
+    return spans
+
+
+def rule_sentences(text, abbreviations=ABBREVIATIONS):
+    """Sentence strings, like nltk.sent_tokenize(text)."""
+    return [text[s:e] for s, e in rule_sentence_spans(text, abbreviations)]
+
+
+# ------------------------------
+# 🔹 Example usage:
+# ------------------------------
+if __name__ == "__main__":
+    sample = ('Dr. Smith arrived at 3.45 p.m. from the U.S. office. "Is it done?" she asked. '
+              "It was... Mostly! See Fig. 2 for details (e.g. the error rates).\n\n"
+              "Results\n\nAccuracy rose to 97.5% overall.")
+    for sentence in rule_sentences(sample):
+        print(repr(sentence))
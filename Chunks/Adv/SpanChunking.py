@@ -0,0 +1,899 @@
+import functools
+import os
+import re
+from array import array
+from itertools import chain
+from ChunkMetrics import instrumented, phase
+from ChunkSet import ChunkSet
+from ModelRegistry import get_cached, get_encoder, get_nlp, get_punkt, is_loaded, nlp_loaded
+
+# nltk, spaCy, tiktoken and numpy are only imported (through ModelRegistry
+# or inside the functions) when a strategy that needs them first runs.
+
+# ------------------------------
+# 🔹 Span functions
+# ------------------------------
+# Every strategy first produces (start, end) character spans into the
+# original text. Chunk strings are only cut out of the text when the
+# metadata is built, so offsets are exact by construction and no
+# `text.find` is needed to recover them.
+
+_WORD_RE = re.compile(r"\S+")
+# A non-blank line without its leading/trailing whitespace (== line.strip())
+_PARAGRAPH_RE = re.compile(r"\S(?:[^\n]*\S)?")
+_word_group_res = {}
+
+
+def _word_group_re(chunk_size):
+    """Regex matching up to `chunk_size` consecutive words in one go."""
+    regex = _word_group_res.get(chunk_size)
+    if regex is None:
+        regex = re.compile(r"\S+(?:\s+\S+){0,%d}" % (chunk_size - 1))
+        _word_group_res[chunk_size] = regex
+    return regex
+
+
+def strip_span(text, start, end):
+    """Shrink (start, end) so text[start:end] == text[start:end].strip()."""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+def word_spans(text):
+    return [m.span() for m in _WORD_RE.finditer(text)]
+
+
+def word_chunk_spans(text, chunk_size=5):
+    return [m.span() for m in _word_group_re(chunk_size).finditer(text)]
+
+
+# Sentence splitters of sentence_chunking: nltk punkt, or the regex rules of RuleSentences
+SENTENCE_SPLITTERS = ("punkt", "rules")
+
+
+def sentence_spans(text, language="english"):
+    return list(get_punkt(language).span_tokenize(text))
+
+
+def paragraph_spans(text):
+    return [m.span() for m in _PARAGRAPH_RE.finditer(text)]
+
+
+def fixed_size_spans(text, chunk_size=50):
+    n = len(text)
+    return [(i, min(i + chunk_size, n)) for i in range(0, n, chunk_size)]
+
+
+def sliding_window_spans(text, window_size=50, overlap=10):
+    step = window_size - overlap
+    if step <= 0:
+        raise ValueError("⚠️ overlap must be smaller than window_size")
+    n = len(text)
+    return [(i, min(i + window_size, n)) for i in range(0, n, step)]
+
+
+def semantic_spans(doc):
+    """Sentence spans of a spaCy Doc, stripped like sent.text.strip()."""
+    text = doc.text
+    spans = []
+    for sent in doc.sents:
+        start, end = strip_span(text, sent.start_char, sent.end_char)
+        if start < end:
+            spans.append((start, end))
+    return spans
+
+
+# ------------------------------
+# 🔹 Sentence pipelines for semantic chunking
+# ------------------------------
+# Sentence boundaries in en_core_web_sm come from the parser, which only
+# needs tok2vec. The other components are excluded, so the spans are the
+# same as with the full pipeline at a fraction of the cost.
+SENTENCE_PIPELINES = ("parser", "senter", "sentencizer")
+_NON_SENTENCE_PIPES = ("tagger", "attribute_ruler", "lemmatizer", "ner")
+
+
+def sentence_nlp(pipeline="parser", name="en_core_web_sm"):
+    """
+    spaCy pipeline that only finds sentences:
+    - "parser": dependency parser boundaries (same spans as the full model)
+    - "senter": the model's statistical sentence recognizer, much faster
+    - "sentencizer": punctuation rules on a blank pipeline, no model needed
+    """
+    if pipeline == "parser":
+        return get_nlp(name, exclude=_NON_SENTENCE_PIPES)
+    if pipeline == "senter":
+        def load():
+            import spacy
+            nlp = spacy.load(name, exclude=_NON_SENTENCE_PIPES + ("parser",), enable=["tok2vec", "senter"])
+            if "tok2vec" in nlp.pipe_names and "senter" not in nlp.get_pipe("tok2vec").listening_components:
+                nlp.disable_pipe("tok2vec")
+            return nlp
+        return get_cached(("spacy-senter", name), load)
+    if pipeline == "sentencizer":
+        def load():
+            import spacy
+            nlp = spacy.blank("en")
+            nlp.add_pipe("sentencizer")
+            return nlp
+        return get_cached(("spacy-sentencizer", "en"), load)
+    raise ValueError(f"⚠️ Unknown sentence pipeline: {pipeline} (use one of {SENTENCE_PIPELINES})")
+
+
+def sentence_nlp_loaded(pipeline="parser", name="en_core_web_sm"):
+    """True if sentence_nlp(pipeline, name) returns without loading a model."""
+    if pipeline == "parser":
+        return nlp_loaded(name, exclude=_NON_SENTENCE_PIPES)
+    if pipeline == "senter":
+        return is_loaded(("spacy-senter", name))
+    return is_loaded(("spacy-sentencizer", "en"))
+
+
+def iter_semantic_spans(texts, batch_size=64, n_process=1, pipeline="parser"):
+    """
+    Sentence spans for many documents, streamed through nlp.pipe in
+    batches (and over n_process worker processes). Yields one span list
+    per text, in input order.
+    """
+    for doc in sentence_nlp(pipeline).pipe(texts, batch_size=batch_size, n_process=n_process):
+        yield semantic_spans(doc)
+
+
+def token_byte_lengths(enc):
+    """
+    numpy array with the UTF-8 byte length of every token id of `enc`.
+    Built once per encoder, it turns tokens into byte offsets with a
+    single cumulative sum instead of decoding them.
+    """
+    def build():
+        import numpy as np
+        lengths = np.zeros(enc.n_vocab, dtype=np.int64)
+        for token in range(enc.n_vocab):
+            try:
+                lengths[token] = len(enc.decode_single_token_bytes(token))
+            except KeyError:
+                pass    # unused id between the regular and special tokens
+        return lengths
+    return get_cached(("token_bytes", enc.name), build)
+
+
+def spans_from_tokens(text, tokens, enc, chunk_size=50):
+    """
+    Split `tokens` (the encoding of `text`) into windows of `chunk_size`
+    tokens and return their (start, end, token_count) character spans.
+
+    Byte offsets come from one cumulative sum over the token byte lengths.
+    A window that would end inside a multi-byte character is shortened to
+    the previous character boundary, so every chunk is a valid slice of
+    the source and holds at most `chunk_size` tokens. The one exception is
+    a character encoded to more tokens than that (a CJK character or an
+    emoji can take 2-4 byte tokens, e.g. with chunk_size=1): it becomes a
+    chunk of its own, with its full token_count.
+    """
+    import numpy as np
+    tokens = np.asarray(tokens, dtype=np.int64)
+    n = len(tokens)
+    if n == 0:
+        return []
+    ends = np.cumsum(token_byte_lengths(enc)[tokens])
+    if text.isascii():
+        cont = None     # 1 byte == 1 char, every byte offset is a boundary
+    else:
+        data = np.frombuffer(text.encode("utf-8"), dtype=np.uint8)
+        cont = np.append((data & 0xC0) == 0x80, False)  # continuation bytes
+
+    # Token index where each window ends. Windows are laid out in bulk
+    # (up to 4096 at a time) and only re-laid out after a window that had
+    # to be moved because it ended inside a character.
+    if cont is None:
+        ks = np.minimum(np.arange(chunk_size, n + chunk_size, chunk_size), n)
+        cuts, k0 = [ks], n
+    else:
+        cuts, k0 = [], 0
+    while k0 < n:
+        ks = np.minimum(np.arange(k0 + chunk_size, min(n, k0 + 4096 * chunk_size) + chunk_size, chunk_size), n)
+        bad = np.flatnonzero(cont[ends[ks - 1]])
+        if not len(bad):
+            cuts.append(ks)
+            k0 = int(ks[-1])
+            continue
+        j = bad[0]
+        cuts.append(ks[:j])
+        start, k = (ks[j - 1] if j else k0), int(ks[j])
+        while cont[ends[k - 1]] and k - 1 > start:
+            k -= 1
+        while cont[ends[k - 1]]:        # one character wider than chunk_size tokens
+            k += 1
+        cuts.append([k])
+        k0 = k
+    ks = np.concatenate(cuts).astype(np.int64)
+
+    byte_ends = ends[ks - 1]
+    counts = np.diff(ks, prepend=0)
+    if cont is None:
+        char_ends = byte_ends
+    else:
+        byte_starts = np.concatenate(([0], byte_ends[:-1]))
+        chars = np.diff(byte_ends, prepend=0) - np.add.reduceat(cont[:-1], byte_starts, dtype=np.int64)
+        char_ends = np.cumsum(chars)
+    char_starts = np.concatenate(([0], char_ends[:-1]))
+    return list(zip(char_starts.tolist(), char_ends.tolist(), counts.tolist()))
+
+
+def token_spans(text, chunk_size=50, model="gpt-3.5-turbo"):
+    enc = get_encoder(model)
+    return spans_from_tokens(text, enc.encode_to_numpy(text), enc, chunk_size)
+
+
+def group_spans(spans, size):
+    """Every `size` consecutive spans merged into one (first start, last end)."""
+    n = len(spans)
+    return [(spans[i][0], spans[min(i + size, n) - 1][1]) for i in range(0, n, size)]
+
+
+def recursive_spans(text, max_chars=60, paragraphs=None):
+    spans = []
+    for start, end in paragraph_spans(text) if paragraphs is None else paragraphs:
+        if end - start <= max_chars:
+            spans.append((start, end))
+        else:
+            spans.extend((i, min(i + max_chars, end)) for i in range(start, end, max_chars))
+    return spans
+
+
+# ------------------------------
+# 🔹 Hierarchical recursive splitting
+# ------------------------------
+# Separator cascade, coarsest first: every entry is a regex, "" means a
+# hard cut (every max_size characters or tokens).
+SEPARATORS = (
+    r"\n[ \t\r\f\v]*\n\s*",        # blank line(s)
+    r"\n\s*",                        # line break
+    r"(?<=[.!?])\s+",                 # sentence end
+    r"\s+",                           # whitespace
+    "",                               # character
+)
+_separator_res = {}
+
+
+def _separator_re(pattern):
+    regex = _separator_res.get(pattern)
+    if regex is None:
+        regex = _separator_res[pattern] = re.compile(pattern)
+    return regex
+
+
+def hierarchical_spans(text, max_size=500, separators=SEPARATORS, unit="chars",
+                       model="gpt-3.5-turbo", token_offsets=None):
+    """
+    Recursive splitting with a separator cascade, as (start, end, size).
+
+    A span over `max_size` is split at the coarsest separator that occurs
+    in it; its pieces (stripped of whitespace) are merged back together
+    left to right as long as the merged span stays within max_size, and
+    only pieces that are still too big go down to the next separator.
+    Everything works on offsets into `text` (regex searches with pos /
+    endpos, no substrings), and every level scans each character at most
+    once, so the run time is linear in the text length.
+
+    unit="tokens" measures size while splitting as the number of tokens of
+    the whole text (token_offsets, e.g. Document.token_offsets) that start
+    in the span. That is only an estimate of the span encoded on its own,
+    so every chunk is then re-encoded: its size is the exact token count,
+    and chunks over the limit are split again.
+    """
+    from bisect import bisect_left
+    if max_size < 1:
+        raise ValueError("⚠️ max_size must be at least 1")
+    patterns = [_separator_re(p) if p else None for p in separators]
+    enc = None
+    if unit == "chars":
+        def size(start, end):
+            return end - start
+    elif unit == "tokens":
+        enc = get_encoder(model)
+        if token_offsets is None:
+            token_offsets = Document(text).token_offsets(model)
+        offsets = token_offsets.tolist() if hasattr(token_offsets, "tolist") else list(token_offsets)
+
+        def size(start, end):
+            return bisect_left(offsets, end) - bisect_left(offsets, start)
+    else:
+        raise ValueError(f"⚠️ Unknown unit: {unit} (use 'chars' or 'tokens')")
+
+    def hard_cut(start, end, budget, out):
+        if enc is None:
+            out.extend((i, min(i + budget, end)) for i in range(start, end, budget))
+            return
+        cuts = offsets[bisect_left(offsets, start):bisect_left(offsets, end)][budget::budget]
+        # the tokens of one multi-byte character share its offset
+        bounds = list(dict.fromkeys([start] + cuts + [end]))
+        out.extend((s, e) for s, e in zip(bounds[:-1], bounds[1:]) if s < e)
+
+    def split(start, end, level, budget, out):
+        if size(start, end) <= budget:
+            out.append((start, end))
+            return
+        # the coarsest separator that actually splits this span
+        while level < len(patterns) and patterns[level] is not None:
+            pieces, prev = [], start
+            for m in patterns[level].finditer(text, start, end):
+                s, e = strip_span(text, prev, m.start())
+                if s < e:
+                    pieces.append((s, e))
+                prev = m.end()
+            s, e = strip_span(text, prev, end)
+            if s < e:
+                pieces.append((s, e))
+            if len(pieces) > 1:
+                break
+            level += 1
+        else:
+            hard_cut(start, end, budget, out)
+            return
+        group = None
+        for s, e in pieces:
+            if size(s, e) > budget:
+                if group:
+                    out.append(group)
+                    group = None
+                split(s, e, level + 1, budget, out)
+            elif group and size(group[0], e) <= budget:
+                group = (group[0], e)
+            else:
+                if group:
+                    out.append(group)
+                group = (s, e)
+        if group:
+            out.append(group)
+
+    def fit(start, end, budget, out):
+        spans = []
+        split(start, end, 0, budget, spans)
+        for s, e in spans:
+            n = estimate = size(s, e)
+            if enc is not None:
+                n = len(enc.encode(text[s:e], disallowed_special=()))
+                # over the limit: split it again with a budget it cannot meet whole
+                smaller = min(budget - (n - max_size), estimate - 1)
+                if n > max_size and smaller >= 1:
+                    fit(s, e, smaller, out)
+                    continue
+                if n > max_size:
+                    # one whole-text token, more once encoded alone: exact windows
+                    piece = text[s:e]
+                    out.extend((s + ps, s + pe, c) for ps, pe, c in spans_from_tokens(
+                        piece, enc.encode_to_numpy(piece, disallowed_special=()), enc, max_size))
+                    continue
+            out.append((s, e, n))
+
+    result = []
+    start, end = strip_span(text, 0, len(text))
+    if start < end:
+        fit(start, end, max_size, result)
+    return result
+
+
+def sentence_token_counts(text, sentences, enc):
+    """
+    numpy array with the token count of every sentence, each encoded
+    together with the whitespace before it (one encode_batch call).
+    """
+    import numpy as np
+    pieces = [text[prev:end] for prev, (_, end) in zip([0] + [e for _, e in sentences[:-1]], sentences)]
+    return np.fromiter((len(t) for t in enc.encode_batch(pieces, disallowed_special=())),
+                       dtype=np.int64, count=len(pieces))
+
+
+def packed_spans(text, max_tokens=200, overlap=0, model="gpt-3.5-turbo", language="english",
+                 sentences=None, counts=None):
+    """
+    Whole sentences packed into chunks of at most `max_tokens` tokens,
+    as (start, end, token_count). `overlap` sentences are repeated at the
+    start of the next chunk. Sentences over the budget are split into
+    token windows like token_chunking, so a character encoded to more
+    than `max_tokens` tokens is the only chunk that can go over it (see
+    spans_from_tokens). Those windows are re-encoded too, so token_count
+    is the exact count of every chunk.
+
+    Every sentence is encoded together with the whitespace before it, in
+    one encode_batch call; prefix sums of those counts give the size of
+    any run of sentences, so the sentences of a chunk are picked with one
+    searchsorted. That is only an estimate (a word encodes differently
+    without the space before it, and BPE can merge across sentences), so
+    every chunk is then encoded on its own: token_count is its exact
+    count, and the last sentence is dropped while it is over the budget.
+    sentences / counts: precomputed sentence spans and their
+    sentence_token_counts (e.g. from a Document).
+    """
+    import numpy as np
+    if sentences is None:
+        sentences = sentence_spans(text, language)
+    if not sentences:
+        return []
+    enc = get_encoder(model)
+    if counts is None:
+        counts = sentence_token_counts(text, sentences, enc)
+    prefix = np.concatenate(([0], np.cumsum(counts)))
+
+    def windows(start, end, tokens):
+        # token windows of text[start:end], each re-encoded on its own;
+        # a window that grows over the budget that way is split again
+        for s, e, _ in spans_from_tokens(text[start:end], tokens, enc, max_tokens):
+            s, e = start + s, start + e
+            window = enc.encode_to_numpy(text[s:e], disallowed_special=())
+            if len(window) > max_tokens and e - s > 1:
+                windows(s, e, window)
+            else:
+                spans.append((s, e, len(window)))
+
+    spans, i, n = [], 0, len(sentences)
+    while i < n:
+        # last sentence j (exclusive) that fits by the estimate: prefix[j] - prefix[i] <= max_tokens
+        j = int(np.searchsorted(prefix, prefix[i] + max_tokens, side="right")) - 1
+        j = min(max(j, i + 1), n)
+        while True:
+            start, end = sentences[i][0], sentences[j - 1][1]
+            tokens = enc.encode_to_numpy(text[start:end], disallowed_special=())
+            if len(tokens) <= max_tokens or j == i + 1:
+                break
+            j -= 1
+        if len(tokens) > max_tokens:
+            # one sentence over the budget on its own: token windows
+            windows(start, end, tokens)
+            i += 1
+            continue
+        spans.append((start, end, len(tokens)))
+        i = j if j >= n else max(j - overlap, i + 1)
+    return spans
+
+
+# ------------------------------
+# 🔹 Token counts for any strategy
+# ------------------------------
+# count_tokens=True (or a model name) on any strategy sets token_count
+# to the exact encoding of every chunk text with that model, replacing
+# the counts token-based strategies computed while chunking (those can
+# be for another model, and a token window counts the document's tokens
+# inside it, which can differ from encoding the window on its own), so
+# callers never need to re-encode to enforce a context limit.
+# Chunk texts are deduplicated first, since
+# sliding windows, word groups and boilerplate repeat a lot, and the
+# distinct ones are encoded in slices on a shared thread pool: tiktoken
+# releases the GIL while it encodes, and whole slices per task keep the
+# pool overhead far below the encoding time even for tiny chunks.
+_COUNT_SLICE = 256
+_count_pools = {}
+
+
+def _count_slice(enc, texts):
+    return [len(enc.encode_ordinary(text)) for text in texts]
+
+
+def chunk_token_counts(texts, model="gpt-3.5-turbo", threads=None):
+    """Token count of every text in `texts`; identical texts are encoded once."""
+    enc = get_encoder(model)
+    counts = dict.fromkeys(texts)
+    unique = list(counts)
+    threads = threads or os.cpu_count() or 1
+    if threads == 1 or len(unique) <= _COUNT_SLICE:
+        results = [_count_slice(enc, unique)]
+    else:
+        pool = _count_pools.get(threads)
+        if pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+            pool = _count_pools[threads] = ThreadPoolExecutor(threads, thread_name_prefix="token-count")
+        slices = [unique[i:i + _COUNT_SLICE] for i in range(0, len(unique), _COUNT_SLICE)]
+        results = pool.map(_count_slice, [enc] * len(slices), slices)
+    for text, count in zip(unique, chain.from_iterable(results)):
+        counts[text] = count
+    return [counts[text] for text in texts]
+
+
+def fill_token_counts(chunks, model="gpt-3.5-turbo", threads=None, overwrite=True):
+    """
+    Set the token counts of a ChunkSet or a metadata dict list to the
+    exact counts for `model`, in place. overwrite=False only fills the
+    missing ones.
+    """
+    if hasattr(chunks, "starts"):
+        if overwrite or chunks.token_counts is None:
+            chunks.token_counts = array("q", chunk_token_counts(chunks.texts(), model, threads))
+        return chunks
+    todo = chunks if overwrite else [chunk for chunk in chunks if chunk["token_count"] is None]
+    counts = chunk_token_counts([chunk["chunk_text"] for chunk in todo], model, threads)
+    for chunk, count in zip(todo, counts):
+        chunk["token_count"] = count
+    return chunks
+
+
+def token_counted(method):
+    """Gives a strategy method a count_tokens=False|True|model name option (see above)."""
+    @functools.wraps(method)
+    def wrapper(self, *args, count_tokens=False, **kwargs):
+        chunks = method(self, *args, **kwargs)
+        if count_tokens:
+            with phase("count_tokens"):
+                fill_token_counts(chunks, "gpt-3.5-turbo" if count_tokens is True else count_tokens)
+        return chunks
+    return wrapper
+
+
+# ------------------------------
+# 🔹 Shared document analysis
+# ------------------------------
+# A Document holds every analysis of one text that the strategies are
+# built from: word, sentence and paragraph spans, spaCy Docs, tiktoken
+# token ids and offsets. Each one is computed the first time it is asked
+# for and then kept, so running several strategies (or one strategy with
+# several parameter sets) on the same text pays for every tokenization
+# once; the chunkings themselves are span arithmetic on top.
+#
+#   chunker = SpanChunker(text)
+#   a = chunker.sentence_chunking()
+#   b = chunker.packed_chunking(100)       # reuses the sentence spans
+#   c = chunker.packed_chunking(300)       # reuses the token counts too
+
+
+class Document:
+    """Lazily computed, memoized analyses of `text`."""
+
+    def __init__(self, text):
+        self.text = text
+        self._cache = {}
+
+    def _get(self, key, compute):
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = compute()
+            return value
+
+    def words(self):
+        """(start, end) of every whitespace-separated word."""
+        return self._get("words", lambda: word_spans(self.text))
+
+    def word_groups(self, size):
+        """Spans of `size` consecutive words (from words() if already known)."""
+        def compute():
+            words = self._cache.get("words")
+            return word_chunk_spans(self.text, size) if words is None else group_spans(words, size)
+        return self._get(("word_groups", size), compute)
+
+    def sentences(self, language="english", workers=1):
+        """punkt sentence spans; workers > 1 segments long texts in parallel (same spans)."""
+        def compute():
+            if workers == 1:
+                return sentence_spans(self.text, language)
+            from ParallelSentences import parallel_sentence_spans
+            return parallel_sentence_spans(self.text, language, workers)
+        return self._get(("sentences", language), compute)
+
+    def rule_sentences(self):
+        """Sentence spans of the regex splitter in RuleSentences (no model)."""
+        def compute():
+            from RuleSentences import rule_sentence_spans
+            return rule_sentence_spans(self.text)
+        return self._get("rule_sentences", compute)
+
+    def paragraphs(self):
+        """Non-blank lines, stripped."""
+        return self._get("paragraphs", lambda: paragraph_spans(self.text))
+
+    def spacy_doc(self, pipeline="parser"):
+        """spaCy Doc from a SENTENCE_PIPELINES pipeline (OSError if the model is missing)."""
+        return self._get(("spacy", pipeline), lambda: sentence_nlp(pipeline)(self.text))
+
+    def semantic_sentences(self, pipeline="parser"):
+        """Stripped sentence spans of spacy_doc(pipeline)."""
+        return self._get(("semantic", pipeline), lambda: semantic_spans(self.spacy_doc(pipeline)))
+
+    def tokens(self, model="gpt-3.5-turbo"):
+        """tiktoken token ids (numpy) of the whole text."""
+        return self._get(("tokens", model), lambda: get_encoder(model).encode_to_numpy(self.text))
+
+    def token_offsets(self, model="gpt-3.5-turbo"):
+        """
+        Character offset where every token starts (numpy int64). A token
+        that starts inside a multi-byte character gets that character's offset.
+        """
+        def compute():
+            import numpy as np
+            tokens = self.tokens(model)
+            lengths = token_byte_lengths(get_encoder(model))[np.asarray(tokens, dtype=np.int64)]
+            byte_starts = np.cumsum(lengths) - lengths
+            if self.text.isascii():
+                return byte_starts
+            data = np.frombuffer(self.text.encode("utf-8"), dtype=np.uint8)
+            # chars started before each byte offset
+            char_at = np.concatenate(([0], np.cumsum((data & 0xC0) != 0x80)))
+            return char_at[byte_starts + 1] - 1
+        return self._get(("token_offsets", model), compute)
+
+    def sentence_token_counts(self, model="gpt-3.5-turbo", language="english"):
+        """Token count of every punkt sentence with the whitespace before it (see packed_spans)."""
+        return self._get(("sentence_tokens", model, language),
+                         lambda: sentence_token_counts(self.text, self.sentences(language), get_encoder(model)))
+
+
+class SpanChunker:
+    """
+    Metadata chunker built on the span functions above. Every strategy
+    returns a list of dicts with chunk_text, start_index, end_index and
+    token_count, where text[start_index:end_index] is the chunk.
+    token_count is only set by token-based strategies, unless the
+    strategy is called with count_tokens=True (or a tiktoken model name),
+    which sets every chunk's exact count for that model.
+    """
+
+    def __init__(self, text, compact=False):
+        """
+        text: a string, or a Document to share its analyses with other chunkers.
+        compact=True makes every strategy return a ChunkSet (offsets in int
+        arrays, text sliced on access) instead of a list of dicts.
+        """
+        self._document = None
+        if isinstance(text, Document):
+            self._document, text = text, text.text
+        self.text = text
+        self.compact = compact
+        self._embedding_caches = []         # (embedder, EmbeddingCache) of unnamed embedders
+
+    @property
+    def document(self):
+        """Document of self.text; all strategies of this chunker share it."""
+        if self._document is None or self._document.text is not self.text:
+            self._document = Document(self.text)
+        return self._document
+
+    @property
+    def nlp(self):
+        """spaCy pipeline, loaded once per process the first time it is used."""
+        try:
+            return get_nlp("en_core_web_sm")
+        except OSError:
+            print("Please run: python -m spacy download en_core_web_sm")
+            return None
+
+    # 🔹 Helper: Create metadata dictionary
+    def _make_metadata(self, chunk, start_idx, end_idx, token_count=None):
+        return {
+            "chunk_text": chunk,
+            "start_index": start_idx,
+            "end_index": end_idx,
+            "token_count": token_count
+        }
+
+    def _from_spans(self, spans, token_counts=None, join_words=False):
+        with phase("build"):
+            return self._build(spans, token_counts, join_words)
+
+    def _build(self, spans, token_counts, join_words):
+        if self.compact:
+            return ChunkSet.from_spans(self.text, spans, token_counts, join_words)
+        text = self.text
+        if token_counts is None:
+            token_counts = [None] * len(spans)
+        if join_words:
+            return [self._make_metadata(' '.join(text[s:e].split()), s, e, count)
+                    for (s, e), count in zip(spans, token_counts)]
+        return [self._make_metadata(text[s:e], s, e, count)
+                for (s, e), count in zip(spans, token_counts)]
+
+    # 1. Word-level chunking
+    @instrumented("word")
+    @token_counted
+    def word_chunking(self, chunk_size=5):
+        # Words are re-joined with single spaces, the offsets cover the
+        # original text from the first to the last word.
+        with phase("spans"):
+            spans = self.document.word_groups(chunk_size)
+        return self._from_spans(spans, join_words=True)
+
+    # 2. Sentence-level chunking
+    @instrumented("sentence")
+    @token_counted
+    def sentence_chunking(self, workers=1, splitter="punkt"):
+        # splitter="rules": regex splitter, much faster than punkt (see RuleSentences)
+        # workers > 1 (None: all cores) runs punkt on pieces of long texts in parallel
+        if splitter not in SENTENCE_SPLITTERS:
+            raise ValueError(f"⚠️ Unknown sentence splitter: {splitter} (use one of {SENTENCE_SPLITTERS})")
+        with phase("spans"):
+            if splitter == "rules":
+                spans = self.document.rule_sentences()
+            else:
+                spans = self.document.sentences(workers=workers)
+        return self._from_spans(spans)
+
+    # 3. Paragraph-level chunking
+    @instrumented("paragraph")
+    @token_counted
+    def paragraph_chunking(self):
+        with phase("spans"):
+            spans = self.document.paragraphs()
+        return self._from_spans(spans)
+
+    # 4. Fixed-size chunking (characters)
+    @instrumented("fixed_size")
+    @token_counted
+    def fixed_size_chunking(self, chunk_size=50):
+        if self.compact:
+            with phase("build"):
+                return ChunkSet.from_ranges(self.text, chunk_size, chunk_size)
+        with phase("spans"):
+            spans = fixed_size_spans(self.text, chunk_size)
+        return self._from_spans(spans)
+
+    # 5. Sliding window chunking
+    @instrumented("sliding_window")
+    @token_counted
+    def sliding_window_chunking(self, window_size=50, overlap=10):
+        if self.compact and window_size > overlap:
+            with phase("build"):
+                return ChunkSet.from_ranges(self.text, window_size - overlap, window_size)
+        with phase("spans"):
+            spans = sliding_window_spans(self.text, window_size, overlap)
+        return self._from_spans(spans)
+
+    # 6. Semantic chunking
+    @instrumented("semantic")
+    @token_counted
+    def semantic_chunking(self, pipeline="parser"):
+        try:
+            sentence_nlp(pipeline)          # loaded outside the parse phase
+            with phase("parse"):
+                self.document.spacy_doc(pipeline)
+        except OSError:
+            raise ValueError("spaCy model not loaded. Run: python -m spacy download en_core_web_sm")
+        with phase("spans"):
+            spans = self.document.semantic_sentences(pipeline)
+        return self._from_spans(spans)
+
+    @classmethod
+    def semantic_chunking_batch(cls, texts, batch_size=64, n_process=1, pipeline="parser",
+                                count_tokens=False):
+        """
+        Semantic chunking of many documents at once with nlp.pipe.
+        Yields one chunk list per text, in input order.
+        """
+        nlp = sentence_nlp(pipeline)
+        for doc in nlp.pipe(texts, batch_size=batch_size, n_process=n_process):
+            chunks = cls(doc.text)._from_spans(semantic_spans(doc))
+            if count_tokens:
+                fill_token_counts(chunks, "gpt-3.5-turbo" if count_tokens is True else count_tokens)
+            yield chunks
+
+    # 7. Recursive chunking
+    @instrumented("recursive")
+    @token_counted
+    def recursive_chunking(self, max_chars=60):
+        with phase("spans"):
+            spans = recursive_spans(self.text, max_chars, self.document.paragraphs())
+        return self._from_spans(spans)
+
+    # 8. Token-based chunking
+    @instrumented("token")
+    @token_counted
+    def token_chunking(self, chunk_size=50, model="gpt-3.5-turbo"):
+        enc = get_encoder(model)
+        with phase("tokenize"):
+            tokens = self.document.tokens(model)
+        with phase("spans"):
+            spans = spans_from_tokens(self.text, tokens, enc, chunk_size)
+        return self._from_spans([(s, e) for s, e, _ in spans], [count for _, _, count in spans])
+
+    # 9. Embedding-based semantic chunking
+    @instrumented("embedding")
+    @token_counted
+    def embedding_chunking(self, threshold_type="percentile", threshold=95, window=1,
+                           embedder=None, sentence_pipeline=None, embedding_cache=None):
+        """
+        Groups sentences into chunks and starts a new chunk where the
+        embedding similarity between neighbouring sentences (or windows of
+        `window` sentences) drops below the threshold. See EmbeddingChunking.
+        embedder: object with embed(texts) or a texts -> array function,
+                  default is the offline HashingEmbedder.
+        sentence_pipeline: None for punkt sentences, or a spaCy pipeline
+                  name from SENTENCE_PIPELINES.
+        Embeddings are cached by sentence hash, so calling this again with
+        another threshold only redoes the cheap breakpoint step. The cache
+        is shared by the whole process for an embedder with a `name` (see
+        EmbeddingChunking.shared_cache), and kept by this chunker otherwise.
+        embedding_cache: EmbeddingCache to use instead (it embeds with its
+                  own embedder).
+        """
+        from EmbeddingChunking import EmbeddingCache, embedding_spans, shared_cache
+        cache = embedding_cache
+        if cache is None:
+            cache = shared_cache(embedder)
+        if cache is None:
+            cache = next((c for e, c in self._embedding_caches if e is embedder), None)
+            if cache is None:
+                cache = EmbeddingCache(embedder)
+                self._embedding_caches.append((embedder, cache))
+        with phase("sentences"):
+            if sentence_pipeline:
+                sentences = self.document.semantic_sentences(sentence_pipeline)
+            else:
+                sentences = self.document.sentences()
+        with phase("embed"):
+            spans = embedding_spans(self.text, sentences, cache, threshold_type, threshold, window)
+        return self._from_spans(spans)
+
+    # 10. Sentence-aware token packing
+    @instrumented("packed")
+    @token_counted
+    def packed_chunking(self, max_tokens=200, overlap=0, model="gpt-3.5-turbo"):
+        """
+        Whole sentences filled up to `max_tokens` tokens per chunk, with
+        `overlap` sentences repeated between chunks. Unlike token_chunking
+        no chunk ends mid-sentence, unless that sentence alone is over the
+        budget. token_count is the exact count of every chunk; only a
+        single character wider than `max_tokens` tokens is over the budget.
+        """
+        with phase("sentences"):
+            sentences = self.document.sentences()
+        with phase("tokenize"):
+            counts = self.document.sentence_token_counts(model) if sentences else None
+        with phase("spans"):
+            spans = packed_spans(self.text, max_tokens, overlap, model, sentences=sentences, counts=counts)
+        return self._from_spans([(s, e) for s, e, _ in spans], [count for _, _, count in spans])
+
+    # 11. Profile-driven strategy choice
+    def profiled_chunking(self, target_chars=(200, 1000), latency_budget=1.0,
+                          model="gpt-3.5-turbo", calibration=None, count_tokens=False):
+        """
+        Let ChunkPlanner pick the strategy and parameters from a sample of
+        the text. Returns (chunks, plan); plan["reason"] and
+        ChunkPlanner.explain(plan) say why that strategy was chosen.
+        """
+        from ChunkPlanner import plan_chunking
+        plan = plan_chunking(self.text, target_chars, latency_budget, model, calibration)
+        chunking = getattr(self, f"{plan['strategy']}_chunking")
+        return chunking(**plan["params"], count_tokens=count_tokens), plan
+
+    # 12. Hierarchical recursive chunking
+    @instrumented("hierarchical")
+    @token_counted
+    def hierarchical_chunking(self, max_size=500, unit="chars", separators=SEPARATORS,
+                              model="gpt-3.5-turbo"):
+        """
+        Recursive splitting with a separator cascade (blank line, line
+        break, sentence end, whitespace, character): a span is only split
+        when it is over `max_size` characters (unit="chars") or tokens
+        (unit="tokens"), and small neighbours are merged back up to
+        max_size. Unlike recursive_chunking, words are only cut when a
+        single word is over the limit. With unit="tokens", token_count is
+        the exact count of every chunk. See hierarchical_spans.
+        """
+        offsets = None
+        if unit == "tokens":
+            with phase("tokenize"):
+                offsets = self.document.token_offsets(model)
+        with phase("spans"):
+            spans = hierarchical_spans(self.text, max_size, separators, unit, model, offsets)
+        counts = [n for _, _, n in spans] if unit == "tokens" else None
+        return self._from_spans([(s, e) for s, e, _ in spans], counts)
+
+
+# ------------------------------
+# 🔹 Example usage:
+# ------------------------------
+if __name__ == "__main__":
+    # Multi-byte input: token windows never split a character, and only a
+    # character that alone is wider than the budget goes over it
+    text = "Tokyo 東京 is big. 🚀 launches at 9:00 — über früh! 漢字かな交じり文。"
+    enc = get_encoder()
+    for max_tokens in (1, 2, 5):
+        chunker = SpanChunker(text)
+        for name, chunks in (("token", chunker.token_chunking(max_tokens)),
+                             ("packed", chunker.packed_chunking(max_tokens))):
+            exact = all(len(enc.encode(c["chunk_text"])) == c["token_count"] for c in chunks)
+            over = [c["chunk_text"] for c in chunks if c["token_count"] > max_tokens]
+            print(f"{name:6s} max_tokens={max_tokens}: {len(chunks):2d} chunks, exact counts: {exact}, "
+                  f"over the budget: {over or 'none'}")
+        rejoined = "".join(c["chunk_text"] for c in chunker.token_chunking(max_tokens))
+        print(f"  token chunks rejoin to the text: {rejoined == text}")
@@ -0,0 +1,254 @@
+import os
+
+# Characters read from the file per block. Peak memory is roughly one block
+# plus the unfinished tail (one chunk / line / sentence) carried to the next.
+DEFAULT_BLOCK_SIZE = 1 << 16
+
+
+def _make_metadata(chunk, start_idx, end_idx, token_count=None):
+    return {
+        "chunk_text": chunk,
+        "start_index": start_idx,
+        "end_index": end_idx,
+        "token_count": token_count
+    }
+
+
+# ------------------------------
+# 🔹 Block reading helpers
+# ------------------------------
+def _iter_blocks(source, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Yield the text of `source` in blocks of `block_size` characters.
+    `source` is either a file path or an already opened text stream.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        if not os.path.exists(source):
+            raise FileNotFoundError(f"❌ File not found: {source}")
+        with open(source, "r", encoding="utf-8") as f:
+            yield from _iter_blocks(f, block_size)
+        return
+    while True:
+        block = source.read(block_size)
+        if not block:
+            break
+        yield block
+
+
+def _last_space(block):
+    """Index of a whitespace character near the end of block, -1 if none."""
+    return max(block.rfind(" "), block.rfind("\n"), block.rfind("\t"))
+
+
+def _iter_segments(source, block_size, find_cut):
+    """
+    Re-cut the blocks of `source` at safe positions.
+
+    find_cut(block) returns the index in block where the text may be cut
+    (everything before it is a complete unit), or -1. Text without a cut is
+    kept in `pending` and joined once, so a long line costs linear time.
+    Yields (segment, offset) with the character offset of the segment.
+    """
+    pending, offset = [], 0
+    for block in _iter_blocks(source, block_size):
+        cut = find_cut(block)
+        if cut < 0:
+            pending.append(block)
+            continue
+        pending.append(block[:cut])
+        segment = "".join(pending)
+        yield segment, offset
+        offset += len(segment)
+        pending = [block[cut:]]
+    segment = "".join(pending)
+    if segment:
+        yield segment, offset
+
+
+def _line_cut(block):
+    return block.rfind("\n") + 1 or -1
+
+
+def _space_cut(block):
+    cut = _last_space(block)
+    return cut + 1 if cut >= 0 else -1
+
+
+def _token_cut(block):
+    """
+    Cut after a newline followed by non-whitespace (or before a single space
+    that starts a new word). tiktoken never merges across these positions,
+    so encoding the segments separately gives the same tokens as encoding
+    the whole file.
+    """
+    i = block.rfind("\n", 0, len(block) - 1)
+    while i >= 0:
+        if not block[i + 1].isspace():
+            return i + 1
+        i = block.rfind("\n", 0, i)
+    i = block.rfind(" ", 1, len(block) - 1)
+    while i > 0:
+        if not block[i - 1].isspace() and block[i + 1].isalpha():
+            return i
+        i = block.rfind(" ", 1, i)
+    return -1
+
+
+# 1. Word-level chunking
+def iter_word_chunking(source, chunk_size=5, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Stream chunks of `chunk_size` words. Same chunks as
+    TextChunker.word_chunking on the whole file.
+    """
+    carry, carry_offset = "", 0
+    for segment, offset in _iter_segments(source, block_size, _space_cut):
+        if not carry:
+            carry_offset = offset
+        buf = carry + segment
+        words = buf.split()
+        full = len(words) - len(words) % chunk_size
+        pos = 0
+        for i in range(0, full, chunk_size):
+            group = words[i:i + chunk_size]
+            start_idx = buf.find(group[0], pos)
+            pos = start_idx
+            for w in group:
+                pos = buf.find(w, pos) + len(w)
+            yield _make_metadata(' '.join(group), carry_offset + start_idx, carry_offset + pos)
+        carry = buf[pos:] if full < len(words) else ""
+        carry_offset += pos
+    if carry.strip():
+        words = carry.split()
+        start_idx = carry.find(words[0])
+        end_idx = len(carry.rstrip())
+        yield _make_metadata(' '.join(words), carry_offset + start_idx, carry_offset + end_idx)
+
+
+# 2. Sentence-level chunking
+def iter_sentence_chunking(source, block_size=DEFAULT_BLOCK_SIZE, language="english"):
+    """
+    Stream punkt sentences. Every sentence but the last one in the buffer is
+    final; the last one is carried over because the next block may extend it.
+    """
+    from ModelRegistry import get_punkt
+    tokenizer = get_punkt(language)
+
+    carry, carry_offset = "", 0
+    for segment, offset in _iter_segments(source, block_size, _space_cut):
+        if not carry:
+            carry_offset = offset
+        buf = carry + segment
+        spans = list(tokenizer.span_tokenize(buf))
+        for start_idx, end_idx in spans[:-1]:
+            yield _make_metadata(buf[start_idx:end_idx], carry_offset + start_idx, carry_offset + end_idx)
+        keep = spans[-1][0] if spans else len(buf)
+        carry = buf[keep:]
+        carry_offset += keep
+    for start_idx, end_idx in tokenizer.span_tokenize(carry):
+        yield _make_metadata(carry[start_idx:end_idx], carry_offset + start_idx, carry_offset + end_idx)
+
+
+def _iter_lines(source, block_size):
+    """Yield (stripped_line, start_idx, end_idx) for every non-blank line."""
+    for segment, offset in _iter_segments(source, block_size, _line_cut):
+        pos = 0
+        for line in segment.split("\n"):
+            para = line.strip()
+            if para:
+                start_idx = offset + pos + line.find(para)
+                yield para, start_idx, start_idx + len(para)
+            pos += len(line) + 1
+
+
+# 3. Paragraph-level chunking
+def iter_paragraph_chunking(source, block_size=DEFAULT_BLOCK_SIZE):
+    for para, start_idx, end_idx in _iter_lines(source, block_size):
+        yield _make_metadata(para, start_idx, end_idx)
+
+
+# 4. Fixed-size chunking (characters)
+def iter_fixed_size_chunking(source, chunk_size=50, block_size=DEFAULT_BLOCK_SIZE):
+    buf, offset = "", 0
+    for block in _iter_blocks(source, block_size):
+        buf += block
+        full = len(buf) - len(buf) % chunk_size
+        for i in range(0, full, chunk_size):
+            yield _make_metadata(buf[i:i+chunk_size], offset + i, offset + i + chunk_size)
+        buf = buf[full:]
+        offset += full
+    if buf:
+        yield _make_metadata(buf, offset, offset + len(buf))
+
+
+# 5. Sliding window chunking
+def iter_sliding_window_chunking(source, window_size=50, overlap=10, block_size=DEFAULT_BLOCK_SIZE):
+    step = window_size - overlap
+    if step <= 0:
+        raise ValueError("⚠️ overlap must be smaller than window_size")
+    buf, offset = "", 0   # buf always starts at the next window start
+    for block in _iter_blocks(source, block_size):
+        buf += block
+        start = 0
+        while start + window_size <= len(buf):
+            yield _make_metadata(buf[start:start+window_size], offset + start, offset + start + window_size)
+            start += step
+        buf = buf[start:]
+        offset += start
+    # Tail windows, exactly like the in-memory version (start < len(text))
+    start = 0
+    while start < len(buf):
+        end = min(start + window_size, len(buf))
+        yield _make_metadata(buf[start:end], offset + start, offset + end)
+        start += step
+
+
+# 6. Recursive chunking
+def iter_recursive_chunking(source, max_chars=60, block_size=DEFAULT_BLOCK_SIZE):
+    for para, start_idx, end_idx in _iter_lines(source, block_size):
+        if len(para) <= max_chars:
+            yield _make_metadata(para, start_idx, end_idx)
+        else:
+            for i in range(0, len(para), max_chars):
+                chunk = para[i:i+max_chars]
+                yield _make_metadata(chunk, start_idx + i, start_idx + i + len(chunk))
+
+
+# 7. Token-based chunking
+def iter_token_chunking(source, chunk_size=50, model="gpt-3.5-turbo", block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Stream windows of `chunk_size` tokens. Blocks are only cut where tiktoken
+    cannot merge across, and the tokens of the last (unfinished) window are
+    carried into the next segment, so the windows match
+    TextChunker.token_chunking on the whole file.
+    """
+    from ModelRegistry import get_encoder
+    from SpanChunking import spans_from_tokens
+    enc = get_encoder(model)
+
+    carry_tokens, carry_text, carry_offset = [], "", 0
+    for segment, _ in _iter_segments(source, block_size, _token_cut):
+        buf = carry_text + segment
+        tokens = carry_tokens + enc.encode(segment)
+        spans = spans_from_tokens(buf, tokens, enc, chunk_size)
+        if not spans:
+            continue
+        for start_idx, end_idx, count in spans[:-1]:
+            yield _make_metadata(buf[start_idx:end_idx], carry_offset + start_idx, carry_offset + end_idx, count)
+        start_idx, _, count = spans[-1]
+        carry_tokens = tokens[len(tokens) - count:]
+        carry_text = buf[start_idx:]
+        carry_offset += start_idx
+    if carry_tokens:
+        yield _make_metadata(carry_text, carry_offset, carry_offset + len(carry_text), len(carry_tokens))
+
+
+# ------------------------------
+# 🔹 Example usage:
+# ------------------------------
+if __name__ == "__main__":
+    import sys
+    file_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "TempFiles", "InputFile", "SampleInput_1.txt")
+
+    for c in iter_paragraph_chunking(file_path):
+        print(c)
@@ -1,32 +1,42 @@
-import nltk
-import spacy
-import tiktoken  # For token-level chunking
-
-# Download NLTK punkt tokenizer
-nltk.download('punkt', quiet=True)
+from ModelRegistry import get_encoder, get_nlp
+from SpanChunking import Document, spans_from_tokens  # For token-level chunking
 
 class TextChunker:
     def __init__(self, text):
         self.text = text
-        # Load spaCy model for semantic chunking
+        self._document = None
+
+    @property
+    def nlp(self):
+        """spaCy model for semantic chunking, shared and loaded on first use."""
         try:
-            self.nlp = spacy.load("en_core_web_sm")
+            return get_nlp("en_core_web_sm")
         except OSError:
             print("Please run: python -m spacy download en_core_web_sm")
-            self.nlp = None
+            return None
+
+    @property
+    def document(self):
+        """Shared analyses of self.text (spans, spaCy Doc, tokens), each computed once."""
+        if self._document is None or self._document.text is not self.text:
+            self._document = Document(self.text)
+        return self._document
+
+    def _slices(self, spans):
+        return [self.text[s:e] for s, e in spans]
 
     # 1. Word-level chunking
     def word_chunking(self, chunk_size=5):
-        words = self.text.split()
+        words = self._slices(self.document.words())
         return [' '.join(words[i:i+chunk_size]) for i in range(0, len(words), chunk_size)]
 
     # 2. Sentence-level chunking
     def sentence_chunking(self):
-        return nltk.sent_tokenize(self.text)
+        return self._slices(self.document.sentences())
 
     # 3. Paragraph-level chunking
     def paragraph_chunking(self):
-        return [p.strip() for p in self.text.split("\n") if p.strip()]
+        return self._slices(self.document.paragraphs())
 
     # 4. Fixed-size chunking (characters)
     def fixed_size_chunking(self, chunk_size=50):
@@ -43,11 +53,12 @@ class TextChunker:
         return chunks
 
     # 6. Semantic chunking
-    def semantic_chunking(self):
-        if not self.nlp:
+    def semantic_chunking(self, pipeline="parser"):
+        # Only the components needed for sentence boundaries are run
+        try:
+            return self._slices(self.document.semantic_sentences(pipeline))
+        except OSError:
             raise ValueError("spaCy model not loaded. Run: python -m spacy download en_core_web_sm")
-        doc = self.nlp(self.text)
-        return [sent.text.strip() for sent in doc.sents]
 
     # 7. Recursive chunking
     def recursive_chunking(self, max_chars=60):
@@ -65,27 +76,23 @@ class TextChunker:
         """
         Splits text into chunks based on token count.
         model: model name for tokenization
+        Chunks are slices of the source text; a window never ends inside
+        a multi-byte character.
         """
-        enc = tiktoken.encoding_for_model(model)
-        tokens = enc.encode(self.text)
-        
-        chunks = []
-        for i in range(0, len(tokens), chunk_size):
-            chunk_tokens = tokens[i:i+chunk_size]
-            chunk_text = enc.decode(chunk_tokens)
-            chunks.append(chunk_text)
-        return chunks
+        tokens = self.document.tokens(model)
+        return [self.text[s:e] for s, e, _ in spans_from_tokens(self.text, tokens, get_encoder(model), chunk_size)]
 
 
 # ------------------------------
 # 🔹 Example usage:
 # ------------------------------
-sample_text = """
+if __name__ == "__main__":
+    sample_text = """
 Artificial Intelligence (AI) is a branch of computer science that aims to create intelligent machines.
 It has become an essential part of the technology industry. AI research is highly technical and specialized.
 The core problems of AI include programming computers for certain traits such as knowledge, reasoning, problem-solving, perception, learning, and planning.
 """
 
-chunker = TextChunker(sample_text)
+    chunker = TextChunker(sample_text)
 
-print("TOKEN CHUNKS:", chunker.token_chunking(20))
+    print("TOKEN CHUNKS:", chunker.token_chunking(20))
@@ -1,33 +1,43 @@
-import nltk
-import spacy
-import tiktoken  # For token-level chunking
+from ModelRegistry import get_encoder, get_nlp
+from SpanChunking import Document, spans_from_tokens  # For token-level chunking
 import os
 
-# Download NLTK punkt tokenizer
-nltk.download('punkt', quiet=True)
-
 class TextChunker:
     def __init__(self, text):
         self.text = text
-        # Load spaCy model for semantic chunking
+        self._document = None
+
+    @property
+    def nlp(self):
+        """spaCy model for semantic chunking, shared and loaded on first use."""
         try:
-            self.nlp = spacy.load("en_core_web_sm")
+            return get_nlp("en_core_web_sm")
         except OSError:
             print("Please run: python -m spacy download en_core_web_sm")
-            self.nlp = None
+            return None
+
+    @property
+    def document(self):
+        """Shared analyses of self.text (spans, spaCy Doc, tokens), each computed once."""
+        if self._document is None or self._document.text is not self.text:
+            self._document = Document(self.text)
+        return self._document
+
+    def _slices(self, spans):
+        return [self.text[s:e] for s, e in spans]
 
     # 1. Word-level chunking
     def word_chunking(self, chunk_size=5):
-        words = self.text.split()
+        words = self._slices(self.document.words())
         return [' '.join(words[i:i+chunk_size]) for i in range(0, len(words), chunk_size)]
 
     # 2. Sentence-level chunking
     def sentence_chunking(self):
-        return nltk.sent_tokenize(self.text)
+        return self._slices(self.document.sentences())
 
     # 3. Paragraph-level chunking
     def paragraph_chunking(self):
-        return [p.strip() for p in self.text.split("\n") if p.strip()]
+        return self._slices(self.document.paragraphs())
 
     # 4. Fixed-size chunking (characters)
     def fixed_size_chunking(self, chunk_size=50):
@@ -44,11 +54,12 @@ class TextChunker:
         return chunks
 
     # 6. Semantic chunking
-    def semantic_chunking(self):
-        if not self.nlp:
+    def semantic_chunking(self, pipeline="parser"):
+        # Only the components needed for sentence boundaries are run
+        try:
+            return self._slices(self.document.semantic_sentences(pipeline))
+        except OSError:
             raise ValueError("spaCy model not loaded. Run: python -m spacy download en_core_web_sm")
-        doc = self.nlp(self.text)
-        return [sent.text.strip() for sent in doc.sents]
 
     # 7. Recursive chunking
     def recursive_chunking(self, max_chars=60):
@@ -66,28 +77,23 @@ class TextChunker:
         """
         Splits text into chunks based on token count.
         model: model name for tokenization
+        Chunks are slices of the source text; a window never ends inside
+        a multi-byte character.
         """
-        enc = tiktoken.encoding_for_model(model)
-        tokens = enc.encode(self.text)
-        
-        chunks = []
-        for i in range(0, len(tokens), chunk_size):
-            chunk_tokens = tokens[i:i+chunk_size]
-            chunk_text = enc.decode(chunk_tokens)
-            chunks.append(chunk_text)
-        return chunks
+        tokens = self.document.tokens(model)
+        return [self.text[s:e] for s, e, _ in spans_from_tokens(self.text, tokens, get_encoder(model), chunk_size)]
 
 
 # ------------------------------
 # 🔹 Dynamic file reading
 # ------------------------------
-def read_file():
-    """Ask for a file path dynamically (fallback to default)."""
-    default_path = "F:\\My_Afterwork_Projects\\Technology\\MyProjects\\Python\\GenAi\\Chunks\\TempFiles\\InputFile\\SampleInput_1.txt"
-    file_path = input(f"Enter full path of your .txt file (Press Enter to use default): ").strip()
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            "..", "TempFiles", "InputFile", "SampleInput_1.txt")
+
 
-    if not file_path:  # if user presses enter, use default
-        file_path = default_path
+def read_file(file_path=None):
+    """Read a .txt file (default: the bundled sample); returns None if it does not exist."""
+    file_path = file_path or DEFAULT_PATH
 
     if not os.path.exists(file_path):
         print(f"❌ File not found: {file_path}")
@@ -103,7 +109,8 @@ def read_file():
 # 🔹 Example usage
 # ------------------------------
 if __name__ == "__main__":
-    text = read_file()
+    import sys
+    text = read_file(sys.argv[1] if len(sys.argv) > 1 else None)
     if text:
         chunker = TextChunker(text)
         print("TOKEN CHUNKS:", chunker.token_chunking(20))
@@ -1,9 +1,10 @@
 import os
-import nltk
-import spacy
+import sys
 
-# Download NLTK punkt tokenizer
-nltk.download('punkt', quiet=True)
+# Shared helpers (model registry, span engine) live in the Adv folder
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Adv"))
+from ModelRegistry import get_nlp
+from SpanChunking import Document
 
 class TextChunker:
 
@@ -21,26 +22,39 @@ class TextChunker:
             self.text = text
         else:
             raise ValueError("⚠️ Provide either 'text' or 'file_path'")
+        self._document = None
 
-        # Load spaCy model
+    @property
+    def nlp(self):
+        """spaCy model, shared by all chunkers and loaded on first use."""
         try:
-            self.nlp = spacy.load("en_core_web_sm")
+            return get_nlp("en_core_web_sm")
         except OSError:
             print("Please run: python -m spacy download en_core_web_sm")
-            self.nlp = None
+            return None
+
+    @property
+    def document(self):
+        """Shared analyses of self.text (spans, spaCy Doc, tokens), each computed once."""
+        if self._document is None or self._document.text is not self.text:
+            self._document = Document(self.text)
+        return self._document
+
+    def _slices(self, spans):
+        return [self.text[s:e] for s, e in spans]
 
     # 1. Word-level chunking
     def word_chunking(self, chunk_size=5):
-        words = self.text.split()
+        words = self._slices(self.document.words())
         return [' '.join(words[i:i+chunk_size]) for i in range(0, len(words), chunk_size)]
 
     # 2. Sentence-level chunking
     def sentence_chunking(self):
-        return nltk.sent_tokenize(self.text)
+        return self._slices(self.document.sentences())
 
     # 3. Paragraph-level chunking
     def paragraph_chunking(self):
-        return [p.strip() for p in self.text.split("\n") if p.strip()]
+        return self._slices(self.document.paragraphs())
 
     # 4. Fixed-size chunking (characters)
     def fixed_size_chunking(self, chunk_size=50):
@@ -57,11 +71,12 @@ class TextChunker:
         return chunks
 
     # 6. Semantic chunking
-    def semantic_chunking(self):
-        if not self.nlp:
+    def semantic_chunking(self, pipeline="parser"):
+        # Only the components needed for sentence boundaries are run
+        try:
+            return self._slices(self.document.semantic_sentences(pipeline))
+        except OSError:
             raise ValueError("spaCy model not loaded. Run: python -m spacy download en_core_web_sm")
-        doc = self.nlp(self.text)
-        return [sent.text.strip() for sent in doc.sents]
 
     # 7. Recursive chunking
     def recursive_chunking(self, max_chars=60):
@@ -78,30 +93,31 @@ class TextChunker:
 # ------------------------------
 # 🔹 Example usage:
 # ------------------------------
-sample_text = """
+if __name__ == "__main__":
+    sample_text = """
 Artificial Intelligence (AI) is a branch of computer science that aims to create intelligent machines.
 It has become an essential part of the technology industry. AI research is highly technical and specialized.
 The core problems of AI include programming computers for certain traits such as knowledge, reasoning, problem-solving, perception, learning, and planning.
 """
 
-# Static
-chunker = TextChunker(text=sample_text)
-
-# Dynamic
-file_path = r"F:\My_Afterwork_Projects\Technology\MyProjects\Python\GenAi\Chunks\TempFiles\InputFile\SampleInput_1.txt"
-#chunker = TextChunker(file_path=file_path)
-
-print("\n")
-print("\nWORD CHUNKS:", chunker.word_chunking(5))
-print("\n")
-print("\nSENTENCE CHUNKS:", chunker.sentence_chunking())
-print("\n")
-print("\nPARAGRAPH CHUNKS:", chunker.paragraph_chunking())
-print("\n")
-print("\nFIXED SIZE CHUNKS:", chunker.fixed_size_chunking(50))
-print("\n")
-print("\nSLIDING WINDOW CHUNKS:", chunker.sliding_window_chunking(50, 10))
-print("\n")
-print("\nSEMANTIC CHUNKS:", chunker.semantic_chunking())
-print("\n")
-print("\nRECURSIVE CHUNKS:", chunker.recursive_chunking(60))
+    # Static
+    chunker = TextChunker(text=sample_text)
+
+    # Dynamic
+    file_path = r"F:\My_Afterwork_Projects\Technology\MyProjects\Python\GenAi\Chunks\TempFiles\InputFile\SampleInput_1.txt"
+    #chunker = TextChunker(file_path=file_path)
+
+    print("\n")
+    print("\nWORD CHUNKS:", chunker.word_chunking(5))
+    print("\n")
+    print("\nSENTENCE CHUNKS:", chunker.sentence_chunking())
+    print("\n")
+    print("\nPARAGRAPH CHUNKS:", chunker.paragraph_chunking())
+    print("\n")
+    print("\nFIXED SIZE CHUNKS:", chunker.fixed_size_chunking(50))
+    print("\n")
+    print("\nSLIDING WINDOW CHUNKS:", chunker.sliding_window_chunking(50, 10))
+    print("\n")
+    print("\nSEMANTIC CHUNKS:", chunker.semantic_chunking())
+    print("\n")
+    print("\nRECURSIVE CHUNKS:", chunker.recursive_chunking(60))
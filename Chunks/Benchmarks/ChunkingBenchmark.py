@@ -0,0 +1,262 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from SyntheticCorpus import KINDS, corpus_path, format_size, parse_size
+
+# ------------------------------
+# 🔹 Chunking benchmark suite
+# ------------------------------
+# Runs every TextChunker strategy and every function-per-file module on
+# synthetic corpora of several sizes and shapes. Each (target, corpus)
+# case runs in a fresh interpreter, so model loads show up as start-up
+# cost and peak RSS belongs to that case alone.
+#
+#   python ChunkingBenchmark.py --sizes 1KB 1MB 64MB --output run.json
+#   python ChunkingBenchmark.py --compare baseline.json --output run.json
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CHUNKS = os.path.dirname(HERE)
+ADV = os.path.join(CHUNKS, "Adv")
+
+# target name -> (module, how to chunk `text` with it)
+TARGETS = {
+    "TextChunker.word": ("AutoChunkingSelect", "TextChunker(text).word_chunking()"),
+    "TextChunker.sentence": ("AutoChunkingSelect", "TextChunker(text).sentence_chunking()"),
+    "TextChunker.paragraph": ("AutoChunkingSelect", "TextChunker(text).paragraph_chunking()"),
+    "TextChunker.fixed_size": ("AutoChunkingSelect", "TextChunker(text).fixed_size_chunking()"),
+    "TextChunker.sliding_window": ("AutoChunkingSelect", "TextChunker(text).sliding_window_chunking()"),
+    "TextChunker.semantic": ("AutoChunkingSelect", "TextChunker(text).semantic_chunking()"),
+    "TextChunker.recursive": ("AutoChunkingSelect", "TextChunker(text).recursive_chunking()"),
+    "TextChunker.token": ("AutoChunkingSelect", "TextChunker(text).token_chunking()"),
+    "TextChunker.embedding": ("AutoChunkingSelect", "TextChunker(text).embedding_chunking()"),
+    "TextChunker.packed": ("AutoChunkingSelect", "TextChunker(text).packed_chunking()"),
+    "TextChunker.hierarchical": ("AutoChunkingSelect", "TextChunker(text).hierarchical_chunking()"),
+    "function.word": ("word_chunking", "word_chunking(text)"),
+    "function.sentence": ("Sentence_level_Cunking", "sentence_chunking(text)"),
+    "function.paragraph": ("Paragraph_level_chunking", "paragraph_chunking(text)"),
+    "function.fixed_size": ("Fixed_size_chunking", "fixed_size_chunking(text)"),
+    "function.sliding_window": ("Sliding_Window_Chunking", "sliding_window_chunking(text)"),
+    "function.semantic": ("Semantic_Chunking", "semantic_chunking(text)"),
+    "function.recursive": ("Recursive_Chunking", "recursive_chunking(text)"),
+}
+
+# Largest corpus each slow target is run on unless --no-limits is given
+# (spaCy refuses texts over 1,000,000 characters by default anyway).
+SIZE_LIMITS = {
+    "TextChunker.semantic": 1 << 20,
+    "function.semantic": 1 << 20,
+    "TextChunker.embedding": 16 << 20,
+}
+
+DEFAULT_SIZES = ("1KB", "64KB", "1MB", "16MB")
+DEFAULT_CORPUS_DIR = os.path.join(tempfile.gettempdir(), "chunking-benchmark-corpora")
+_EXCEPTION_RE = re.compile(r"^[A-Za-z_][\w.]*(Error|Exception)\b")
+
+
+# ------------------------------
+# 🔹 One case (runs in the child process)
+# ------------------------------
+def _peak_rss_bytes():
+    try:
+        import resource
+    except ImportError:         # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_case(target, path, repeat=3, trace=True):
+    """Chunk the file at `path` with `target`; returns the measurements as a dict."""
+    sys.path[:0] = [ADV, CHUNKS]
+    module_name, call = TARGETS[target]
+
+    start = time.perf_counter()
+    namespace = vars(__import__(module_name))
+    import_seconds = time.perf_counter() - start
+
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    n_bytes = len(text.encode("utf-8"))
+    code = compile(call, target, "eval")
+    namespace = dict(namespace, text=text)
+    rss_before = _peak_rss_bytes()
+
+    # First call pays for lazy imports and model loads
+    start = time.perf_counter()
+    chunks = eval(code, namespace)
+    first_seconds = time.perf_counter() - start
+    n_chunks = len(chunks)
+    del chunks
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        eval(code, namespace)
+        times.append(time.perf_counter() - start)
+    steady = statistics.median(times) if times else first_seconds
+    rss_after = _peak_rss_bytes()
+
+    traced_peak = None
+    if trace:
+        import tracemalloc
+        tracemalloc.start()
+        eval(code, namespace)
+        traced_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {
+        "bytes": n_bytes,
+        "chunks": n_chunks,
+        "import_seconds": import_seconds,
+        "first_call_seconds": first_seconds,
+        "steady_seconds": steady,
+        "startup_seconds": import_seconds + max(first_seconds - steady, 0.0),
+        "mb_per_s": n_bytes / (steady or 1e-9) / 1e6,
+        "chunks_per_s": n_chunks / (steady or 1e-9),
+        "peak_rss_delta_mb": None if rss_before is None else (rss_after - rss_before) / 1e6,
+        "tracemalloc_peak_mb": None if traced_peak is None else traced_peak / 1e6,
+    }
+
+
+# ------------------------------
+# 🔹 Suite (runs in the parent process)
+# ------------------------------
+def _run_isolated(target, path, repeat, trace, timeout):
+    cmd = [sys.executable, os.path.abspath(__file__), "--case", target, path,
+           "--repeat", str(repeat)]
+    if not trace:
+        cmd.append("--no-tracemalloc")
+    try:
+        out = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {"error": f"timeout after {timeout}s"}
+    if out.returncode != 0:
+        return {"error": _exception_line(out.stderr) or f"exit code {out.returncode}"}
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def _exception_line(stderr):
+    """Last 'SomeError: message' line of a traceback (nltk puts its message in a banner below)."""
+    lines = stderr.splitlines()
+    found = [i for i, line in enumerate(lines) if _EXCEPTION_RE.match(line)]
+    if not found:
+        return None
+    message = lines[found[-1]].strip()
+    if message.endswith(":"):
+        rest = [l.strip() for l in lines[found[-1] + 1:] if l.strip().strip("*")]
+        message = f"{message} {rest[0]}" if rest else message
+    return message
+
+
+def run_suite(targets=tuple(TARGETS), kinds=KINDS, sizes=DEFAULT_SIZES, repeat=3,
+              trace=True, limits=True, corpus_dir=DEFAULT_CORPUS_DIR, timeout=3600, log=print):
+    results = []
+    for size in sorted(parse_size(s) for s in sizes):
+        for kind in kinds:
+            path = corpus_path(kind, size, corpus_dir)
+            for target in targets:
+                case = {"target": target, "kind": kind, "size": format_size(size)}
+                if limits and size > SIZE_LIMITS.get(target, size):
+                    case["skipped"] = f"over the {format_size(SIZE_LIMITS[target])} limit"
+                else:
+                    case.update(_run_isolated(target, path, repeat, trace, timeout))
+                results.append(case)
+                if log:
+                    log(_format_case(case))
+    return {"meta": _meta(repeat), "results": results}
+
+
+def _meta(repeat):
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=CHUNKS, capture_output=True,
+                                text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "repeat": repeat,
+    }
+
+
+def _format_case(case):
+    name = f"{case['target']:26s} {case['kind']:7s} {case['size']:>6s}"
+    if "skipped" in case:
+        return f"{name}  skipped ({case['skipped']})"
+    if "error" in case:
+        return f"{name}  ❌ {case['error']}"
+    return (f"{name} {case['mb_per_s']:9.2f} MB/s {case['chunks_per_s']:12.0f} chunks/s  "
+            f"startup {case['startup_seconds']:.3f}s  rss +{case['peak_rss_delta_mb'] or 0:.1f} MB")
+
+
+# ------------------------------
+# 🔹 Regression check
+# ------------------------------
+def compare(baseline, current, tolerance=0.2):
+    """
+    Cases that got more than `tolerance` (0.2 = 20%) slower, or use that
+    much more memory, than in `baseline`. Returns a list of messages.
+    """
+    old = {(r["target"], r["kind"], r["size"]): r for r in baseline["results"] if "mb_per_s" in r}
+    regressions = []
+    for case in current["results"]:
+        before = old.get((case["target"], case["kind"], case["size"]))
+        if before is None or "mb_per_s" not in case:
+            continue
+        name = f"{case['target']} {case['kind']} {case['size']}"
+        if case["mb_per_s"] < before["mb_per_s"] * (1 - tolerance):
+            regressions.append(f"{name}: {before['mb_per_s']:.2f} -> {case['mb_per_s']:.2f} MB/s")
+        for key in ("peak_rss_delta_mb", "tracemalloc_peak_mb"):
+            if case.get(key) and before.get(key) and case[key] > before[key] * (1 + tolerance) + 1:
+                regressions.append(f"{name}: {key} {before[key]:.1f} -> {case[key]:.1f}")
+    return regressions
+
+
+# ------------------------------
+# 🔹 Command line
+# ------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark every chunking strategy on synthetic corpora.")
+    parser.add_argument("--targets", nargs="+", default=list(TARGETS), choices=list(TARGETS), metavar="TARGET")
+    parser.add_argument("--kinds", nargs="+", default=list(KINDS), choices=list(KINDS))
+    parser.add_argument("--sizes", nargs="+", default=list(DEFAULT_SIZES), help="e.g. 1KB 1MB 1GB")
+    parser.add_argument("--repeat", type=int, default=3, help="steady-state runs per case (median is kept)")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="skip the (slow) traced run")
+    parser.add_argument("--no-limits", action="store_true", help="ignore SIZE_LIMITS for slow strategies")
+    parser.add_argument("--corpus-dir", default=DEFAULT_CORPUS_DIR)
+    parser.add_argument("--timeout", type=int, default=3600, help="seconds per case")
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--compare", help="baseline JSON from an earlier run")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--case", nargs=2, metavar=("TARGET", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        print(json.dumps(run_case(args.case[0], args.case[1], args.repeat, not args.no_tracemalloc)))
+        sys.exit(0)
+
+    report = run_suite(args.targets, args.kinds, args.sizes, args.repeat,
+                       not args.no_tracemalloc, not args.no_limits, args.corpus_dir, args.timeout)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            regressions = compare(json.load(f), report, args.tolerance)
+        for message in regressions:
+            print(f"❌ Regression: {message}")
+        sys.exit(1 if regressions else 0)
@@ -0,0 +1,154 @@
+import argparse
+import glob
+import json
+import os
+import sys
+import tempfile
+import time
+
+from SyntheticCorpus import corpus_path, format_size, parse_size
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CHUNKS = os.path.dirname(HERE)
+ADV = os.path.join(CHUNKS, "Adv")
+sys.path[:0] = [ADV, CHUNKS]
+
+# ------------------------------
+# 🔹 Sentence splitter comparison
+# ------------------------------
+# Speed and agreement of the regex splitter (RuleSentences) with nltk
+# punkt (what sent_tokenize uses) and the spaCy sentence pipelines, on
+# the sample inputs and on synthetic corpora. Agreement is measured on
+# sentence ends: precision / recall / F1 of a splitter's ends against a
+# reference splitter's, plus the share of sentences with identical spans.
+#
+#   python SentenceSplitterBenchmark.py --sizes 64KB 1MB --reference punkt
+#   python SentenceSplitterBenchmark.py --output splitters.json
+
+SAMPLES = os.path.join(CHUNKS, "TempFiles", "InputFile", "*.txt")
+DEFAULT_SIZES = ("64KB", "1MB")
+DEFAULT_KINDS = ("prose", "code", "repeat")
+DEFAULT_CORPUS_DIR = os.path.join(tempfile.gettempdir(), "chunking-benchmark-corpora")
+# spaCy refuses texts over 1,000,000 characters by default
+SPACY_LIMIT = 1_000_000
+
+
+def _rules(text):
+    from RuleSentences import rule_sentence_spans
+    return rule_sentence_spans(text)
+
+
+def _punkt(text):
+    from SpanChunking import sentence_spans
+    return sentence_spans(text)
+
+
+def _spacy(pipeline):
+    def split(text):
+        from SpanChunking import semantic_spans, sentence_nlp
+        return semantic_spans(sentence_nlp(pipeline)(text))
+    return split
+
+
+# splitter name -> (text -> spans, largest text it is run on)
+SPLITTERS = {
+    "rules": (_rules, None),
+    "punkt": (_punkt, None),
+    "spacy-sentencizer": (_spacy("sentencizer"), SPACY_LIMIT),
+    "spacy-senter": (_spacy("senter"), SPACY_LIMIT),
+    "spacy-parser": (_spacy("parser"), SPACY_LIMIT),
+}
+
+
+def agreement(spans, reference):
+    """Precision, recall and F1 of the sentence ends in `spans` against `reference`, and exact span overlap."""
+    ends, ref_ends = {e for _, e in spans}, {e for _, e in reference}
+    hits = len(ends & ref_ends)
+    precision = hits / len(ends) if ends else 1.0
+    recall = hits / len(ref_ends) if ref_ends else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    same = len(set(spans) & set(reference)) / max(len(reference), 1)
+    return {"precision": precision, "recall": recall, "f1": f1, "same_spans": same}
+
+
+def run_text(name, text, splitters, reference, repeat=3):
+    """Time every splitter on `text` and compare it with the reference splitter's spans."""
+    rows, spans = [], {}
+    for splitter in splitters:
+        split, limit = SPLITTERS[splitter]
+        row = {"input": name, "chars": len(text), "splitter": splitter}
+        if limit and len(text) > limit:
+            row["skipped"] = f"over the {limit:,} character limit"
+            rows.append(row)
+            continue
+        try:
+            split(text[:1000])          # load the model outside the timed runs
+            times = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                spans[splitter] = split(text)
+                times.append(time.perf_counter() - start)
+        except (ImportError, OSError, LookupError) as e:
+            row["error"] = f"{type(e).__name__}: {e}".splitlines()[0]
+            rows.append(row)
+            continue
+        seconds = min(times)
+        row.update({"sentences": len(spans[splitter]), "seconds": seconds,
+                    "mb_per_s": len(text) / (seconds or 1e-9) / 1e6})
+        rows.append(row)
+    if reference in spans:
+        for row in rows:
+            if row["splitter"] in spans:
+                row.update(agreement(spans[row["splitter"]], spans[reference]))
+    return rows
+
+
+def inputs(sizes=DEFAULT_SIZES, kinds=DEFAULT_KINDS, corpus_dir=DEFAULT_CORPUS_DIR):
+    """(name, text) of the sample inputs, then of the synthetic corpora."""
+    for path in sorted(glob.glob(SAMPLES)):
+        with open(path, "r", encoding="utf-8") as f:
+            yield os.path.basename(path), f.read()
+    for size in sorted(parse_size(s) for s in sizes):
+        for kind in kinds:
+            with open(corpus_path(kind, size, corpus_dir), "r", encoding="utf-8") as f:
+                yield f"{kind}-{format_size(size)}", f.read()
+
+
+def _format_row(row, reference):
+    name = f"{row['input']:22s} {row['splitter']:18s}"
+    if "skipped" in row:
+        return f"{name}  skipped ({row['skipped']})"
+    if "error" in row:
+        return f"{name}  ❌ {row['error']}"
+    line = f"{name} {row['mb_per_s']:9.2f} MB/s {row['sentences']:9d} sentences"
+    if "f1" in row and row["splitter"] != reference:
+        line += (f"   vs {reference}: P {row['precision']:.3f} R {row['recall']:.3f} "
+                 f"F1 {row['f1']:.3f} same {row['same_spans']:.1%}")
+    return line
+
+
+# ------------------------------
+# 🔹 Command line
+# ------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the rule-based sentence splitter with punkt and spaCy.")
+    parser.add_argument("--splitters", nargs="+", default=list(SPLITTERS), choices=list(SPLITTERS))
+    parser.add_argument("--reference", default="punkt", choices=list(SPLITTERS),
+                        help="splitter the others are scored against")
+    parser.add_argument("--kinds", nargs="+", default=list(DEFAULT_KINDS))
+    parser.add_argument("--sizes", nargs="+", default=list(DEFAULT_SIZES), help="e.g. 64KB 1MB")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case (fastest is kept)")
+    parser.add_argument("--corpus-dir", default=DEFAULT_CORPUS_DIR)
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    args = parser.parse_args()
+
+    splitters = list(dict.fromkeys([args.reference] + args.splitters))
+    results = []
+    for name, text in inputs(args.sizes, args.kinds, args.corpus_dir):
+        for row in run_text(name, text, splitters, args.reference, args.repeat):
+            print(_format_row(row, args.reference))
+            results.append(row)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"reference": args.reference, "results": results}, f, indent=2)
+        print(f"Results written to {args.output}")
@@ -0,0 +1,79 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# ------------------------------
+# 🔹 Import-time benchmark
+# ------------------------------
+# Every module is imported in a fresh interpreter, so nothing is shared
+# between measurements. Only the import statement itself is timed, not
+# the interpreter start-up.
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CHUNKS = os.path.dirname(HERE)
+ADV = os.path.join(CHUNKS, "Adv")
+
+MODULES = (
+    "Main", "AllChunksTogether", "Sentence_level_Cunking", "Semantic_Chunking",
+    "SpanChunking", "MetadataChunking", "MetadataChunking_dynamic",
+    "AutoChunkingSelect", "AutoChunkingSelect_Dynamic", "TokenChunking",
+    "TokenChunking_Dynamic", "StreamingChunking", "CorpusChunking", "ChunkSet",
+    "RuleSentences",
+)
+HEAVY = ("nltk", "spacy", "tiktoken", "numpy")
+
+_PROBE = """
+import sys, time, json
+sys.path[:0] = [{adv!r}, {chunks!r}]
+start = time.perf_counter()
+{stmt}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"ms": elapsed * 1000, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def _probe(module):
+    code = _PROBE.format(adv=ADV, chunks=CHUNKS, stmt=f"import {module}", heavy=HEAVY)
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def measure(modules=MODULES, repeat=5):
+    """Best-of-`repeat` import time (ms) and heavy libraries pulled in, per module."""
+    results = {}
+    for module in modules:
+        runs = [_probe(module) for _ in range(repeat)]
+        results[module] = {
+            "import_ms": round(min(r["ms"] for r in runs), 2),
+            "heavy_imports": runs[0]["loaded"],
+        }
+    return results
+
+
+# ------------------------------
+# 🔹 Command line
+# ------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure import time of the chunking modules.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--budget-ms", type=float,
+                        help="fail if any module takes longer than this to import")
+    args = parser.parse_args()
+
+    results = measure(repeat=args.repeat)
+    for module, result in results.items():
+        heavy = ", ".join(result["heavy_imports"]) or "-"
+        print(f"{module:28s} {result['import_ms']:8.2f} ms   heavy: {heavy}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if args.budget_ms is not None:
+        slow = [m for m, r in results.items() if r["import_ms"] > args.budget_ms or r["heavy_imports"]]
+        if slow:
+            print(f"❌ Over the {args.budget_ms} ms budget or importing heavy libraries: {', '.join(slow)}")
+            sys.exit(1)
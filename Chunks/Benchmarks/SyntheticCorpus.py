@@ -0,0 +1,129 @@
+import os
+import random
+
+# ------------------------------
+# 🔹 Synthetic corpora for benchmarks
+# ------------------------------
+# Deterministic (seeded) text of any size in four shapes:
+# - "prose":  sentences and paragraphs of English-like words
+# - "code":   indented, brace-heavy lines with few sentence ends
+# - "blob":   one huge line, no newlines at all
+# - "repeat": the same few paragraphs over and over
+# Large corpora are written to disk block by block, so generating 1 GB
+# never holds more than one block in memory.
+
+KINDS = ("prose", "code", "blob", "repeat")
+
+_WORDS = (
+    "the of and to in is that it for as with was on be by this are from at or an "
+    "data model system text chunk token sentence paragraph language learning "
+    "intelligence machine network research computer science process result value "
+    "large small fast memory index search query document vector embedding "
+    "retrieval pipeline context window overlap split merge boundary offset"
+).split()
+_IDENTS = ("i", "n", "text", "chunks", "start", "end", "size", "buf", "tokens", "result")
+_BLOCK = 1 << 20
+
+
+def parse_size(size):
+    """'1KB', '64kb', '16MB', '1GB' or a plain number of characters -> int."""
+    if isinstance(size, int):
+        return size
+    size = size.strip().upper()
+    for suffix, factor in (("GB", 1 << 30), ("MB", 1 << 20), ("KB", 1 << 10), ("B", 1)):
+        if size.endswith(suffix):
+            return int(float(size[:-len(suffix)]) * factor)
+    return int(size)
+
+
+def format_size(n):
+    for suffix, factor in (("GB", 1 << 30), ("MB", 1 << 20), ("KB", 1 << 10)):
+        if n >= factor and n % factor == 0:
+            return f"{n // factor}{suffix}"
+    return f"{n}B"
+
+
+def _sentence(rng):
+    words = rng.choices(_WORDS, k=rng.randint(6, 24))
+    words[0] = words[0].capitalize()
+    return " ".join(words) + rng.choice(".....?!")
+
+
+def _prose(rng):
+    while True:
+        yield " ".join(_sentence(rng) for _ in range(rng.randint(2, 8))) + "\n\n"
+
+
+def _code(rng):
+    depth = 0
+    while True:
+        roll = rng.random()
+        if roll < 0.15:
+            line = f"def {rng.choice(_WORDS)}_{rng.choice(_IDENTS)}({rng.choice(_IDENTS)}):"
+            depth = 1
+        elif roll < 0.3 and depth < 4:
+            line = f"for {rng.choice(_IDENTS)} in range({rng.randint(1, 999)}):"
+            depth += 1
+        elif roll < 0.35:
+            line = ""
+        else:
+            line = (f"{rng.choice(_IDENTS)} = {rng.choice(_IDENTS)}[{rng.randint(0, 99)}:"
+                    f"{rng.randint(100, 999)}] + {{\"{rng.choice(_WORDS)}\": {rng.randint(0, 9)}}}")
+        yield "    " * depth + line + "\n"
+
+
+def _blob(rng):
+    while True:
+        yield " ".join(rng.choices(_WORDS, k=256)) + " "
+
+
+def _repeat(rng):
+    paragraphs = [next(_prose(rng)) for _ in range(3)]
+    while True:
+        yield from paragraphs
+
+
+_GENERATORS = {"prose": _prose, "code": _code, "blob": _blob, "repeat": _repeat}
+
+
+def iter_text(kind, size, seed=0):
+    """Yield pieces of synthetic text adding up to exactly `size` characters."""
+    if kind not in _GENERATORS:
+        raise ValueError(f"⚠️ Unknown corpus kind: {kind} (use one of {KINDS})")
+    pieces = _GENERATORS[kind](random.Random(seed))
+    remaining = size
+    while remaining > 0:
+        piece = next(pieces)[:remaining]
+        remaining -= len(piece)
+        yield piece
+
+
+def generate_text(kind, size, seed=0):
+    """Synthetic text of `size` characters (all ASCII, so also `size` bytes)."""
+    return "".join(iter_text(kind, parse_size(size), seed))
+
+
+def write_corpus(kind, size, path, seed=0):
+    """Write a synthetic corpus to `path` without holding it all in memory."""
+    size = parse_size(size)
+    with open(path, "w", encoding="utf-8") as f:
+        block, block_len = [], 0
+        for piece in iter_text(kind, size, seed):
+            block.append(piece)
+            block_len += len(piece)
+            if block_len >= _BLOCK:
+                f.write("".join(block))
+                block, block_len = [], 0
+        f.write("".join(block))
+    return path
+
+
+def corpus_path(kind, size, directory, seed=0):
+    """Path of a cached corpus file, generated on first use."""
+    size = parse_size(size)
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{kind}-{format_size(size)}-{seed}.txt")
+    if not os.path.exists(path) or os.path.getsize(path) != size:
+        write_corpus(kind, size, path + ".tmp", seed)
+        os.replace(path + ".tmp", path)
+    return path
@@ -1,58 +1,116 @@
 # main.py
-from word_chunking import word_chunking 
-from Sliding_Window_Chunking import sliding_window_chunking
-from Sentence_level_Cunking import sentence_chunking
-from Semantic_Chunking import semantic_chunking
-from Recursive_Chunking import recursive_chunking
-from Paragraph_level_chunking import paragraph_chunking
-from Fixed_size_chunking import fixed_size_chunking
-from Print_Chunks import Print_After_chunking
-
-def read_file():
-    """Ask for a file path and read its content."""
-    #file_path = input("Enter the full path of your .txt file: ").strip()
-    file_path = "F:\My_Afterwork_Projects\Technology\MyProjects\Python\GenAi\Chunks\TempFiles\InputFile\SampleInput_1.txt"
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+ADV = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Adv")
+sys.path.insert(0, ADV)
+
+from CorpusChunking import STRATEGIES, chunk_corpus, print_report  # noqa: E402
+
+# ------------------------------
+# 🔹 Batch chunking from the command line
+# ------------------------------
+#   python Main.py docs/ "notes/**/*.md" --strategy token --param chunk_size=200 \
+#       --jobs 8 --output chunks.parquet --stats
+#
+# Inputs are files, directories (searched recursively for --pattern) or
+# glob patterns. Chunks are streamed to --output as JSONL, Arrow or
+# Parquet (picked from the extension, or --format); without --output
+# JSONL goes to stdout, so the command can be piped. Nothing is asked
+# interactively: any problem ends the run with a non-zero exit code.
+
+
+def parse_param(item):
+    """'key=value' -> (key, value); the value is read as JSON when it can be (numbers, true, ...)."""
+    key, sep, value = item.partition("=")
+    if not sep or not key:
+        raise argparse.ArgumentTypeError(f"expected key=value, got {item!r}")
+    try:
+        return key, json.loads(value)
+    except ValueError:
+        return key, value
+
+
+def expand_inputs(inputs, pattern="*.txt"):
+    """Files named by `inputs` (files, directories or globs), sorted and without repeats."""
+    paths, missing = [], []
+    for item in inputs:
+        if os.path.isdir(item):
+            found = glob.glob(os.path.join(glob.escape(item), "**", pattern), recursive=True)
+        elif os.path.isfile(item):
+            found = [item]
+        else:
+            found = glob.glob(item, recursive=True)
+            if not found:
+                missing.append(item)
+        paths.extend(sorted(p for p in found if os.path.isfile(p)))
+    if missing:
+        raise FileNotFoundError(f"❌ No files match: {', '.join(missing)}")
+    return list(dict.fromkeys(paths))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Chunk files or whole directories without any prompts.")
+    parser.add_argument("inputs", nargs="+", help="files, directories or glob patterns")
+    parser.add_argument("-s", "--strategy", default="paragraph", choices=STRATEGIES)
+    parser.add_argument("-p", "--param", action="append", default=[], type=parse_param, metavar="KEY=VALUE",
+                        help="strategy parameter, e.g. chunk_size=200 (repeatable)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (1 runs in this process)")
+    parser.add_argument("-o", "--output", help="output file (default: JSONL on stdout)")
+    parser.add_argument("-f", "--format", choices=("jsonl", "arrow", "parquet"),
+                        help="output format (default: from the --output extension)")
+    parser.add_argument("--no-text", action="store_true", help="write offsets and token counts only")
+    parser.add_argument("--pattern", default="*.txt", help="file pattern searched for in directories")
+    parser.add_argument("--cache", help="ChunkCache database to reuse earlier results from")
+    parser.add_argument("--stats", action="store_true", help="print throughput and timing to stderr")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    from ChunkExport import JsonlWriter, open_writer
+
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            text = file.read()
-        print("\nFile loaded successfully!\n")
-        return text
-    except FileNotFoundError:
-        print("File not found. Please try again.")
-        return None
-
-def main():
-    text = None
-    while text is None:
-        text = read_file()
-
-    # Mapping menu numbers to functions
-    functions = {
-        "1": word_chunking,
-        "2": sliding_window_chunking,
-        "3": sentence_chunking,
-        "4": semantic_chunking,
-        "5": recursive_chunking,
-        "6": paragraph_chunking,
-        "7": fixed_size_chunking,
-    }
-
-    while True:
-        print("\nChoose a Type of Chunking:")
-        print("1. Word-level chunking (Fixed number of words per chunk) \n2. Sliding Window Chunking (Overlap between chunks) \n3. Sentence-level chunking \n4. Semantic Chunking (Split based on meaning) \n5. Recursive Chunking (Hierarchical)")
-        print("6. Paragraph-level chunking \n7. Fixed-size chunking (Character-based) ")
-        print("Type 'exit' to quit.")
-        
-        choice = input("Enter your choice: ").strip()
-
-        if choice.lower() == "exit":
-            print("Exiting program...")
-            break
-        elif choice in functions:
-            chunks = functions[choice](text)
-            Print_After_chunking(chunks)
+        paths = expand_inputs(args.inputs, args.pattern)
+        if args.output:
+            writer = open_writer(args.output, args.format, not args.no_text)
+        elif args.format in (None, "jsonl"):
+            writer = JsonlWriter(sys.stdout, not args.no_text)
         else:
-            print("Invalid choice! Try again.")
+            raise ValueError(f"⚠️ {args.format} output needs --output")
+    except (OSError, ImportError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    report = {}
+    write_seconds = 0.0
+    try:
+        with writer:
+            for doc_id, chunks in chunk_corpus([Path(p) for p in paths], args.strategy, dict(args.param), args.jobs,
+                                               compact=True, report=report, cache=args.cache):
+                start = time.perf_counter()
+                writer.write(doc_id, chunks)
+                write_seconds += time.perf_counter() - start
+    except BrokenPipeError:
+        # stdout was closed early (e.g. piped into head); stop quietly
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    except Exception as e:
+        print(f"❌ Chunking failed: {type(e).__name__}: {e}", file=sys.stderr)
+        return 1
+
+    if args.stats:
+        print_report(report, file=sys.stderr)
+        size = f", {os.path.getsize(args.output) / 1e6:.2f} MB" if args.output else ""
+        print(f"  output: {writer.rows} rows, {write_seconds:.2f}s writing{size}", file=sys.stderr)
+    return 0
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,15 +1,15 @@
 from Paragraph_level_chunking import paragraph_chunking
-from Fixed_size_chunking import fixed_size_chunking
 
-def recursive_chunking(text):
-    max_chars=60
+def recursive_chunking(text, max_chars=60):
     paragraphs = paragraph_chunking(text)
     chunks = []
     for para in paragraphs:
         if len(para) <= max_chars:
             chunks.append(para)
         else:
-            chunks.extend(fixed_size_chunking(para))
+            # same cuts as TextChunker.recursive_chunking; the separator
+            # cascade is TextChunker.hierarchical_chunking
+            chunks.extend(para[i:i+max_chars] for i in range(0, len(para), max_chars))
     return chunks
 
 # chunks = recursive_chunking(sample_text, max_chars=60)
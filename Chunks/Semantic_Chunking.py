@@ -1,11 +1,21 @@
-import spacy
-nlp = spacy.load("en_core_web_sm")
+import os
+import sys
+
+# Shared spaCy pipelines live in the Adv folder
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "Adv"))
+from SpanChunking import sentence_nlp
 
 def semantic_chunking(text):
-    doc = nlp(text)
+    # Parser-only pipeline: same sentences as the full model, loaded once
+    doc = sentence_nlp()(text)
     chunks = [sent.text.strip() for sent in doc.sents]
     return chunks
 
+def semantic_chunking_batch(texts, batch_size=64, n_process=1, pipeline="parser"):
+    # Many documents through nlp.pipe; pipeline can be "parser", "senter" or "sentencizer"
+    for doc in sentence_nlp(pipeline).pipe(texts, batch_size=batch_size, n_process=n_process):
+        yield [sent.text.strip() for sent in doc.sents]
+
 # chunks = semantic_chunking(sample_text)
 # for i, c in enumerate(chunks):
 #     print(f"Chunk {i+1}:", c)
@@ -1,18 +1,11 @@
-import nltk
-
-# Make sure both punkt and punkt_tab are downloaded
-try:
-    nltk.data.find("tokenizers/punkt")
-except LookupError:
-    nltk.download("punkt")
-
-try:
-    nltk.data.find("tokenizers/punkt_tab")
-except LookupError:
-    nltk.download("punkt_tab")
-
 def sentence_chunking(text):
-    sentences = nltk.sent_tokenize(text)
+    # nltk is imported on first use so importing this module stays fast
+    import nltk
+    try:
+        sentences = nltk.sent_tokenize(text)
+    except LookupError:
+        # Never download from here, just say what is missing
+        raise LookupError("NLTK punkt data missing. Run: python -m nltk.downloader punkt punkt_tab")
     return sentences
 
 # chunks = sentence_chunking(sample_text)
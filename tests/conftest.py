@@ -0,0 +1,75 @@
+import itertools
+import os
+import sys
+
+import pytest
+
+# The chunkers import each other by flat module name
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Chunks")
+sys.path[:0] = [os.path.join(ROOT, "Adv"), ROOT]
+
+
+# ------------------------------
+# 🔹 Offline model stand-ins
+# ------------------------------
+# The real tiktoken ranks and punkt parameters are downloaded on first use.
+# The tests swap in a small byte-level BPE (every byte is a token, plus some
+# common pairs, so multibyte characters still split across tokens) and an
+# untrained punkt tokenizer. Chunk invariants don't depend on the vocabulary.
+def _offline_encoder():
+    import tiktoken
+    ranks = {bytes([i]): i for i in range(256)}
+    for a, b in itertools.product("etaoinshrdlu ", repeat=2):
+        ranks[(a + b).encode()] = len(ranks)
+    pat = r"""'(?i:[sdmt]|ll|ve|re)|[^\r\n\p{L}\p{N}]?+\p{L}+|\p{N}{1,3}| ?[^\s\p{L}\p{N}]++[\r\n]*|\s*[\r\n]|\s+(?!\S)|\s+"""
+    return tiktoken.Encoding(name="offline", pat_str=pat, mergeable_ranks=ranks, special_tokens={})
+
+
+def _install_offline_models():
+    import tiktoken
+    from nltk.tokenize import punkt
+
+    encoder = _offline_encoder()
+    tiktoken.encoding_for_model = lambda model: encoder
+    tiktoken.get_encoding = lambda name: encoder
+
+    params = punkt.PunktParameters()
+    params.abbrev_types.update({"mr", "mrs", "dr", "e.g", "i.e", "etc", "vs"})
+
+    class OfflinePunkt(punkt.PunktSentenceTokenizer):
+        def __init__(self, lang="english"):
+            super().__init__()
+            self._params = params
+
+    punkt.PunktTokenizer = OfflinePunkt
+
+
+_install_offline_models()
+
+SAMPLE_PATH = os.path.join(ROOT, "TempFiles", "InputFile", "SampleInput_1.txt")
+
+
+@pytest.fixture(scope="session")
+def sample():
+    with open(SAMPLE_PATH, encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.fixture(scope="session")
+def texts(sample):
+    """Plain, multibyte, emoji, whitespace-heavy and degenerate inputs."""
+    return [
+        sample,
+        "héllo wörld ünïcode 日本語 テキスト. Next one. Dr. Smith left.\n" * 40,
+        "🙂🙂🙂 ok. 東京 über naïve 🚀\n\n" * 30,
+        "  a  b\n\n c d e f g h i j k\r\n\tl m.\n" * 50,
+        "x" * 1000,
+        " ".join(["verylongword"] * 300) + ". Short one. " + sample[:500],
+        "",
+    ]
+
+
+@pytest.fixture(scope="session")
+def encoder():
+    from ModelRegistry import get_encoder
+    return get_encoder()
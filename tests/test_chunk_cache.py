@@ -0,0 +1,56 @@
+import pytest
+
+from ChunkCache import ChunkCache, cache_key, pack, unpack
+from SpanChunking import SpanChunker
+
+CALLS = [
+    ("word", {"chunk_size": 5}),
+    ("sentence", {}),
+    ("paragraph", {}),
+    ("sliding_window", {"window_size": 50, "overlap": 10}),
+    ("token", {"chunk_size": 20}),
+    ("packed", {"max_tokens": 40}),
+]
+
+
+@pytest.mark.parametrize("strategy, params", CALLS)
+def test_pack_round_trips(texts, strategy, params):
+    for text in texts:
+        chunks = getattr(SpanChunker(text, compact=True), f"{strategy}_chunking")(**params)
+        assert unpack(pack(chunks), text).to_dicts() == chunks.to_dicts()
+
+
+@pytest.mark.parametrize("strategy, params", CALLS)
+def test_cache_round_trips(tmp_path, texts, strategy, params):
+    cache = ChunkCache(str(tmp_path / "chunks.db"))
+    try:
+        for text in texts:
+            expected = getattr(SpanChunker(text), f"{strategy}_chunking")(**params)
+            assert cache.chunk(text, strategy, params) == expected
+            hits = cache.hits
+            assert cache.chunk(text, strategy, params) == expected
+            assert cache.hits == hits + 1
+            assert cache.chunk(text, strategy, params, compact=True).to_dicts() == expected
+    finally:
+        cache.close()
+
+
+def test_cache_survives_reopening(tmp_path, sample):
+    path = str(tmp_path / "chunks.db")
+    cache = ChunkCache(path)
+    expected = cache.chunk(sample, "sentence")
+    cache.close()
+    cache = ChunkCache(path)
+    try:
+        assert cache.chunk(sample, "sentence") == expected
+        assert cache.hits == 1 and cache.misses == 0
+    finally:
+        cache.close()
+
+
+def test_cache_key_depends_on_text_strategy_and_params(sample):
+    key = cache_key(sample, "fixed_size", {"chunk_size": 50})
+    assert key == cache_key(sample, "fixed_size", {"chunk_size": 50})
+    assert key != cache_key(sample + " ", "fixed_size", {"chunk_size": 50})
+    assert key != cache_key(sample, "sliding_window", {"chunk_size": 50})
+    assert key != cache_key(sample, "fixed_size", {"chunk_size": 51})
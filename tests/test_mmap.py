@@ -0,0 +1,38 @@
+import random
+
+import pytest
+
+from MmapChunking import iter_mmap_chunking
+from SpanChunking import SpanChunker
+
+CALLS = [
+    ("fixed_size", {"chunk_size": 7}),
+    ("sliding_window", {"window_size": 30, "overlap": 12}),
+    ("word", {"chunk_size": 5}),
+    ("paragraph", {}),
+]
+
+
+def _random_text(seed, n=2000):
+    rng = random.Random(seed)
+    pieces = ["word", "héllo", "日本語", "🎉", "tab\there", "end.", " ", "\n", "\n\n", "\r\n", "\xa0", "　"]
+    return "".join(rng.choice(pieces) + rng.choice([" ", "", "\n"]) for _ in range(n))
+
+
+@pytest.mark.parametrize("strategy, params", CALLS)
+@pytest.mark.parametrize("workers, range_bytes", [(1, 1 << 20), (1, 64), (2, 97)])
+def test_mmap_equals_span_chunker(tmp_path, texts, strategy, params, workers, range_bytes):
+    path = tmp_path / "input.txt"
+    for text in texts + [_random_text(1), _random_text(2)]:
+        # newline="" keeps \r\n, so the file holds exactly `text`
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        got = list(iter_mmap_chunking(str(path), strategy, params, workers=workers, range_bytes=range_bytes))
+        assert got == getattr(SpanChunker(text), f"{strategy}_chunking")(**params)
+
+
+def test_mmap_rejects_unknown_strategy(tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("text", encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(iter_mmap_chunking(str(path), "semantic"))
@@ -0,0 +1,32 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from ParallelSentences import parallel_sentence_spans, sentence_seams
+from SpanChunking import sentence_spans
+
+
+@pytest.fixture(scope="module")
+def long_texts(texts):
+    return [text * 5 for text in texts]
+
+
+@pytest.mark.parametrize("min_piece_chars", [20, 200, 5000])
+def test_parallel_punkt_equals_serial(long_texts, min_piece_chars):
+    with ThreadPoolExecutor(4) as pool:
+        for text in long_texts:
+            got = parallel_sentence_spans(text, workers=4, min_piece_chars=min_piece_chars, executor=pool)
+            assert got == sentence_spans(text)
+
+
+def test_parallel_punkt_on_processes(sample):
+    text = sample * 20
+    assert parallel_sentence_spans(text, workers=2, min_piece_chars=100) == sentence_spans(text)
+
+
+def test_seams_are_sentence_starts(long_texts):
+    for text in long_texts:
+        starts = {s for s, _ in sentence_spans(text)}
+        seams = sentence_seams(text, 16, min_piece_chars=50)
+        assert seams == sorted(seams)
+        assert all(seam in starts for seam in seams)
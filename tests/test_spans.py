@@ -0,0 +1,93 @@
+import pytest
+
+from SpanChunking import SpanChunker, token_spans
+
+CALLS = [
+    ("sentence", {}),
+    ("paragraph", {}),
+    ("fixed_size", {"chunk_size": 7}),
+    ("sliding_window", {"window_size": 30, "overlap": 12}),
+    ("recursive", {"max_chars": 60}),
+    ("token", {"chunk_size": 20}),
+    ("packed", {"max_tokens": 40, "overlap": 1}),
+    ("hierarchical", {"max_size": 80}),
+    ("hierarchical", {"max_size": 30, "unit": "tokens"}),
+]
+
+
+@pytest.mark.parametrize("strategy, params", CALLS)
+def test_spans_slice_the_source(texts, strategy, params):
+    for text in texts:
+        for c in getattr(SpanChunker(text), f"{strategy}_chunking")(**params):
+            assert text[c["start_index"]:c["end_index"]] == c["chunk_text"]
+
+
+def test_word_chunks_cover_their_words(texts):
+    for text in texts:
+        for c in SpanChunker(text).word_chunking(5):
+            assert " ".join(text[c["start_index"]:c["end_index"]].split()) == c["chunk_text"]
+
+
+def test_compact_chunks_match_dicts(texts):
+    for text in texts:
+        for strategy, params in CALLS:
+            chunks = getattr(SpanChunker(text, compact=True), f"{strategy}_chunking")(**params)
+            assert chunks.to_dicts() == getattr(SpanChunker(text), f"{strategy}_chunking")(**params)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 50])
+def test_token_spans_are_exact_and_within_budget(texts, encoder, chunk_size):
+    for text in texts:
+        spans = token_spans(text, chunk_size)
+        assert "".join(text[s:e] for s, e, _ in spans) == text
+        assert sum(n for _, _, n in spans) == len(encoder.encode(text))
+        for s, e, n in spans:
+            # only a single character can be wider than the budget
+            assert 1 <= n <= chunk_size or e - s == 1
+
+
+@pytest.mark.parametrize("max_tokens", [5, 13, 40, 200])
+@pytest.mark.parametrize("overlap", [0, 1])
+def test_packed_chunks_are_exact_and_within_budget(texts, encoder, max_tokens, overlap):
+    for text in texts:
+        for c in SpanChunker(text).packed_chunking(max_tokens, overlap):
+            n = len(encoder.encode(c["chunk_text"]))
+            assert c["token_count"] == n
+            assert n <= max_tokens or len(c["chunk_text"]) == 1
+
+
+def test_packed_chunks_end_on_sentences(sample, encoder):
+    chunker = SpanChunker(sample)
+    sentences = chunker.sentence_chunking()
+    ends = {c["end_index"] for c in sentences}
+    # a budget every sentence fits in, so none has to be cut
+    budget = max(len(encoder.encode(c["chunk_text"])) for c in sentences) + 1
+    chunks = chunker.packed_chunking(budget)
+    assert len(chunks) < len(sentences)
+    assert all(c["end_index"] in ends for c in chunks)
+
+
+@pytest.mark.parametrize("max_size", [1, 2, 5, 24, 300])
+def test_hierarchical_tokens_are_exact_and_never_empty(texts, encoder, max_size):
+    for text in texts:
+        for c in SpanChunker(text).hierarchical_chunking(max_size, unit="tokens"):
+            n = len(encoder.encode(c["chunk_text"]))
+            assert c["chunk_text"].strip()
+            assert c["token_count"] == n
+            assert n <= max_size or len(c["chunk_text"]) == 1
+
+
+@pytest.mark.parametrize("max_size", [1, 7, 60, 500])
+def test_hierarchical_chars_within_budget(texts, max_size):
+    for text in texts:
+        for c in SpanChunker(text).hierarchical_chunking(max_size):
+            assert 0 < len(c["chunk_text"]) <= max_size
+            assert c["chunk_text"].strip()
+
+
+def test_recursive_function_matches_chunker(texts):
+    from Recursive_Chunking import recursive_chunking
+    for text in texts:
+        for max_chars in (10, 60):
+            chunks = SpanChunker(text).recursive_chunking(max_chars)
+            assert recursive_chunking(text, max_chars) == [c["chunk_text"] for c in chunks]
@@ -0,0 +1,32 @@
+import io
+
+import pytest
+
+import StreamingChunking
+from SpanChunking import SpanChunker
+
+CALLS = [
+    ("word", {"chunk_size": 5}),
+    ("sentence", {}),
+    ("paragraph", {}),
+    ("fixed_size", {"chunk_size": 50}),
+    ("sliding_window", {"window_size": 50, "overlap": 10}),
+    ("recursive", {"max_chars": 60}),
+    ("token", {"chunk_size": 20}),
+]
+
+
+@pytest.mark.parametrize("strategy, params", CALLS)
+@pytest.mark.parametrize("block_size", [7, 64, 1 << 16])
+def test_streaming_equals_in_memory(texts, strategy, params, block_size):
+    stream = getattr(StreamingChunking, f"iter_{strategy}_chunking")
+    for text in texts:
+        got = list(stream(io.StringIO(text), **params, block_size=block_size))
+        assert got == getattr(SpanChunker(text), f"{strategy}_chunking")(**params)
+
+
+def test_streaming_reads_files(tmp_path, sample):
+    path = tmp_path / "input.txt"
+    path.write_text(sample, encoding="utf-8")
+    got = list(StreamingChunking.iter_paragraph_chunking(str(path), block_size=100))
+    assert got == SpanChunker(sample).paragraph_chunking()